@@ -1,122 +1,230 @@
 # app/api/routes/admin_reservation.py
+import codecs
 from datetime import datetime, timedelta
 from typing import List, Optional
-from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy import func
-from sqlalchemy.sql import func
-from sqlalchemy.orm import Session
-from app.models.exam_schedule import ExamSchedule
-from app.models.reservation import Reservation
-from app.schemas.reservation_schema import ReservationGroupOut, ReservationUpdateAdmin
-from app.database.dependencies import get_db
+from fastapi import APIRouter, Depends, File, HTTPException, Query, UploadFile
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.schemas.reservation_schema import (
+    ReservationBatchConfirm,
+    ReservationBatchConfirmOut,
+    ReservationGroupPage,
+    ReservationImportOut,
+    ReservationUpdateAdmin,
+)
+from app.database.dependencies import get_db, get_read_db
+from app.core.config import settings
+from app.core.exceptions import ReservationImportError
 from app.core.security import get_current_admin_user  # 관리자 권한 검증
+from app.services.capacity import load_confirmed_counts, lock_confirmed_counts, exceeds_capacity, apply_confirmed_deltas
+from app.services.confirmation import confirm_groups
+from app.services.exam_schedule import add_to_exam_schedules, subtract_from_exam_schedules
+from app.services.reservation_groups import (
+    GroupFilters,
+    fetch_group_reservations,
+    fetch_group_summary_page,
+    find_group_ids,
+)
+from app.services.reservation_export import EXPORTERS, EXPORT_MEDIA_TYPES
+from app.services.reservation_import import import_reservations
+from app.services.reservation_json import admin_group_page_response
+from app.services.reservation_store import (
+    check_group_version,
+    delete_group,
+    group_version,
+    load_group,
+    mark_confirmed,
+    replace_group,
+)
 from fastapi import APIRouter, Depends, HTTPException
 
 
 router = APIRouter(prefix="/admin/reservations", tags=["admin_reservations"])
 
-@router.get("/", response_model=List[ReservationGroupOut])
-async def get_admin_reservations(
-    user_id: Optional[int] = Query(None, description="특정 사용자 ID로 필터링"),
-    reservation_group_id: Optional[int] = Query(None, description="특정 예약 그룹 ID로 필터링"),
-    start_date: Optional[str] = Query(None, description="조회 시작 날짜 (YYYY-MM-DD)"),
-    end_date: Optional[str] = Query(None, description="조회 종료 날짜 (YYYY-MM-DD)"),
-    is_confirmed: Optional[bool] = Query(None, description="확정 여부 필터"),
-    past: Optional[bool] = Query(None, description="과거 예약 여부 필터"),
-    db: Session = Depends(get_db),
-    current_admin=Depends(get_current_admin_user),  # 관리자 권한 검증
-):
+def build_admin_filters(
+    user_id: Optional[int],
+    reservation_group_id: Optional[int],
+    start_date: Optional[str],
+    end_date: Optional[str],
+    is_confirmed: Optional[bool],
+    past: Optional[bool],
+) -> GroupFilters:
     """
-    관리자 예약 조회 API (reservation_group_id 적용)
+    관리자 예약 조회/내보내기 공통 필터 생성
     """
-    query = db.query(Reservation)
-
-    # 특정 사용자 ID 필터링
-    if user_id:
-        query = query.filter(Reservation.user_id == user_id)
-
-    # 특정 예약 그룹 ID 필터링
-    if reservation_group_id:
-        query = query.filter(Reservation.reservation_group_id == reservation_group_id)
+    filters = GroupFilters(user_id=user_id, reservation_group_id=reservation_group_id, is_confirmed=is_confirmed)
 
     # 날짜 필터링
     if start_date:
         try:
-            start_date_parsed = datetime.strptime(start_date, "%Y-%m-%d").date()
-            query = query.filter(Reservation.date >= start_date_parsed)
+            filters.restrict_dates(date_from=datetime.strptime(start_date, "%Y-%m-%d").date())
         except ValueError:
             raise HTTPException(status_code=400, detail="잘못된 날짜 형식입니다. YYYY-MM-DD 형식으로 입력해주세요.")
 
     if end_date:
         try:
-            end_date_parsed = datetime.strptime(end_date, "%Y-%m-%d").date()
-            query = query.filter(Reservation.date <= end_date_parsed)
+            filters.restrict_dates(date_to=datetime.strptime(end_date, "%Y-%m-%d").date())
         except ValueError:
             raise HTTPException(status_code=400, detail="잘못된 날짜 형식입니다. YYYY-MM-DD 형식으로 입력해주세요.")
 
-    # 확정 여부 필터링
-    if is_confirmed is not None:
-        query = query.filter(Reservation.is_confirmed == is_confirmed)
-
     # 과거 예약 필터링
     if past is not None:
         now = datetime.utcnow().date()
         if past:
-            query = query.filter(Reservation.date < now)
+            filters.restrict_dates(date_to=now - timedelta(days=1))
         else:
-            query = query.filter(Reservation.date >= now)
+            filters.restrict_dates(date_from=now)
 
-    # `reservation_group_id`를 기준으로 그룹화하여 응답 데이터 구성
-    reservations = query.order_by(Reservation.reservation_group_id, Reservation.date).all()
+    return filters
+
+
+@router.get("/", response_model=ReservationGroupPage)
+async def get_admin_reservations(
+    user_id: Optional[int] = Query(None, description="특정 사용자 ID로 필터링"),
+    reservation_group_id: Optional[int] = Query(None, description="특정 예약 그룹 ID로 필터링"),
+    start_date: Optional[str] = Query(None, description="조회 시작 날짜 (YYYY-MM-DD)"),
+    end_date: Optional[str] = Query(None, description="조회 종료 날짜 (YYYY-MM-DD)"),
+    is_confirmed: Optional[bool] = Query(None, description="확정 여부 필터"),
+    past: Optional[bool] = Query(None, description="과거 예약 여부 필터"),
+    include_reservations: bool = Query(False, description="일자별 예약 상세 포함 여부"),
+    cursor: Optional[str] = Query(None, description="이전 응답의 next_cursor"),
+    limit: int = Query(50, ge=1, le=500, description="페이지당 예약 그룹 수"),
+    db: AsyncSession = Depends(get_read_db),
+    current_admin=Depends(get_current_admin_user),  # 관리자 권한 검증
+):
+    """
+    관리자 예약 조회 API (reservation_group_id 적용)
+    - reservation_group_id 기준 키셋 페이지네이션 (한 그룹은 한 페이지에만 포함)
+    - 그룹 요약(시작/종료 날짜, 시간, 확정 여부)은 DB에서 GROUP BY로 집계
+    - 일자별 예약 상세는 include_reservations=true 인 경우에만 조회
+    - 응답은 Pydantic 모델을 거치지 않고 orjson으로 바로 직렬화
+    - 읽기 전용 복제본에서 조회 (X-Read-Your-Writes: true 헤더를 보내면 primary에서 조회)
+    """
+    filters = build_admin_filters(user_id, reservation_group_id, start_date, end_date, is_confirmed, past)
+
+    # `reservation_group_id`별 요약 조회 (현재 페이지의 그룹만)
+    summaries, next_cursor = await fetch_group_summary_page(db, filters, cursor, limit)
+
+    # 요청한 경우에만 일자별 예약 상세 조회
+    details = {}
+    if include_reservations:
+        details = await fetch_group_reservations(db, filters, [row.reservation_group_id for row in summaries])
+
+    # response_model 검증 없이 바로 JSON으로 직렬화 (스키마는 ReservationGroupPage와 동일)
+    return admin_group_page_response(summaries, details, next_cursor, include_reservations)
+
+@router.get("/export")
+async def export_admin_reservations(
+    format: str = Query("csv", pattern="^(csv|ndjson)$", description="내보내기 형식 (csv / ndjson)"),
+    user_id: Optional[int] = Query(None, description="특정 사용자 ID로 필터링"),
+    reservation_group_id: Optional[int] = Query(None, description="특정 예약 그룹 ID로 필터링"),
+    start_date: Optional[str] = Query(None, description="조회 시작 날짜 (YYYY-MM-DD)"),
+    end_date: Optional[str] = Query(None, description="조회 종료 날짜 (YYYY-MM-DD)"),
+    is_confirmed: Optional[bool] = Query(None, description="확정 여부 필터"),
+    past: Optional[bool] = Query(None, description="과거 예약 여부 필터"),
+    db: AsyncSession = Depends(get_db),
+    current_admin=Depends(get_current_admin_user),  # 관리자 권한 검증
+):
+    """
+    관리자 예약 내보내기 API (일자별 예약 전체를 CSV / NDJSON으로 스트리밍)
+    - 관리자 예약 조회 API와 같은 필터 사용
+    - DB 서버 측 커서에서 EXPORT_BATCH_SIZE개씩 읽어 바로 전송하므로 행 수와 관계없이 메모리 사용량이 일정
+    """
+    filters = build_admin_filters(user_id, reservation_group_id, start_date, end_date, is_confirmed, past)
+
+    return StreamingResponse(
+        EXPORTERS[format](db, filters, settings.EXPORT_BATCH_SIZE),
+        media_type=EXPORT_MEDIA_TYPES[format],
+        headers={"Content-Disposition": 'attachment; filename="reservations.{}"'.format(format)},
+    )
+
+@router.post("/import", response_model=ReservationImportOut)
+async def import_admin_reservations(
+    file: UploadFile = File(..., description="예약 그룹 CSV (user_id,start_date,start_hour,end_date,end_hour,reserved_count,is_confirmed)"),
+    db: AsyncSession = Depends(get_db),
+    current_admin=Depends(get_current_admin_user),  # 관리자 권한 검증
+):
+    """
+    관리자 예약 일괄 가져오기 API (CSV 한 행 = 예약 그룹 하나)
+    - CSV를 한 행씩 검증하면서 COPY로 임시 스테이징 테이블에 적재
+    - 사용자 존재 여부 / 시간별 최대 수용 인원 검증과 `exam_schedules`, 예약 반영을 집합 단위 쿼리로 처리
+    - 오류가 하나라도 있으면 아무것도 반영하지 않고 행 번호별 오류 목록을 반환
+    """
+    try:
+        result = await import_reservations(
+            db, codecs.iterdecode(file.file, "utf-8-sig"), settings.IMPORT_BATCH_SIZE
+        )
+        await db.commit()
+    except ReservationImportError:
+        await db.rollback()
+        raise
+    except UnicodeDecodeError:
+        await db.rollback()
+        raise HTTPException(status_code=400, detail="CSV 파일은 UTF-8로 인코딩되어야 합니다.")
+    except Exception as e:
+        await db.rollback()
+        raise HTTPException(status_code=500, detail=f"예약 가져오기 중 오류 발생: {str(e)}")
+
+    return result
+
+@router.post("/confirm", response_model=ReservationBatchConfirmOut)
+async def confirm_reservations_batch(
+    batch: ReservationBatchConfirm,
+    db: AsyncSession = Depends(get_db),
+    current_admin=Depends(get_current_admin_user),
+):
+    """
+    관리자 예약 일괄 확정 API
+    - reservation_group_ids 목록 또는 필터(start_date, end_date, user_id)로 확정할 그룹 지정
+    - 인원 초과 검증과 `exam_schedules` 반영을 그룹별이 아닌 집합 단위 쿼리로 처리
+    - 그룹 ID 순서로 확정하며, 그룹별 성공/실패 결과를 한 번에 반환
+    """
+    if batch.reservation_group_ids is not None:
+        group_ids = batch.reservation_group_ids[: batch.limit]
+    else:
+        filters = GroupFilters(
+            user_id=batch.user_id, date_from=batch.start_date, date_to=batch.end_date, is_confirmed=False
+        )
+        group_ids = await find_group_ids(db, filters, batch.limit)
+
+    try:
+        results = await confirm_groups(db, group_ids, now=datetime.utcnow())
+        await db.commit()
+    except Exception as e:
+        await db.rollback()
+        raise HTTPException(status_code=500, detail=f"예약 일괄 확정 중 오류 발생: {str(e)}")
+
+    confirmed_count = sum(1 for result in results if result["success"])
+    return {
+        "confirmed_count": confirmed_count,
+        "failed_count": len(results) - confirmed_count,
+        "results": results,
+    }
 
-    # 응답 데이터 그룹화
-    grouped_reservations = {}
-    for res in reservations:
-        if res.reservation_group_id not in grouped_reservations:
-            grouped_reservations[res.reservation_group_id] = {
-                "reservation_group_id": res.reservation_group_id,
-                "user_id": res.user_id,
-                "start_date": res.date,
-                "end_date": res.date,  # 마지막 날짜 업데이트 예정
-                "start_hour": res.start_hour,
-                "end_hour": res.end_hour,
-                "reserved_count": res.reserved_count,
-                "is_confirmed": res.is_confirmed,
-                "reservations": []
-            }
-        grouped_reservations[res.reservation_group_id]["end_date"] = res.date  # 마지막 날짜 업데이트
-        grouped_reservations[res.reservation_group_id]["reservations"].append(res)
-
-    # Pydantic 모델로 변환
-    response_data = [
-        ReservationGroupOut(**grouped_reservations[group_id]) for group_id in grouped_reservations
-    ]
-
-    return response_data
 
 @router.post("/confirm/{reservation_group_id}")
 async def confirm_reservation(
     reservation_group_id: int,
-    db: Session = Depends(get_db),
+    version: Optional[int] = Query(None, description="조회한 예약 그룹 버전 (다르면 409)"),
+    db: AsyncSession = Depends(get_db),
     current_admin=Depends(get_current_admin_user),
 ):
     """
     관리자 예약 확정 API: reservation_group_id에 해당하는 예약을 확정하고, exam_schedules에 반영한다.
     - 현재 시간 기준으로 이미 시작된 예약은 확정 불가
+    - version을 지정하면 현재 예약 그룹 버전과 같은지 확인 (다르면 409)
     """
     # 현재 시간 기준으로 확인
     now = datetime.utcnow()
 
-    # 예약 그룹 조회
-    reservations = (
-        db.query(Reservation)
-        .filter(Reservation.reservation_group_id == reservation_group_id, Reservation.is_confirmed == False)
-        .all()
-    )
+    # 예약 그룹 조회 (동시에 같은 그룹을 확정/수정/삭제하지 못하도록 잠금)
+    reservations = await load_group(db, reservation_group_id, unconfirmed_only=True, for_update=True)
     
     if not reservations:
         raise HTTPException(status_code=404, detail="해당 예약 그룹을 찾을 수 없거나 이미 확정된 예약입니다.")
 
+    check_group_version(reservations, version)
+
     # 🚨 시작 시간이 현재 시간을 지난 예약이 있는지 확인
     for res in reservations:
         reservation_start_time = datetime.combine(res.date, datetime.min.time()).replace(hour=res.start_hour)
@@ -128,19 +236,10 @@ async def confirm_reservation(
             )
 
     # 예약 확정 가능 여부 확인 (같은 시간대 예약 50,000명 초과 여부)
+    # - 해당 시간의 장부 행을 잠근 뒤 조회하므로 같은 시간을 동시에 확정하는 요청은 이 트랜잭션이 끝날 때까지 대기
+    confirmed_counts = await lock_confirmed_counts(db, [(res.date, res.start_hour, res.end_hour) for res in reservations])
     for res in reservations:
-        total_reserved = (
-            db.query(func.sum(Reservation.reserved_count))
-            .filter(
-                Reservation.date == res.date,
-                Reservation.start_hour == res.start_hour,
-                Reservation.end_hour == res.end_hour,
-                Reservation.is_confirmed == True,
-            )
-            .scalar() or 0
-        )
-
-        if total_reserved + res.reserved_count > 50000:
+        if exceeds_capacity(confirmed_counts, res.date, res.start_hour, res.end_hour, res.reserved_count):
             raise HTTPException(
                 status_code=400,
                 detail=f"{res.date} {res.start_hour}:00 ~ {res.end_hour}:00 사이의 예약이 인원 초과로 확정 불가",
@@ -148,92 +247,73 @@ async def confirm_reservation(
 
     # 트랜잭션 처리 (예외 발생 시 롤백)
     try:
-        for res in reservations:
-            # `exam_schedules`에 해당 시간대의 일정이 있는지 확인
-            exam_schedule = (
-                db.query(ExamSchedule)
-                .filter(
-                    ExamSchedule.date == res.date,
-                    ExamSchedule.start_hour == res.start_hour,
-                    ExamSchedule.end_hour == res.end_hour,
-                )
-                .first()
-            )
+        slots = [(res.date, res.start_hour, res.end_hour, res.reserved_count) for res in reservations]
 
-            if exam_schedule:
-                # 기존 일정이 있으면 `total_reserved_count` 증가
-                exam_schedule.total_reserved_count += res.reserved_count
-            else:
-                # 새로운 일정 생성
-                exam_schedule = ExamSchedule(
-                    date=res.date,
-                    start_hour=res.start_hour,
-                    end_hour=res.end_hour,
-                    total_reserved_count=res.reserved_count,
-                )
-                db.add(exam_schedule)
-                db.flush()  # 새로 추가된 객체의 ID를 가져오기 위해 flush 수행
+        # `exam_schedules`에 시간대별 인원 반영 (없으면 생성, 있으면 원자적으로 증가)
+        schedule_ids = await add_to_exam_schedules(db, slots)
+
+        # 예약 확정 및 `exam_schedule_id` 업데이트
+        await mark_confirmed(db, reservations, schedule_ids)
 
-            # 예약 확정 및 `exam_schedule_id` 업데이트
-            res.is_confirmed = True
-            res.exam_schedule_id = exam_schedule.id  # `exam_schedule_id` 갱신
+        # 시간별 용량 장부에 확정 인원 반영
+        await apply_confirmed_deltas(db, slots)
 
         # 변경 사항 커밋
-        db.commit()
-        return {"message": "예약 확정 완료", "reservation_group_id": reservation_group_id}
+        await db.commit()
+        return {
+            "message": "예약 확정 완료",
+            "reservation_group_id": reservation_group_id,
+            "version": group_version(reservations) + 1,
+        }
 
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         raise HTTPException(status_code=500, detail=f"예약 확정 중 오류 발생: {str(e)}")
 
 
 @router.delete("/{reservation_group_id}")
 async def delete_admin_reservation(
     reservation_group_id: int,
-    db: Session = Depends(get_db),
+    version: Optional[int] = Query(None, description="조회한 예약 그룹 버전 (다르면 409)"),
+    db: AsyncSession = Depends(get_db),
     current_admin=Depends(get_current_admin_user),
 ):
     """
     관리자 예약 삭제 API
     - 모든 예약을 삭제할 수 있음 (확정된 예약 포함)
     - 확정된 예약 삭제 시 `exam_schedule`의 `total_reserved_count`도 업데이트
+    - version을 지정하면 현재 예약 그룹 버전과 같은지 확인 (다르면 409)
     """
-    reservations = (
-        db.query(Reservation)
-        .filter(Reservation.reservation_group_id == reservation_group_id)
-        .all()
-    )
+    reservations = await load_group(db, reservation_group_id, for_update=True)
 
     if not reservations:
         raise HTTPException(status_code=404, detail="예약을 찾을 수 없습니다.")
 
+    check_group_version(reservations, version)
+
     try:
-        # 연관된 exam_schedule 데이터 확인 및 `total_reserved_count` 감소
-        for res in reservations:
-            if res.is_confirmed and res.exam_schedule_id:
-                exam_schedule = (
-                    db.query(ExamSchedule)
-                    .filter(ExamSchedule.id == res.exam_schedule_id)
-                    .first()
-                )
-                if exam_schedule:
-                    # total_reserved_count에서 해당 예약 인원만큼 감소
-                    exam_schedule.total_reserved_count -= res.reserved_count
+        confirmed_slots = [
+            (res.date, res.start_hour, res.end_hour, res.reserved_count) for res in reservations if res.is_confirmed
+        ]
 
-                    # total_reserved_count가 0이 되면 exam_schedule 삭제
-                    if exam_schedule.total_reserved_count <= 0:
-                        db.delete(exam_schedule)
+        # 확정/수정과 같은 순서(장부 → 시험 일정)로 잠그도록 차감할 시간의 장부 행을 먼저 잠금
+        await lock_confirmed_counts(db, confirmed_slots)
 
         # 예약 데이터 삭제
-        for res in reservations:
-            db.delete(res)
+        await delete_group(db, reservation_group_id)
+
+        # `exam_schedules`의 `total_reserved_count` 감소 (0이 되면 일정 삭제)
+        await subtract_from_exam_schedules(db, confirmed_slots)
+
+        # 시간별 용량 장부에서 확정 인원 차감
+        await apply_confirmed_deltas(db, confirmed_slots, sign=-1)
 
         # 변변경 사항 반영
-        db.commit()
+        await db.commit()
         return {"message": "관리자가 예약을 삭제하였습니다.", "reservation_group_id": reservation_group_id}
 
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         raise HTTPException(status_code=500, detail=f"예약 삭제 중 오류 발생: {str(e)}")
     
 
@@ -241,7 +321,7 @@ async def delete_admin_reservation(
 async def update_admin_reservation(
     reservation_group_id: int,
     updated_reservation: ReservationUpdateAdmin,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_admin=Depends(get_current_admin_user),
 ):
     """
@@ -250,114 +330,112 @@ async def update_admin_reservation(
     - 3일 이내의 예약 수정 불가
     - 변경 후 50,000명 초과 불가
     - 확정된 예약이면 `exam_schedule`도 함께 업데이트
+    - 바뀐 날짜의 예약만 UPDATE/INSERT/DELETE (응답의 rows에 변경된 행 수 반환)
+    - version을 지정하면 현재 예약 그룹 버전과 같은지 확인 (다르면 409)
     """
 
-    reservations = (
-        db.query(Reservation)
-        .filter(Reservation.reservation_group_id == reservation_group_id)
-        .all()
-    )
+    reservations = await load_group(db, reservation_group_id, for_update=True)
 
     if not reservations:
         raise HTTPException(status_code=404, detail="해당 예약을 찾을 수 없습니다.")
 
-    # 기존 예약의 확정 여부
-    was_confirmed = reservations[0].is_confirmed
+    check_group_version(reservations, updated_reservation.version)
+
+    # 기존 예약의 확정 여부, 수정 후 확정 여부 (지정하지 않으면 기존 상태 유지)
+    was_confirmed = bool(reservations[0].is_confirmed)
+    is_confirmed = was_confirmed if updated_reservation.is_confirmed is None else updated_reservation.is_confirmed
     now = datetime.utcnow().date()
 
     # 1️⃣ 3일 이내 예약 수정 불가
     if updated_reservation.start_date < now + timedelta(days=3):
         raise HTTPException(status_code=400, detail="예약 수정은 현재 날짜 기준 3일 이후부터 가능합니다.")
 
+    # 모든 날짜가 같은 시간대(start_hour ~ end_hour)이므로 시간 범위와 날짜 순서 검증
+    if not 0 <= updated_reservation.start_hour < updated_reservation.end_hour <= 24:
+        raise HTTPException(status_code=400, detail="예약 시간 범위가 잘못되었습니다.")
+    if updated_reservation.start_date > updated_reservation.end_date:
+        raise HTTPException(status_code=400, detail="start_date는 end_date보다 앞서야 합니다.")
+
     try:
-        # 2️⃣ 기존 확정 예약을 변경할 경우 `exam_schedule`에서 인원 차감
+        old_slots = [(res.date, res.start_hour, res.end_hour, res.reserved_count) for res in reservations]
+
+        # 확정 인원이 바뀌는 시간(기존 확정 예약 / 새로 확정할 예약)의 장부 행을 한 번에 잠금
+        locked_slots = old_slots if was_confirmed else []
+        if is_confirmed:
+            locked_slots = locked_slots + [
+                (
+                    updated_reservation.start_date + timedelta(days=offset),
+                    updated_reservation.start_hour,
+                    updated_reservation.end_hour,
+                )
+                for offset in range((updated_reservation.end_date - updated_reservation.start_date).days + 1)
+            ]
+        await lock_confirmed_counts(db, locked_slots)
+
+        # 2️⃣ 기존 확정 예약을 변경할 경우 장부에서 인원 차감
         if was_confirmed:
-            for res in reservations:
-                if res.exam_schedule_id:
-                    exam_schedule = db.query(ExamSchedule).filter(
-                        ExamSchedule.id == res.exam_schedule_id
-                    ).first()
-                    if exam_schedule:
-                        exam_schedule.total_reserved_count -= res.reserved_count
-                        if exam_schedule.total_reserved_count <= 0:
-                            db.delete(exam_schedule)
+            await apply_confirmed_deltas(db, old_slots, sign=-1)
 
         # 3️⃣ 새로운 날짜 및 시간의 `exam_schedule` 검증 (50,000명 초과 방지)
-        total_reserved = (
-            db.query(func.sum(Reservation.reserved_count))
-            .filter(
-                Reservation.date == updated_reservation.start_date,
-                Reservation.start_hour == updated_reservation.start_hour,
-                Reservation.end_hour == updated_reservation.end_hour,
-                Reservation.is_confirmed == True,
-            )
-            .scalar()
-            or 0
-        )
-
-        if total_reserved + updated_reservation.reserved_count > 50000:
-            raise HTTPException(
-                status_code=400,
-                detail=f"{updated_reservation.start_date} {updated_reservation.start_hour}:00 ~ {updated_reservation.end_hour}:00 예약이 인원 초과로 확정 불가",
-            )
-
-        # 2️⃣ 기존 예약 삭제
-        db.query(Reservation).filter(
-            Reservation.reservation_group_id == reservation_group_id
-        ).delete()
-        db.commit()
+        confirmed_counts = await load_confirmed_counts(db, updated_reservation.start_date, updated_reservation.end_date)
+
+        check_date = updated_reservation.start_date
+        while check_date <= updated_reservation.end_date:
+            if exceeds_capacity(
+                confirmed_counts,
+                check_date,
+                updated_reservation.start_hour,
+                updated_reservation.end_hour,
+                updated_reservation.reserved_count,
+            ):
+                raise HTTPException(
+                    status_code=400,
+                    detail=f"{check_date} {updated_reservation.start_hour}:00 ~ {updated_reservation.end_hour}:00 예약이 인원 초과로 확정 불가",
+                )
+            check_date += timedelta(days=1)
 
-        # 3️⃣ 새로운 날짜 범위만큼 데이터 추가
+        # 3️⃣ 새로운 날짜 범위만큼 데이터 생성
         current_date = updated_reservation.start_date
         new_reservations = []
         while current_date <= updated_reservation.end_date:
-            new_reservations.append(
-                Reservation(
-                    reservation_group_id=reservation_group_id,
-                    user_id=reservations[0].user_id,  # 기존 예약의 사용자 ID 유지
-                    date=current_date,
-                    start_hour=updated_reservation.start_hour,
-                    end_hour=updated_reservation.end_hour,
-                    reserved_count=updated_reservation.reserved_count,
-                    is_confirmed=updated_reservation.is_confirmed,
-                    updated_at=datetime.utcnow(),
-                )
-            )
+            new_reservations.append({
+                "user_id": reservations[0].user_id,  # 기존 예약의 사용자 ID 유지
+                "date": current_date,
+                "start_hour": updated_reservation.start_hour,
+                "end_hour": updated_reservation.end_hour,
+                "reserved_count": updated_reservation.reserved_count,
+                "is_confirmed": is_confirmed,
+                "updated_at": datetime.utcnow(),
+            })
             current_date += timedelta(days=1)  # 날짜 증가
 
-        # 4️⃣ 새로운 예약 데이터 추가
-        db.add_all(new_reservations)
-
-        # 5️⃣ 확정된 예약이면 `exam_schedule` 업데이트
-        if updated_reservation.is_confirmed:
-            for res in reservations:
-                exam_schedule = (
-                    db.query(ExamSchedule)
-                    .filter(
-                        ExamSchedule.date == res.date,
-                        ExamSchedule.start_hour == res.start_hour,
-                        ExamSchedule.end_hour == res.end_hour,
-                    )
-                    .first()
-                )
+        # 4️⃣ 확정된 예약이면 `exam_schedule` 업데이트 후 새 예약과 연결
+        if is_confirmed:
+            new_slots = [
+                (res["date"], res["start_hour"], res["end_hour"], res["reserved_count"]) for res in new_reservations
+            ]
+            schedule_ids = await add_to_exam_schedules(db, new_slots)
+            for res in new_reservations:
+                res["exam_schedule_id"] = schedule_ids[(res["date"], res["start_hour"], res["end_hour"])]
 
-                if exam_schedule:
-                    exam_schedule.total_reserved_count += updated_reservation.reserved_count
-                else:
-                    exam_schedule = ExamSchedule(
-                        date=res.date,
-                        start_hour=res.start_hour,
-                        end_hour=res.end_hour,
-                        total_reserved_count=updated_reservation.reserved_count,
-                    )
-                    db.add(exam_schedule)
-                    db.flush()  # 새로운 객체의 ID 가져오기
+            # 시간별 용량 장부에 새 확정 인원 반영
+            await apply_confirmed_deltas(db, new_slots)
 
-                res.exam_schedule_id = exam_schedule.id  # 연결
+        # 5️⃣ 기존 예약과 날짜별로 비교해 바뀐 날짜만 반영 (장부 갱신과 같은 트랜잭션에서 처리)
+        rows, version = await replace_group(db, reservation_group_id, new_reservations, reservations)
+
+        # 기존 확정 예약이었다면 `exam_schedule`에서 인원 차감
+        # - 0명이 된 일정은 삭제되고 FK CASCADE로 연결된 예약도 삭제되므로, 유지되는 예약을 새 일정으로 옮긴 뒤에 차감
+        if was_confirmed:
+            await subtract_from_exam_schedules(db, old_slots)
 
-        db.commit()
-        return {"message": "예약 수정 완료", "reservation_group_id": reservation_group_id}
+        await db.commit()
+        return {"message": "예약 수정 완료", "reservation_group_id": reservation_group_id, "rows": rows, "version": version}
 
+    except HTTPException:
+        # 인원 초과(400) 등 검증 오류는 500으로 감싸지 않고 그대로 반환
+        await db.rollback()
+        raise
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         raise HTTPException(status_code=500, detail=f"예약 수정 중 오류 발생: {str(e)}")
\ No newline at end of file
@@ -0,0 +1,94 @@
+# app/api/routes/admin/monitoring.py
+from fastapi import APIRouter, Depends
+from app.core.security import get_current_admin_user, password_hasher, principal_cache  # 관리자 권한 검증
+from app.core.config import settings
+from app.core.startup import startup_timer
+from app.database.dependencies import read_replica_router
+from app.database.pool import pool_stats
+from app.database.session import engine, read_engine
+from app.services.availability import availability_cache
+from app.services.reservation_queue import reservation_queue_worker
+
+router = APIRouter(prefix="/admin/monitoring", tags=["admin_monitoring"])
+
+
+@router.get("/password-hashing")
+async def get_password_hashing_stats(current_admin=Depends(get_current_admin_user)):
+    """
+    비밀번호 해싱 스레드 풀 상태 조회 API
+    - queue_depth: 스레드를 기다리는 해싱/검증 작업 수
+    - avg_wait_ms / avg_hash_ms: 풀 대기 시간과 실제 해싱 시간 평균 (풀 크기 산정용)
+    """
+    return password_hasher.stats()
+
+
+@router.get("/principal-cache")
+async def get_principal_cache_stats(current_admin=Depends(get_current_admin_user)):
+    """
+    인증 사용자 캐시 상태 조회 API (hits / misses / hit_ratio)
+    """
+    return principal_cache.stats()
+
+
+@router.get("/availability-cache")
+async def get_availability_cache_stats(current_admin=Depends(get_current_admin_user)):
+    """
+    예약 가능 인원 캐시 상태 조회 API (캐시된 날짜 수, hits / misses / hit_ratio)
+    """
+    return availability_cache.stats()
+
+
+@router.get("/db-pool")
+async def get_db_pool_stats(current_admin=Depends(get_current_admin_user)):
+    """
+    DB 커넥션 풀 상태 조회 API
+    - checked_out / overflow: 현재 사용 중인 커넥션 수와 pool_size 초과분
+    - avg_wait_ms / max_wait_ms / wait_histogram: 풀에서 커넥션을 받기까지 기다린 시간
+    - timeouts: pool_timeout 안에 커넥션을 받지 못한 요청 수
+    """
+    pool = engine.sync_engine.pool
+    return {
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_timeout": settings.DB_POOL_TIMEOUT,
+        "idle": pool.checkedin(),
+        "overflow": max(pool.overflow(), 0),
+        **pool_stats.stats(),
+    }
+
+
+@router.get("/read-replica")
+async def get_read_replica_stats(current_admin=Depends(get_current_admin_user)):
+    """
+    읽기 전용 복제본 사용 현황 조회 API (READ_REPLICA_DATABASE_URL을 지정한 경우)
+    - replica_reads / primary_reads: 읽기 전용 요청이 복제본 / primary에서 처리된 수
+    - read_your_writes: X-Read-Your-Writes 헤더로 primary에서 읽은 수
+    - fallbacks / last_error: 복제본 연결 실패로 primary에서 읽은 수와 마지막 오류
+    - replica_misses: 복제본에 없어(복제 지연) primary에서 다시 조회한 수
+    """
+    stats = read_replica_router.stats()
+    if read_engine is not None:
+        pool = read_engine.sync_engine.pool
+        stats["pool"] = {"checked_out": pool.checkedout(), "idle": pool.checkedin(), "overflow": max(pool.overflow(), 0)}
+    return stats
+
+@router.get("/reservation-queue")
+async def get_reservation_queue_stats(current_admin=Depends(get_current_admin_user)):
+    """
+    예약 신청 대기열 상태 조회 API (RESERVATION_CREATE_MODE=queued 인 경우)
+    - queue_depth: 처리 대기 중인 신청 수
+    - processed / succeeded / failed, avg_batch_size / avg_batch_ms: 워커 처리량과 배치당 처리 시간
+    """
+    if reservation_queue_worker is None:
+        return {"mode": settings.RESERVATION_CREATE_MODE, "running": False}
+    return reservation_queue_worker.stats()
+
+
+@router.get("/startup")
+async def get_startup_stats(current_admin=Depends(get_current_admin_user)):
+    """
+    현재 워커 프로세스의 기동 시간 조회 API
+    - phases_ms: 모듈 임포트(import) / DB 엔진 생성(engine) / 라우터 임포트 및 등록(routers) / startup 이벤트(startup) 소요 시간
+    - time_to_first_request_ms: app.main 임포트 시작부터 첫 요청이 들어올 때까지 걸린 시간
+    """
+    return startup_timer.report()
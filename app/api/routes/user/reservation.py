@@ -1,83 +1,141 @@
 # app/api/routes/reservation.py
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy.orm import Session
-from sqlalchemy.sql import func
-from app.models.reservation import Reservation
-from app.models.exam_schedule import ExamSchedule
-from app.models.user import User
-from app.schemas.reservation_schema import ReservationCreate, ReservationOut, ReservationUpdate
-from app.database.dependencies import get_db
+from fastapi.responses import JSONResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.schemas.reservation_schema import (
+    AvailabilityOut,
+    ReservationCreate,
+    ReservationOut,
+    ReservationTicketOut,
+    ReservationUpdate,
+    UserReservationGroupPage,
+)
+from app.database.dependencies import get_db, get_read_db
+from app.core.principal_cache import Principal
 from app.core.security import get_current_user
+from app.core.config import settings
 from app.core.exceptions import ReservationTimeError, ReservationCapacityError
+from app.services.availability import availability_cache
+from app.services.capacity import load_confirmed_counts, exceeds_capacity
+from app.services.group_id import group_id_allocator
+from app.services.reservation_groups import GroupFilters, fetch_group_summary_page, fetch_group_reservations
+from app.services.reservation_json import user_group_page_response
+from app.services.reservation_queue import QUEUED, new_ticket, reservation_queue, use_queued_create
+from app.services.reservation_store import check_group_version, delete_group, insert_group, load_group, replace_group
 from typing import List, Optional  # List 타입 추가
 
 router = APIRouter(prefix="/reservations", tags=["reservations"])
 
 
-@router.get("/", response_model=List[dict])
+def check_reservation_hours(start_date: date, start_hour: int, end_date: date, end_hour: int) -> None:
+    """
+    예약 기간 검증 (신청/수정 공통, CSV 가져오기와 같은 기준)
+    - start_hour는 0~23, end_hour는 1~24 (여러 날짜 예약의 마지막 날이 0시~0시인 빈 날짜가 되지 않도록)
+    """
+    if not 0 <= start_hour <= 23 or not 1 <= end_hour <= 24:
+        raise HTTPException(status_code=400, detail="예약 시간 범위가 잘못되었습니다.")
+
+    if start_date == end_date and start_hour >= end_hour:
+        raise HTTPException(status_code=400, detail="같은 날짜에서 start_hour가 end_hour보다 커야 합니다.")
+
+    if start_date > end_date:
+        raise HTTPException(status_code=400, detail="start_date는 end_date보다 앞서야 합니다.")
+
+
+@router.get("/", response_model=UserReservationGroupPage)
 async def get_user_reservations(
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_read_db),
+    current_user: Principal = Depends(get_current_user),
     date: str = None,
     is_confirmed: bool = None,
     past: bool = None,
+    include_reservations: bool = Query(False, description="일자별 예약 상세 포함 여부"),
+    cursor: Optional[str] = Query(None, description="이전 응답의 next_cursor"),
+    limit: int = Query(50, ge=1, le=500, description="페이지당 예약 그룹 수"),
 ):
     """
     사용자의 예약 조회 API (예약 그룹별로 묶어서 반환)
+    - reservation_group_id 기준 키셋 페이지네이션 (한 그룹은 한 페이지에만 포함)
+    - 그룹 요약은 DB에서 집계하고, 일자별 예약은 include_reservations=true 인 경우에만 조회
+    - 응답은 Pydantic 모델을 거치지 않고 orjson으로 바로 직렬화
+    - 읽기 전용 복제본에서 조회 (X-Read-Your-Writes: true 헤더를 보내면 primary에서 조회)
     """
-    query = db.query(Reservation).filter(Reservation.user_id == current_user.id)
+    filters = GroupFilters(user_id=current_user.id, is_confirmed=is_confirmed)
 
     if date:
         try:
             query_date = datetime.strptime(date, "%Y-%m-%d").date()
-            query = query.filter(Reservation.date == query_date)
+            filters.restrict_dates(query_date, query_date)
         except ValueError:
             raise HTTPException(status_code=400, detail="잘못된 날짜 형식입니다.")
 
-    if is_confirmed is not None:
-        query = query.filter(Reservation.is_confirmed == is_confirmed)
-
     if past is not None:
         now = datetime.utcnow().date()
         if past:
-            query = query.filter(Reservation.date < now)
+            filters.restrict_dates(date_to=now - timedelta(days=1))
         else:
-            query = query.filter(Reservation.date >= now)
+            filters.restrict_dates(date_from=now)
 
-    reservations = query.all()
-    
-    grouped_reservations = {}
-    for r in reservations:
-        if r.reservation_group_id not in grouped_reservations:
-            grouped_reservations[r.reservation_group_id] = {
-                "reservation_group_id": r.reservation_group_id,
-                "reservations": []
-            }
-        grouped_reservations[r.reservation_group_id]["reservations"].append({
-            "reservation_id": r.id,
-            "date": r.date.strftime("%Y-%m-%d"),
-            "start_hour": r.start_hour,
-            "end_hour": r.end_hour,
-            "reserved_count": r.reserved_count,
-            "is_confirmed": r.is_confirmed
-        })
+    summaries, next_cursor = await fetch_group_summary_page(db, filters, cursor, limit)
+
+    details = {}
+    if include_reservations:
+        details = await fetch_group_reservations(db, filters, [row.reservation_group_id for row in summaries])
 
-    return list(grouped_reservations.values())
+    # response_model 검증 없이 바로 JSON으로 직렬화 (스키마는 UserReservationGroupPage와 동일)
+    return user_group_page_response(summaries, details, next_cursor, include_reservations)
 
 
-@router.post("/", response_model=List[ReservationOut])
+@router.get("/availability", response_model=AvailabilityOut)
+async def get_availability(
+    from_date: date = Query(..., alias="from", description="조회 시작 날짜 (YYYY-MM-DD)"),
+    to_date: date = Query(..., alias="to", description="조회 종료 날짜 (YYYY-MM-DD)"),
+    db: AsyncSession = Depends(get_db),
+    current_user: Principal = Depends(get_current_user),
+):
+    """
+    예약 가능 인원 조회 API
+    - 기간 내 날짜별 0~23시 시간대의 남은 인원 (최대 수용 인원 - 확정 인원)
+    - 프로세스 내 캐시에서 응답하며, 캐시에 없는 날짜만 `exam_schedules`에서 한 번에 조회
+    """
+    if to_date < from_date:
+        raise HTTPException(status_code=400, detail="종료 날짜는 시작 날짜 이후여야 합니다.")
+    if (to_date - from_date).days + 1 > settings.AVAILABILITY_MAX_RANGE_DAYS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"한 번에 최대 {settings.AVAILABILITY_MAX_RANGE_DAYS}일까지 조회할 수 있습니다.",
+        )
+
+    confirmed_counts = await availability_cache.get_confirmed_counts(db, from_date, to_date)
+    return {
+        "max_capacity": settings.MAX_CAPACITY_PER_HOUR,
+        "days": [
+            {
+                "date": day,
+                "remaining": [max(settings.MAX_CAPACITY_PER_HOUR - count, 0) for count in counts],
+            }
+            for day, counts in confirmed_counts.items()
+        ],
+    }
+
+
+@router.post(
+    "/",
+    response_model=List[ReservationOut],
+    responses={202: {"model": ReservationTicketOut, "description": "대기열 모드에서 접수된 경우"}},
+)
 async def create_reservation(
     reservation: ReservationCreate,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+    current_user: Principal = Depends(get_current_user),
 ):
     """
     예약 신청 API: 특정 날짜(start_date)의 특정 시간(start_hour) ~ 특정 날짜(end_date)의 특정 시간(end_hour)에 예약 요청
+    - RESERVATION_CREATE_MODE=queued 이면 입력 검증 후 대기열에 넣고 202와 접수 번호를 바로 반환
+      (인원 검증/저장은 워커가 배치로 처리, 결과는 GET /reservations/tickets/{ticket_id}로 조회)
     """
 
-    new_group_id = db.query(func.coalesce(func.max(Reservation.reservation_group_id), 0) + 1).scalar()
-
     # 1. 날짜 변환 및 검증
     try:
         start_date = reservation.start_date
@@ -91,17 +149,19 @@ async def create_reservation(
         raise ReservationTimeError()
 
     # 3. 신청 시간이 1시간 단위인지 체크
-    if reservation.start_hour < 0 or reservation.end_hour > 24:
-        raise HTTPException(status_code=400, detail="예약 시간 범위가 잘못되었습니다.")
-
-    if start_date == end_date and reservation.start_hour >= reservation.end_hour:
-        raise HTTPException(status_code=400, detail="같은 날짜에서 start_hour가 end_hour보다 커야 합니다.")
+    check_reservation_hours(start_date, reservation.start_hour, end_date, reservation.end_hour)
 
-    if start_date > end_date:
-        raise HTTPException(status_code=400, detail="start_date는 end_date보다 앞서야 합니다.")
+    if use_queued_create():
+        ticket = new_ticket(current_user.id, reservation)
+        await reservation_queue.put(ticket)
+        return JSONResponse(status_code=202, content={"ticket_id": ticket["ticket_id"], "status": QUEUED})
 
-    new_reservations = []
+    # 요청 기간의 시간별 확정 인원을 장부에서 한 번에 조회
+    # - 미확정 예약은 확정 인원을 바꾸지 않으므로 장부를 잠그지 않음 (확정 시 잠금 후 다시 검증)
+    confirmed_counts = await load_confirmed_counts(db, start_date, end_date)
 
+    # 4. 그룹 전체를 먼저 검증한 뒤 한 번에 저장 (일부 날짜만 저장되는 것을 방지)
+    new_rows = []
     current_date = start_date
     current_start_hour = reservation.start_hour
 
@@ -109,49 +169,63 @@ async def create_reservation(
         current_end_hour = 24 if current_date < end_date else reservation.end_hour  # 마지막 날짜에는 end_hour 사용
 
         # 해당 날짜 시간대 예약 가능 인원 체크
-        confirmed_reservations = (
-            db.query(Reservation)
-            .filter(
-                Reservation.date == current_date,
-                Reservation.start_hour >= current_start_hour,
-                Reservation.end_hour <= current_end_hour,
-                Reservation.is_confirmed == True
-            )
-            .with_entities(Reservation.reserved_count)
-            .all()
-        )
-        total_reserved = sum([r[0] for r in confirmed_reservations])
-
-        if total_reserved + reservation.reserved_count > 50000:
+        if exceeds_capacity(confirmed_counts, current_date, current_start_hour, current_end_hour, reservation.reserved_count):
             raise ReservationCapacityError()
 
-        # 예약 생성
-        new_reservation = Reservation(
-            reservation_group_id=new_group_id,
-            user_id=current_user.id,
-            date=current_date,
-            start_hour=current_start_hour,
-            end_hour=current_end_hour,
-            reserved_count=reservation.reserved_count,
-            is_confirmed=False
-        )
-
-        db.add(new_reservation)
-        db.commit()
-        db.refresh(new_reservation)
-        new_reservations.append(new_reservation)
+        new_rows.append({
+            "user_id": current_user.id,
+            "date": current_date,
+            "start_hour": current_start_hour,
+            "end_hour": current_end_hour,
+            "reserved_count": reservation.reserved_count,
+            "is_confirmed": False,
+        })
 
         # 다음 날짜로 이동
         current_date += timedelta(days=1)
         current_start_hour = 0  # 다음 날부터는 00시부터 시작
 
+    # 5. 검증을 통과한 요청에만 시퀀스 기반 그룹 ID 발급
+    new_group_id = await group_id_allocator.next_id(db)
+
+    # 6. INSERT ... RETURNING 으로 생성된 id/created_at까지 한 번에 받아온 뒤 단일 커밋
+    try:
+        new_reservations = await insert_group(db, new_group_id, new_rows)
+        await db.commit()
+    except Exception as e:
+        await db.rollback()
+        raise HTTPException(status_code=500, detail=f"예약 생성 중 오류 발생: {str(e)}")
+
     return new_reservations
 
+
+@router.get("/tickets/{ticket_id}", response_model=ReservationTicketOut)
+async def get_reservation_ticket(
+    ticket_id: str,
+    current_user: Principal = Depends(get_current_user),
+):
+    """
+    대기열 모드 예약 신청 결과 조회 API
+    - queued: 처리 대기 중, done: 예약 생성 완료 (reservation_group_id / reservations 포함), failed: 실패 (detail 포함)
+    - 본인이 신청한 접수만 조회 가능하며, 처리 결과는 RESERVATION_TICKET_TTL_SECONDS 동안 보관
+    """
+    ticket = await reservation_queue.status(ticket_id) if reservation_queue is not None else None
+    if ticket is None or ticket["user_id"] != current_user.id:
+        raise HTTPException(status_code=404, detail="접수 내역을 찾을 수 없습니다.")
+
+    return {
+        "ticket_id": ticket_id,
+        "status": ticket["status"],
+        "reservation_group_id": ticket.get("reservation_group_id"),
+        "reservations": ticket.get("reservations"),
+        "detail": ticket.get("detail"),
+    }
+
 @router.put("/{reservation_group_id}")
 async def update_reservation(
     reservation_group_id: int,
     updated_reservation: ReservationUpdate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user=Depends(get_current_user),
 ):
     """
@@ -159,22 +233,20 @@ async def update_reservation(
     - 예약이 본인 예약인지 확인
     - 예약이 확정되지 않았는지 확인
     - 예약 시작 시간이 현재 시간 기준 3일 이전인지 확인
-    - 기존 예약 데이터를 삭제 후 새로운 예약 데이터 삽입
+    - version을 지정하면 현재 예약 그룹 버전과 같은지 확인 (다르면 409)
+    - 기존 예약과 날짜별로 비교해 바뀐 날짜만 UPDATE, 추가된 날짜만 INSERT, 빠진 날짜만 DELETE
+      (응답의 rows에 변경된 행 수 반환)
     """
 
     # 기존 예약 조회 (reservation_group_id 기반)
-    reservations = (
-        db.query(Reservation)
-        .filter(
-            Reservation.reservation_group_id == reservation_group_id,
-            Reservation.user_id == current_user.id,
-        )
-        .all()
-    )
+    reservations = await load_group(db, reservation_group_id, user_id=current_user.id, for_update=True)
 
     if not reservations:
         raise HTTPException(status_code=404, detail="해당 예약이 존재하지 않거나 수정 권한이 없습니다.")
 
+    # 조회한 이후 다른 요청에서 변경되었는지 확인
+    check_group_version(reservations, updated_reservation.version)
+
     # 확정 여부 확인
     if any(res.is_confirmed for res in reservations):
         raise HTTPException(status_code=400, detail="확정된 예약은 수정할 수 없습니다.")
@@ -184,10 +256,16 @@ async def update_reservation(
     if start_date - timedelta(days=3) < datetime.utcnow().date():
         raise HTTPException(status_code=400, detail="예약 시작 시간이 3일 이내인 경우 수정할 수 없습니다.")
 
-    # 트랜잭션 처리 (삭제 후 신규 데이터 삽입)
-    try:
-        db.query(Reservation).filter(Reservation.reservation_group_id == reservation_group_id).delete()
+    # 새 예약 기간 검증
+    check_reservation_hours(
+        updated_reservation.start_date,
+        updated_reservation.start_hour,
+        updated_reservation.end_date,
+        updated_reservation.end_hour,
+    )
 
+    # 트랜잭션 처리 (기존 예약을 새 날짜 범위로 변경)
+    try:
         new_reservations = []
         current_date = updated_reservation.start_date
         current_start_hour = updated_reservation.start_hour
@@ -195,47 +273,43 @@ async def update_reservation(
         while current_date <= updated_reservation.end_date:
             current_end_hour = 24 if current_date < updated_reservation.end_date else updated_reservation.end_hour
 
-            new_reservation = Reservation(
-                reservation_group_id=reservation_group_id,
-                user_id=current_user.id,
-                date=current_date,
-                start_hour=current_start_hour,
-                end_hour=current_end_hour,
-                reserved_count=updated_reservation.reserved_count,
-                is_confirmed=False,
-            )
-
-            db.add(new_reservation)
-            new_reservations.append(new_reservation)
+            new_reservations.append({
+                "user_id": current_user.id,
+                "date": current_date,
+                "start_hour": current_start_hour,
+                "end_hour": current_end_hour,
+                "reserved_count": updated_reservation.reserved_count,
+                "is_confirmed": False,
+            })
 
             current_date += timedelta(days=1)
             current_start_hour = 0  # 다음 날짜부터는 00시부터 시작
 
-        db.commit()
-        return {"message": "예약 수정 완료", "reservation_group_id": reservation_group_id}
+        # 기존 예약과 날짜별로 비교해 바뀐 날짜만 반영
+        rows, version = await replace_group(db, reservation_group_id, new_reservations, reservations)
+        await db.commit()
+        return {"message": "예약 수정 완료", "reservation_group_id": reservation_group_id, "rows": rows, "version": version}
 
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         raise HTTPException(status_code=500, detail=f"예약 수정 중 오류 발생: {str(e)}")
     
 
 @router.delete("/{reservation_group_id}")
 async def delete_reservation(
     reservation_group_id: int,
-    db: Session = Depends(get_db),
+    version: Optional[int] = Query(None, description="조회한 예약 그룹 버전 (다르면 409)"),
+    db: AsyncSession = Depends(get_db),
     current_user=Depends(get_current_user),
 ):
     """
     사용자의 예약 삭제 API
     - 본인 예약인지 확인
     - 확정되지 않은 예약만 삭제 가능
+    - version을 지정하면 현재 예약 그룹 버전과 같은지 확인 (다르면 409)
     """
     # 해당 `reservation_group_id`에 속하는 예약 조회
-    reservations = (
-        db.query(Reservation)
-        .filter(Reservation.reservation_group_id == reservation_group_id)
-        .all()
-    )
+    reservations = await load_group(db, reservation_group_id, for_update=True)
 
     if not reservations:
         raise HTTPException(status_code=404, detail="예약을 찾을 수 없습니다.")
@@ -244,6 +318,8 @@ async def delete_reservation(
     if reservations[0].user_id != current_user.id:
         raise HTTPException(status_code=403, detail="본인의 예약만 삭제할 수 있습니다.")
 
+    check_group_version(reservations, version)
+
     # 확정된 예약인지 확인
     for res in reservations:
         if res.is_confirmed:
@@ -251,10 +327,9 @@ async def delete_reservation(
 
     # 트랜잭션을 사용하여 예약 삭제
     try:
-        for res in reservations:
-            db.delete(res)
-        db.commit()
+        await delete_group(db, reservation_group_id)
+        await db.commit()
         return {"message": "예약이 성공적으로 삭제되었습니다.", "reservation_group_id": reservation_group_id}
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         raise HTTPException(status_code=500, detail=f"예약 삭제 중 오류 발생: {str(e)}")
@@ -1,22 +1,21 @@
 from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordRequestForm
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from datetime import timedelta
-from app.core.security import create_access_token, pwd_context
+from app.core.security import create_access_token, get_user, password_hasher
 from app.core.config import settings
 from app.database.dependencies import get_db
-from app.models.user import User as UserModel
 
 router = APIRouter(tags=["token"])
 
 @router.post("/token")
 async def login_for_access_token(
     form_data: OAuth2PasswordRequestForm = Depends(),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     
     # DB에서 사용자를 찾기
-    user = db.query(UserModel).filter(UserModel.email == form_data.username).first()
+    user = await get_user(db, form_data.username)
 
     if not user:
         raise HTTPException(
@@ -25,7 +24,7 @@ async def login_for_access_token(
         )
 
     # 비밀번호 검증 (입력값 vs 저장된 해시된 비밀번호)
-    if not pwd_context.verify(form_data.password, user.hashed_password):
+    if not await password_hasher.verify(form_data.password, user.hashed_password):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Incorrect email or password"
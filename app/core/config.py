@@ -1,4 +1,6 @@
 # app/core/config.py
+from typing import Optional
+
 from pydantic_settings import BaseSettings
 
 class Settings(BaseSettings):
@@ -7,6 +9,58 @@ class Settings(BaseSettings):
     ALGORITHM: str
     ACCESS_TOKEN_EXPIRE_MINUTES: int
 
+    # DB 커넥션 풀 설정 (워커 프로세스별)
+    DB_POOL_SIZE: int = 5  # 유지하는 커넥션 수
+    DB_MAX_OVERFLOW: int = 10  # pool_size를 넘어 추가로 만들 수 있는 커넥션 수
+    DB_POOL_TIMEOUT: float = 30  # 커넥션을 기다리는 최대 시간(초)
+    DB_POOL_RECYCLE: int = 1800  # 커넥션 재사용 최대 시간(초), -1이면 제한 없음
+    DB_POOL_PRE_PING: bool = True  # 체크아웃 시 끊어진 커넥션 확인
+
+    # 읽기 전용 복제본 (목록 조회 / 인증 사용자 조회), 지정하지 않으면 primary에서 읽음
+    # 커넥션 풀 크기 등은 DB_POOL_* 설정을 같이 사용
+    READ_REPLICA_DATABASE_URL: Optional[str] = None
+    READ_REPLICA_CONNECT_TIMEOUT: float = 2  # 복제본 연결 대기 시간(초), 넘으면 primary에서 읽음
+    READ_REPLICA_RETRY_SECONDS: int = 30  # 복제본 연결 실패 후 복제본을 다시 시도하기까지 primary에서 읽는 시간(초)
+
+    # 느린 요청 로그 기준 (0이면 사용 안 함)
+    SLOW_REQUEST_LOG_MS: int = 0  # 응답 시간(ms)
+    SLOW_REQUEST_LOG_QUERIES: int = 0  # 요청당 SQL 실행 수
+
+    # 시간당 최대 수용 인원
+    MAX_CAPACITY_PER_HOUR: int = 50000
+    # 워커별로 미리 받아두는 예약 그룹 ID 개수
+    RESERVATION_GROUP_ID_BLOCK_SIZE: int = 20
+    # 예약 저장 방식: "daily"(일자별 한 행) 또는 "range"(그룹당 구간 한 행)
+    RESERVATION_STORAGE_MODE: str = "daily"
+
+    # 비밀번호 해싱 설정
+    BCRYPT_ROUNDS: int = 12  # bcrypt cost factor
+    PASSWORD_HASH_WORKERS: int = 4  # 해싱 전용 스레드 풀 크기
+
+    # 인증 사용자 캐시 설정 (0이면 캐시 사용 안 함)
+    PRINCIPAL_CACHE_TTL_SECONDS: int = 60
+    PRINCIPAL_CACHE_MAX_SIZE: int = 10000
+
+    # 예약 가능 인원 캐시 설정 (0이면 캐시 사용 안 함)
+    AVAILABILITY_CACHE_TTL_SECONDS: int = 30
+    AVAILABILITY_MAX_RANGE_DAYS: int = 92  # 한 번에 조회 가능한 최대 기간
+
+    # 예약 신청 처리 방식
+    # - "sync": 요청 안에서 인원 검증 후 저장
+    # - "queued": 입력 검증 후 202와 접수 번호를 반환하고, 백그라운드 워커가 모아서 일괄 검증/저장
+    RESERVATION_CREATE_MODE: str = "sync"
+    # 대기열 저장소 ("memory": 워커 프로세스 메모리, "file": 로컬 디렉터리 - 같은 서버의 워커 프로세스끼리 공유, 재시작 후에도 유지)
+    RESERVATION_QUEUE_BACKEND: str = "memory"
+    RESERVATION_QUEUE_DIR: str = "reservation_queue"  # file 저장소 디렉터리
+    RESERVATION_QUEUE_MAX_SIZE: int = 10000  # 대기 중인 요청이 이 수에 도달하면 503 반환
+    RESERVATION_QUEUE_BATCH_SIZE: int = 200  # 워커가 한 번에 처리하는 요청 수
+    RESERVATION_TICKET_TTL_SECONDS: int = 600  # 처리 결과 보관 시간
+
+    # 관리자 예약 내보내기 시 DB 커서에서 한 번에 가져오는 행 수
+    EXPORT_BATCH_SIZE: int = 1000
+    # 관리자 예약 가져오기 시 COPY 한 번에 보내는 행 수
+    IMPORT_BATCH_SIZE: int = 10000
+
     class Config:
         env_file = ".env"
 
@@ -8,3 +8,18 @@ class ReservationTimeError(HTTPException):
 class ReservationCapacityError(HTTPException):
     def __init__(self):
         super().__init__(status_code=400, detail="해당 시간대의 예약이 최대 수용 인원을 초과합니다.")
+
+class ReservationImportError(HTTPException):
+    def __init__(self, errors: list):
+        super().__init__(status_code=400, detail={"message": "예약 가져오기에 실패했습니다.", "errors": errors})
+
+class ReservationQueueFullError(HTTPException):
+    def __init__(self):
+        super().__init__(status_code=503, detail="예약 요청이 많아 접수할 수 없습니다. 잠시 후 다시 시도해주세요.")
+
+class ReservationVersionConflictError(HTTPException):
+    def __init__(self, current_version: int):
+        super().__init__(
+            status_code=409,
+            detail={"message": "다른 요청에서 예약이 변경되었습니다. 다시 조회한 후 시도해주세요.", "current_version": current_version},
+        )
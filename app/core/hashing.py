@@ -0,0 +1,71 @@
+# app/core/hashing.py
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from passlib.context import CryptContext
+
+
+class PasswordHasher:
+    """
+    bcrypt 해싱/검증을 이벤트 루프 밖의 고정 크기 스레드 풀에서 실행한다.
+    - 해싱 중에도 같은 워커의 다른 요청이 멈추지 않도록 하기 위함
+    - 풀 크기를 산정할 수 있도록 대기 중인 작업 수와 대기/해싱 시간을 기록
+    """
+
+    def __init__(self, context: CryptContext, max_workers: int):
+        self.context = context
+        self.max_workers = max_workers
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="password-hasher")
+        self._lock = threading.Lock()  # 풀 스레드에서 갱신하는 통계 보호용
+
+        self.pending = 0  # 풀에 제출되어 완료되지 않은 작업 수 (대기 + 실행 중)
+        self.running = 0  # 스레드에서 실행 중인 작업 수
+        self.completed = 0
+        self.wait_seconds_total = 0.0  # 풀에서 스레드를 기다린 시간 합계
+        self.hash_seconds_total = 0.0  # 실제 해싱/검증에 걸린 시간 합계
+        self.hash_seconds_max = 0.0
+
+    def _timed(self, submitted_at: float, fn, *args):
+        started_at = time.perf_counter()
+        with self._lock:
+            self.running += 1
+        try:
+            return fn(*args)
+        finally:
+            finished_at = time.perf_counter()
+            with self._lock:
+                self.running -= 1
+                self.completed += 1
+                self.wait_seconds_total += started_at - submitted_at
+                self.hash_seconds_total += finished_at - started_at
+                self.hash_seconds_max = max(self.hash_seconds_max, finished_at - started_at)
+
+    async def _run(self, fn, *args):
+        loop = asyncio.get_running_loop()
+        self.pending += 1
+        try:
+            return await loop.run_in_executor(self._executor, self._timed, time.perf_counter(), fn, *args)
+        finally:
+            self.pending -= 1
+
+    async def hash(self, password: str) -> str:
+        return await self._run(self.context.hash, password)
+
+    async def verify(self, password: str, hashed_password: str) -> bool:
+        return await self._run(self.context.verify, password, hashed_password)
+
+    def stats(self) -> dict:
+        return {
+            "max_workers": self.max_workers,
+            "queue_depth": max(self.pending - self.running, 0),
+            "running": self.running,
+            "completed": self.completed,
+            "avg_wait_ms": self.wait_seconds_total / self.completed * 1000 if self.completed else 0.0,
+            "avg_hash_ms": self.hash_seconds_total / self.completed * 1000 if self.completed else 0.0,
+            "max_hash_ms": self.hash_seconds_max * 1000,
+        }
+
+    def shutdown(self):
+        self._executor.shutdown(wait=False)
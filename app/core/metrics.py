@@ -0,0 +1,207 @@
+# app/core/metrics.py
+import logging
+import time
+from bisect import bisect_left
+from contextvars import ContextVar
+from typing import Dict, Sequence, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from app.core.config import settings
+from app.core.startup import startup_timer
+
+logger = logging.getLogger("app.metrics")
+
+# 히스토그램 구간 (Prometheus 기본 구간 기준)
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+QUERY_COUNT_BUCKETS = (0, 1, 2, 5, 10, 20, 50, 100, 200, 500)
+
+
+class RequestStats:
+    # 요청 하나에서 실행된 SQL 수와 DB 시간 (SQLAlchemy 커서 이벤트에서 누적)
+    __slots__ = ("queries", "db_seconds")
+
+    def __init__(self):
+        self.queries = 0
+        self.db_seconds = 0.0
+
+
+# 현재 처리 중인 요청의 통계 (요청 밖에서 실행된 SQL은 집계하지 않음)
+_current_request = ContextVar("current_request_stats", default=None)
+
+
+class Histogram:
+    """
+    라벨별 누적 히스토그램 (Prometheus histogram 형식으로 출력)
+    """
+
+    def __init__(self, name: str, help_text: str, label_names: Sequence[str], buckets: Sequence[float]):
+        self.name = name
+        self.help_text = help_text
+        self.label_names = tuple(label_names)
+        self.buckets = tuple(buckets)
+        self._series: Dict[Tuple[str, ...], list] = {}  # labels -> [구간별 개수..., 합계, 개수]
+
+    def observe(self, labels: Tuple[str, ...], value: float) -> None:
+        series = self._series.get(labels)
+        if series is None:
+            series = self._series[labels] = [0] * (len(self.buckets) + 1) + [0.0, 0]
+        series[bisect_left(self.buckets, value)] += 1
+        series[-2] += value
+        series[-1] += 1
+
+    def render(self) -> list:
+        lines = ["# HELP {} {}".format(self.name, self.help_text), "# TYPE {} histogram".format(self.name)]
+        for labels, series in sorted(self._series.items()):
+            base = _format_labels(self.label_names, labels)
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float("inf"),), series):
+                cumulative += count
+                le = "+Inf" if bound == float("inf") else repr(float(bound))
+                lines.append('{}_bucket{{{}le="{}"}} {}'.format(self.name, base + "," if base else "", le, cumulative))
+            lines.append("{}_sum{{{}}} {}".format(self.name, base, series[-2]))
+            lines.append("{}_count{{{}}} {}".format(self.name, base, series[-1]))
+        return lines
+
+
+class Counter:
+    """
+    라벨별 누적 카운터 (Prometheus counter 형식으로 출력)
+    """
+
+    def __init__(self, name: str, help_text: str, label_names: Sequence[str]):
+        self.name = name
+        self.help_text = help_text
+        self.label_names = tuple(label_names)
+        self._values: Dict[Tuple[str, ...], float] = {}
+
+    def inc(self, labels: Tuple[str, ...], amount: float = 1) -> None:
+        self._values[labels] = self._values.get(labels, 0) + amount
+
+    def render(self) -> list:
+        lines = ["# HELP {} {}".format(self.name, self.help_text), "# TYPE {} counter".format(self.name)]
+        for labels, value in sorted(self._values.items()):
+            lines.append("{}{{{}}} {}".format(self.name, _format_labels(self.label_names, labels), value))
+        return lines
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str]) -> str:
+    return ",".join(
+        '{}="{}"'.format(name, str(value).replace("\\", "\\\\").replace('"', '\\"')) for name, value in zip(names, values)
+    )
+
+
+REQUEST_COUNT = Counter("http_requests_total", "Total HTTP requests.", ("method", "route", "status"))
+REQUEST_LATENCY = Histogram(
+    "http_request_duration_seconds", "HTTP request latency in seconds.", ("method", "route"), LATENCY_BUCKETS
+)
+REQUEST_QUERIES = Histogram(
+    "http_request_db_queries", "SQL statements executed per HTTP request.", ("method", "route"), QUERY_COUNT_BUCKETS
+)
+REQUEST_DB_TIME = Histogram(
+    "http_request_db_seconds", "Time spent executing SQL per HTTP request.", ("method", "route"), LATENCY_BUCKETS
+)
+METRICS = (REQUEST_COUNT, REQUEST_LATENCY, REQUEST_QUERIES, REQUEST_DB_TIME)
+
+
+def render_metrics() -> str:
+    """
+    수집한 지표를 Prometheus text 형식(0.0.4)으로 출력
+    """
+    lines = []
+    for metric in METRICS:
+        lines.extend(metric.render())
+    return "\n".join(lines) + "\n"
+
+
+def listen_query_events(engine: Engine) -> None:
+    """
+    SQL 실행 전후 커서 이벤트로 현재 요청의 SQL 수와 DB 시간을 누적
+    (executemany도 한 번의 실행으로 집계)
+    """
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("query_started_at", []).append(time.perf_counter())
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        started_at = conn.info["query_started_at"].pop()
+        stats = _current_request.get()
+        if stats is not None:
+            stats.queries += 1
+            stats.db_seconds += time.perf_counter() - started_at
+
+    @event.listens_for(engine, "handle_error")
+    def _handle_error(exception_context):
+        # 실패한 SQL도 실행 횟수에 포함하고 시작 시각 스택을 정리
+        connection = exception_context.connection
+        if connection is None or not connection.info.get("query_started_at"):
+            return
+        started_at = connection.info["query_started_at"].pop()
+        stats = _current_request.get()
+        if stats is not None:
+            stats.queries += 1
+            stats.db_seconds += time.perf_counter() - started_at
+
+
+class MetricsMiddleware:
+    """
+    라우트별 지연 시간/SQL 수/DB 시간을 기록하는 ASGI 미들웨어
+    - 라우트는 경로 템플릿(/v1/reservations/{reservation_group_id}) 기준으로 집계
+    - SLOW_REQUEST_LOG_MS / SLOW_REQUEST_LOG_QUERIES를 넘은 요청은 경고 로그로 남김
+    - 워커의 첫 요청 시각을 기동 시간 측정에 기록
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        startup_timer.first_request()
+        stats = RequestStats()
+        token = _current_request.set(stats)
+        status_code = 500
+        started_at = time.perf_counter()
+
+        async def send_wrapper(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            elapsed = time.perf_counter() - started_at
+            _current_request.reset(token)
+            self._record(scope, status_code, elapsed, stats)
+
+    @staticmethod
+    def _record(scope, status_code: int, elapsed: float, stats: RequestStats) -> None:
+        route = scope.get("route")
+        # 매칭되지 않은 경로는 라벨 수가 늘어나지 않도록 하나로 묶음
+        path = route.path if route is not None else "unmatched"
+        labels = (scope["method"], path)
+
+        REQUEST_COUNT.inc(labels + (str(status_code),))
+        REQUEST_LATENCY.observe(labels, elapsed)
+        REQUEST_QUERIES.observe(labels, stats.queries)
+        REQUEST_DB_TIME.observe(labels, stats.db_seconds)
+
+        slow_ms = settings.SLOW_REQUEST_LOG_MS
+        slow_queries = settings.SLOW_REQUEST_LOG_QUERIES
+        if (slow_ms and elapsed * 1000 >= slow_ms) or (slow_queries and stats.queries >= slow_queries):
+            logger.warning(
+                "slow request: %s %s status=%s latency_ms=%.1f queries=%d db_ms=%.1f",
+                scope["method"],
+                scope["path"],
+                status_code,
+                elapsed * 1000,
+                stats.queries,
+                stats.db_seconds * 1000,
+            )
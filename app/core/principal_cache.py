@@ -0,0 +1,73 @@
+# app/core/principal_cache.py
+import time
+from collections import OrderedDict
+from typing import Optional
+
+from pydantic import BaseModel
+
+
+class Principal(BaseModel):
+    # 인증된 사용자 정보 (요청 처리에 필요한 컬럼만 보관)
+    id: int
+    username: Optional[str] = None
+    email: str
+    role: str
+
+    class Config:
+        from_attributes = True
+
+
+class PrincipalCache:
+    """
+    사용자 ID -> Principal 프로세스 내 캐시
+    - TTL이 지난 항목은 조회 시 제거
+    - max_size를 넘으면 가장 오래 사용되지 않은 항목부터 제거 (LRU)
+    """
+
+    def __init__(self, max_size: int, ttl_seconds: float):
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self._entries = OrderedDict()  # user_id -> (만료 시각, Principal)
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, user_id: int) -> Optional[Principal]:
+        entry = self._entries.get(user_id)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        expires_at, principal = entry
+        if expires_at < time.monotonic():
+            del self._entries[user_id]
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(user_id)
+        self.hits += 1
+        return principal
+
+    def set(self, principal: Principal) -> None:
+        if self.max_size <= 0 or self.ttl_seconds <= 0:
+            return
+        self._entries[principal.id] = (time.monotonic() + self.ttl_seconds, principal)
+        self._entries.move_to_end(principal.id)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, user_id: int) -> None:
+        self._entries.pop(user_id, None)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def stats(self) -> dict:
+        total = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "max_size": self.max_size,
+            "ttl_seconds": self.ttl_seconds,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": self.hits / total if total else 0.0,
+        }
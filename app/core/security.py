@@ -1,19 +1,34 @@
 from datetime import datetime, timedelta
 from typing import Optional
 from jose import JWTError, jwt
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import OAuth2PasswordBearer
 from app.core.config import settings  # 기존 settings 사용
 from pydantic import BaseModel
 from passlib.context import CryptContext
-from sqlalchemy.orm import Session
+from app.core.hashing import PasswordHasher
+from app.core.principal_cache import Principal, PrincipalCache
+from sqlalchemy import event, select
+from sqlalchemy.ext.asyncio import AsyncSession
 
-# DB 세션 의존성 및 User 모델 임포트
-from app.database.dependencies import get_db
+# 읽기 전용 DB 세션 및 User 모델 임포트
+from app.database.dependencies import read_replica_router
 from app.models.user import User as UserModel
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/v1/token")
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto", bcrypt__rounds=settings.BCRYPT_ROUNDS)
+# 해싱/검증은 이벤트 루프를 막지 않도록 전용 스레드 풀에서 실행
+password_hasher = PasswordHasher(pwd_context, max_workers=settings.PASSWORD_HASH_WORKERS)
+# 인증된 사용자 정보 캐시 (요청마다 users 테이블을 조회하지 않도록)
+principal_cache = PrincipalCache(
+    max_size=settings.PRINCIPAL_CACHE_MAX_SIZE, ttl_seconds=settings.PRINCIPAL_CACHE_TTL_SECONDS
+)
+
+@event.listens_for(UserModel, "after_update")
+@event.listens_for(UserModel, "after_delete")
+def _invalidate_principal(mapper, connection, target):
+    # 사용자 정보가 변경/삭제되면 캐시에서 제거
+    principal_cache.invalidate(target.id)
 
 class TokenData(BaseModel):
     id: Optional[int] = None
@@ -26,11 +41,12 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
     to_encode.update({"exp": expire})
     return jwt.encode(to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
 
-def get_user(db: Session, email: str):
+async def get_user(db: AsyncSession, email: str):
     # 실제 DB에서 User 모델을 조회 (Spring Boot의 Repository.findByUsername()와 유사)
-    return db.query(UserModel).filter(UserModel.email == email).first()
+    result = await db.execute(select(UserModel).where(UserModel.email == email))
+    return result.scalars().first()
 
-async def get_current_user(token: str = Depends(oauth2_scheme), db: Session = Depends(get_db)) -> UserModel:
+async def get_current_user(request: Request, token: str = Depends(oauth2_scheme)) -> Principal:
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
@@ -48,12 +64,19 @@ async def get_current_user(token: str = Depends(oauth2_scheme), db: Session = De
     except JWTError:
         raise credentials_exception
 
-    user = db.query(UserModel).filter(UserModel.id == token_data.id).first()  # id로 조회
-    if user is None:
-        raise credentials_exception
-    return user
+    # 캐시에 없을 때만 읽기 전용 DB(복제본)에서 id로 조회
+    # (get_read_db 의존성을 쓰면 캐시 적중 시에도 커넥션을 받게 되므로 필요할 때만 세션을 염)
+    # 복제본에 아직 없는 사용자(가입 직후 복제 지연)는 primary에서 다시 조회한 뒤에만 인증 실패 처리
+    principal = principal_cache.get(token_data.id)
+    if principal is None:
+        user = await read_replica_router.get(request, UserModel, token_data.id)
+        if user is None:
+            raise credentials_exception
+        principal = Principal.model_validate(user)
+        principal_cache.set(principal)
+    return principal
 
-async def get_current_admin_user(current_user: UserModel = Depends(get_current_user)) -> UserModel:
+async def get_current_admin_user(current_user: Principal = Depends(get_current_user)) -> Principal:
     if current_user.role != "admin":
         raise HTTPException(status_code=403, detail="Not enough permissions")
     return current_user
@@ -0,0 +1,47 @@
+# app/core/startup.py
+# 기동 시간 측정은 app.main에서 가장 먼저 임포트하므로 표준 라이브러리만 사용
+import logging
+import time
+from contextlib import contextmanager
+
+logger = logging.getLogger("app.startup")
+
+
+class StartupTimer:
+    """
+    워커 프로세스 기동 단계별 소요 시간 기록
+    - phase(): 모듈 임포트 / 엔진 생성 / 라우터 등록 / startup 이벤트 단계별 소요 시간
+    - 첫 요청이 들어오면 app.main 임포트 시작부터 첫 요청까지 걸린 시간을 기록하고 한 번 로그로 남김
+    """
+
+    def __init__(self):
+        self.started_at = time.perf_counter()
+        self.phases = {}  # 단계 이름 -> 소요 시간(초), 실행 순서 유지
+        self.first_request_at = None
+
+    @contextmanager
+    def phase(self, name: str):
+        started_at = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phases[name] = time.perf_counter() - started_at
+
+    def first_request(self) -> None:
+        if self.first_request_at is not None:
+            return
+        self.first_request_at = time.perf_counter()
+        logger.info("worker startup: %s", self.report())
+
+    def report(self) -> dict:
+        time_to_first_request = None
+        if self.first_request_at is not None:
+            time_to_first_request = round((self.first_request_at - self.started_at) * 1000, 2)
+        return {
+            "phases_ms": {name: round(seconds * 1000, 2) for name, seconds in self.phases.items()},
+            "total_ms": round(sum(self.phases.values()) * 1000, 2),
+            "time_to_first_request_ms": time_to_first_request,
+        }
+
+
+startup_timer = StartupTimer()
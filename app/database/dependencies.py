@@ -1,8 +1,107 @@
-from app.database.session import SessionLocal
+import asyncio
+import time
+from contextlib import asynccontextmanager
 
-def get_db():
-    db = SessionLocal()
-    try:
+from fastapi import Request
+from sqlalchemy.exc import SQLAlchemyError
+
+from app.core.config import settings
+from app.database.session import ReadSessionLocal, SessionLocal
+
+# 요청 헤더에 지정하면 복제본 대신 primary에서 읽음 (방금 저장한 데이터를 복제 지연 없이 조회)
+READ_YOUR_WRITES_HEADER = "X-Read-Your-Writes"
+
+async def get_db():
+    async with SessionLocal() as db:
+        yield db
+
+
+class ReadReplicaRouter:
+    """
+    읽기 전용 요청의 DB 선택 (복제본 / primary)
+    - 복제본이 없거나, 요청 헤더 X-Read-Your-Writes가 true/1이면 primary에서 읽음
+    - 세션을 넘기기 전에 커넥션을 먼저 받아 두고, 복제본 연결에 실패하면 그 요청은 primary에서 읽음
+      (조회 도중에는 DB를 바꿀 수 없으므로 연결 시점에만 전환)
+    - 연결에 실패하면 retry_seconds 동안은 복제본을 시도하지 않고 바로 primary에서 읽음
+    - get(): 복제본에 없는 행은 primary에서 다시 조회 (가입 직후처럼 아직 복제되지 않은 행)
+    """
+
+    def __init__(self, session_factory, retry_seconds: float):
+        self.session_factory = session_factory
+        self.retry_seconds = retry_seconds
+        self.unavailable_until = 0.0
+        self.replica_reads = 0
+        self.primary_reads = 0
+        self.read_your_writes = 0
+        self.fallbacks = 0
+        self.replica_misses = 0
+        self.last_error = None
+
+    async def _open_replica(self, request: Request):
+        if self.session_factory is None:
+            return None
+        if request.headers.get(READ_YOUR_WRITES_HEADER, "").lower() in ("1", "true"):
+            self.read_your_writes += 1
+            return None
+        if time.monotonic() < self.unavailable_until:
+            return None
+
+        db = self.session_factory()
+        try:
+            await db.connection()
+        except (SQLAlchemyError, OSError, asyncio.TimeoutError) as exc:
+            await db.close()
+            self.fallbacks += 1
+            self.last_error = "{}: {}".format(type(exc).__name__, exc)
+            self.unavailable_until = time.monotonic() + self.retry_seconds
+            return None
+        return db
+
+    @asynccontextmanager
+    async def session(self, request: Request):
+        db = await self._open_replica(request)
+        if db is None:
+            self.primary_reads += 1
+            db = SessionLocal()
+        else:
+            self.replica_reads += 1
+        async with db:
+            yield db
+
+    async def get(self, request: Request, entity, ident):
+        """
+        기본 키로 한 행 조회 (복제본에서 찾지 못하면 primary에서 다시 조회)
+        """
+        db = await self._open_replica(request)
+        if db is not None:
+            self.replica_reads += 1
+            async with db:
+                obj = await db.get(entity, ident)
+            if obj is not None:
+                return obj
+            self.replica_misses += 1
+
+        self.primary_reads += 1
+        async with SessionLocal() as db:
+            return await db.get(entity, ident)
+
+    def stats(self) -> dict:
+        return {
+            "configured": self.session_factory is not None,
+            "available": self.session_factory is not None and time.monotonic() >= self.unavailable_until,
+            "replica_reads": self.replica_reads,
+            "primary_reads": self.primary_reads,
+            "read_your_writes": self.read_your_writes,
+            "fallbacks": self.fallbacks,
+            "replica_misses": self.replica_misses,
+            "last_error": self.last_error,
+        }
+
+
+read_replica_router = ReadReplicaRouter(ReadSessionLocal, settings.READ_REPLICA_RETRY_SECONDS)
+
+
+async def get_read_db(request: Request):
+    # 읽기 전용 API용 세션 (복제본, 사용할 수 없으면 primary)
+    async with read_replica_router.session(request) as db:
         yield db
-    finally:
-        db.close()
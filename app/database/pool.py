@@ -0,0 +1,110 @@
+# app/database/pool.py
+import time
+
+from sqlalchemy import event
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+# 체크아웃 대기 시간 분포 구간 (ms, 마지막 구간은 그 이상 전부)
+WAIT_BUCKETS_MS = (1, 5, 10, 50, 100, 500, 1000)
+
+
+class PoolStats:
+    """
+    커넥션 풀 사용 현황
+    - 체크아웃 대기 시간: 풀에 커넥션을 요청해서 받기까지 걸린 시간 (새 커넥션 생성 시간 포함)
+    - 현재/최대 체크아웃 수, pool_size를 넘어 생성된 overflow 커넥션 수, 타임아웃 수
+    - 대기 시간이 길고 체크아웃 수가 pool_size + max_overflow에 붙어 있으면 DB가 아니라 풀이 병목
+    """
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self.checkouts = 0
+        self.checked_out = 0
+        self.checked_out_max = 0
+        self.wait_seconds_total = 0.0
+        self.wait_seconds_max = 0.0
+        self.wait_buckets = [0] * (len(WAIT_BUCKETS_MS) + 1)
+        self.timeouts = 0
+        self.connects = 0
+        self.overflow_connects = 0
+        self.invalidations = 0
+
+    def record_wait(self, seconds: float) -> None:
+        self.wait_seconds_total += seconds
+        self.wait_seconds_max = max(self.wait_seconds_max, seconds)
+        waited_ms = seconds * 1000
+        index = next((i for i, bound in enumerate(WAIT_BUCKETS_MS) if waited_ms <= bound), len(WAIT_BUCKETS_MS))
+        self.wait_buckets[index] += 1
+
+    def stats(self) -> dict:
+        requests = sum(self.wait_buckets)
+        labels = ["<={}ms".format(bound) for bound in WAIT_BUCKETS_MS] + [">{}ms".format(WAIT_BUCKETS_MS[-1])]
+        return {
+            "checkouts": self.checkouts,
+            "checked_out": self.checked_out,
+            "checked_out_max": self.checked_out_max,
+            "avg_wait_ms": self.wait_seconds_total / requests * 1000 if requests else 0.0,
+            "max_wait_ms": self.wait_seconds_max * 1000,
+            "wait_histogram": dict(zip(labels, self.wait_buckets)),
+            "timeouts": self.timeouts,
+            "connects": self.connects,
+            "overflow_connects": self.overflow_connects,
+            "invalidations": self.invalidations,
+        }
+
+
+pool_stats = PoolStats()
+
+
+class InstrumentedAsyncQueuePool(AsyncAdaptedQueuePool):
+    """
+    체크아웃 대기 시간과 overflow 발생을 기록하는 AsyncAdaptedQueuePool
+    (체크아웃/체크인/연결/무효화 횟수는 listen_pool_events로 등록한 풀 이벤트에서 기록)
+    """
+
+    def _do_get(self):
+        started_at = time.perf_counter()
+        try:
+            connection = super()._do_get()
+        except PoolTimeoutError:
+            pool_stats.timeouts += 1
+            pool_stats.record_wait(time.perf_counter() - started_at)
+            raise
+
+        pool_stats.record_wait(time.perf_counter() - started_at)
+        return connection
+
+    def _create_connection(self):
+        # 새 커넥션 생성 직전에 overflow 카운터가 증가하므로,
+        # overflow()가 0을 넘으면 (-pool_size부터 시작) pool_size를 초과한 커넥션
+        if self.overflow() > 0:
+            pool_stats.overflow_connects += 1
+        return super()._create_connection()
+
+
+def listen_pool_events(pool) -> None:
+    """
+    체크아웃/체크인/연결/무효화 횟수를 기록하는 풀 이벤트 등록
+    (async 풀은 클래스 단위 등록을 지원하지 않으므로 엔진 생성 후 풀 인스턴스에 등록, dispose 후 재생성된 풀에도 유지됨)
+    """
+
+    @event.listens_for(pool, "connect")
+    def _on_connect(dbapi_connection, connection_record):
+        pool_stats.connects += 1
+
+    @event.listens_for(pool, "checkout")
+    def _on_checkout(dbapi_connection, connection_record, connection_proxy):
+        pool_stats.checkouts += 1
+        pool_stats.checked_out += 1
+        pool_stats.checked_out_max = max(pool_stats.checked_out_max, pool_stats.checked_out)
+
+    @event.listens_for(pool, "checkin")
+    def _on_checkin(dbapi_connection, connection_record):
+        pool_stats.checked_out -= 1
+
+    @event.listens_for(pool, "invalidate")
+    def _on_invalidate(dbapi_connection, connection_record, exception):
+        pool_stats.invalidations += 1
@@ -1,8 +1,43 @@
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
 from app.core.config import settings
+from app.database.pool import InstrumentedAsyncQueuePool, listen_pool_events
 
 SQLALCHEMY_DATABASE_URL = settings.DATABASE_URL
 
-engine = create_engine(SQLALCHEMY_DATABASE_URL)
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+def to_async_url(url: str):
+    # postgresql:// 또는 postgresql+psycopg2:// 형식의 URL을 asyncpg 드라이버용으로 변환
+    parsed = make_url(url)
+    if parsed.drivername in ("postgresql", "postgresql+psycopg2"):
+        parsed = parsed.set(drivername="postgresql+asyncpg")
+    return parsed
+
+engine = create_async_engine(
+    to_async_url(SQLALCHEMY_DATABASE_URL),
+    poolclass=InstrumentedAsyncQueuePool,  # 체크아웃 대기 시간/overflow 기록
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+    pool_timeout=settings.DB_POOL_TIMEOUT,
+    pool_recycle=settings.DB_POOL_RECYCLE,
+    pool_pre_ping=settings.DB_POOL_PRE_PING,
+)
+listen_pool_events(engine.sync_engine.pool)
+# 커밋 후에도 응답 생성 시 추가 조회가 발생하지 않도록 expire_on_commit=False
+SessionLocal = async_sessionmaker(bind=engine, autoflush=False, expire_on_commit=False)
+
+# 읽기 전용 복제본 엔진 (READ_REPLICA_DATABASE_URL을 지정한 경우에만 생성)
+# - 풀 지표(pool_stats)는 primary 풀 기준이므로 복제본 풀은 기본 풀 클래스 사용
+# - 복제본이 응답하지 않을 때 오래 기다리지 않도록 연결 대기 시간을 따로 지정
+read_engine = None
+ReadSessionLocal = None
+if settings.READ_REPLICA_DATABASE_URL:
+    read_engine = create_async_engine(
+        to_async_url(settings.READ_REPLICA_DATABASE_URL),
+        pool_size=settings.DB_POOL_SIZE,
+        max_overflow=settings.DB_MAX_OVERFLOW,
+        pool_timeout=settings.DB_POOL_TIMEOUT,
+        pool_recycle=settings.DB_POOL_RECYCLE,
+        pool_pre_ping=settings.DB_POOL_PRE_PING,
+        connect_args={"timeout": settings.READ_REPLICA_CONNECT_TIMEOUT},
+    )
+    ReadSessionLocal = async_sessionmaker(bind=read_engine, autoflush=False, expire_on_commit=False)
@@ -1,11 +1,17 @@
 # app/main.py
-from fastapi import FastAPI
-from fastapi.routing import APIRoute
-from starlette.middleware.cors import CORSMiddleware
+# 기동 단계별 시간 측정 (다른 모듈보다 먼저 임포트)
+from app.core.startup import startup_timer
 
-from app.api.main import api_router
-from app.database.base import Base
-from app.database.session import engine
+with startup_timer.phase("import"):
+    from fastapi import FastAPI
+    from fastapi.responses import PlainTextResponse
+    from fastapi.routing import APIRoute
+    from starlette.middleware.cors import CORSMiddleware
+
+    from app.core.metrics import MetricsMiddleware, listen_query_events, render_metrics
+
+with startup_timer.phase("engine"):
+    from app.database.session import engine, read_engine
 
 def custom_generate_unique_id(route: APIRoute) -> str:
     return f"{route.tags[0]}-{route.name}"
@@ -23,13 +29,48 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-app.include_router(api_router, prefix="/v1")
+# 라우트별 지연 시간 / 요청당 SQL 수 / DB 시간 수집
+app.add_middleware(MetricsMiddleware)
+listen_query_events(engine.sync_engine)
+if read_engine is not None:
+    listen_query_events(read_engine.sync_engine)
+
+# 라우터 모듈 임포트(스키마/모델/서비스 포함)와 라우트 등록
+with startup_timer.phase("routers"):
+    from app.api.main import api_router
+
+    app.include_router(api_router, prefix="/v1")
+
+
+# Prometheus 수집용 지표 (text 형식)
+@app.get("/metrics", tags=["metrics"], include_in_schema=False)
+def metrics():
+    return PlainTextResponse(render_metrics(), media_type="text/plain; version=0.0.4")
 
-# 애플리케이션 시작 시 모델을 임포트한 후 테이블 생성
+# 애플리케이션 시작 시 처리
+# - 테이블 생성/변경은 배포 시 마이그레이션(alembic upgrade head)으로 한 번만 수행하고, 워커 기동 시에는 DDL을 실행하지 않음
 @app.on_event("startup")
-def on_startup():
-    # 모델 임포트
-    from app.models import user, reservation, exam_schedule
+async def on_startup():
+    from app.services.group_id import sync_reservation_group_id_seq
+
+    with startup_timer.phase("startup"):
+        # 예약 그룹 ID 시퀀스를 기존 데이터의 최대값 이후로 맞춤
+        async with engine.begin() as conn:
+            await conn.run_sync(sync_reservation_group_id_seq)
+
+        # 대기열 모드이면 예약 신청 처리 워커 시작
+        from app.services.reservation_queue import reservation_queue_worker
+
+        if reservation_queue_worker is not None:
+            reservation_queue_worker.start()
+
+
+# 애플리케이션 종료 시 예약 신청 처리 워커 / 비밀번호 해싱 스레드 풀 정리
+@app.on_event("shutdown")
+async def on_shutdown():
+    from app.core.security import password_hasher
+    from app.services.reservation_queue import reservation_queue_worker
 
-    # Base.metadata.drop_all(bind=engine)  # 기존 테이블 삭제 (데이터 초기화됨)
-    Base.metadata.create_all(bind=engine)
+    if reservation_queue_worker is not None:
+        await reservation_queue_worker.stop()
+    password_hasher.shutdown()
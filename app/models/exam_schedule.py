@@ -1,4 +1,4 @@
-from sqlalchemy import Column, BigInteger, Integer, Boolean, Date
+from sqlalchemy import Column, BigInteger, Integer, Boolean, Date, UniqueConstraint
 from sqlalchemy.orm import relationship
 from app.database.base import Base
 
@@ -13,3 +13,8 @@ class ExamSchedule(Base):
 
     # 관계 설정
     reservations = relationship("Reservation", back_populates="exam_schedule")
+
+    __table_args__ = (
+        # 시간대(date, start_hour, end_hour)당 일정은 하나 (ON CONFLICT 대상, 시간대 조회 인덱스 겸용)
+        UniqueConstraint("date", "start_hour", "end_hour", name="uq_exam_schedules_slot"),
+    )
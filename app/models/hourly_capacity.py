@@ -0,0 +1,10 @@
+from sqlalchemy import Column, Integer, Date
+from app.database.base import Base
+
+class HourlyCapacity(Base):
+    __tablename__ = "hourly_capacities"
+
+    # (날짜, 시간) 단위로 확정된 예약 인원을 누적하는 용량 장부
+    date = Column(Date, primary_key=True)  # 날짜
+    hour = Column(Integer, primary_key=True)  # 시간 (0~23)
+    confirmed_count = Column(Integer, nullable=False, default=0)  # 해당 시간의 확정된 예약 인원
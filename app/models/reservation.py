@@ -1,13 +1,16 @@
-from sqlalchemy import Column, BigInteger, Integer, Boolean, Date, DateTime, ForeignKey
+from sqlalchemy import Column, BigInteger, Integer, Boolean, Date, DateTime, ForeignKey, Index, Sequence, text
 from sqlalchemy.orm import relationship
 from app.database.base import Base
 from sqlalchemy.sql import func
 
+# 예약 그룹 ID 발급용 시퀀스 (컬럼 기본값으로 연결하지 않고 그룹 단위로 직접 발급)
+reservation_group_id_seq = Sequence("reservation_group_id_seq", metadata=Base.metadata)
+
 class Reservation(Base):
     __tablename__ = "reservations"
 
     id = Column(BigInteger, primary_key=True, index=True, autoincrement=True)
-    reservation_group_id = Column(BigInteger, index=True, nullable=False)
+    reservation_group_id = Column(BigInteger, nullable=False)
     user_id = Column(BigInteger, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
     exam_schedule_id = Column(BigInteger, ForeignKey("exam_schedules.id", ondelete="CASCADE"), nullable=True)
     date = Column(Date, nullable=False)  # 예약 날짜 (YYYY-MM-DD)
@@ -17,7 +20,18 @@ class Reservation(Base):
     is_confirmed = Column(Boolean, default=False)  # 확정 여부
     created_at = Column(DateTime, server_default=func.now())  # 자동 생성
     updated_at = Column(DateTime, nullable=True, server_default=func.now(), onupdate=func.now())  # 예약 변경 시 자동 갱신
+    # 예약 그룹 버전 (낙관적 동시성 제어): 그룹을 수정/확정할 때 변경된 행에 (그룹 버전 + 1) 저장, 그룹 버전은 최대값
+    version = Column(Integer, nullable=False, default=1, server_default=text("1"))
 
     # 관계 설정
     user = relationship("User", back_populates="reservations")
     exam_schedule = relationship("ExamSchedule", back_populates="reservations")
+
+    __table_args__ = (
+        # 그룹 조회/키셋 페이지네이션: reservation_group_id 순서 + 그룹 내 날짜순
+        Index("ix_reservations_group_id_date", "reservation_group_id", "date"),
+        # 사용자 예약 조회: user_id + 날짜 필터
+        Index("ix_reservations_user_id_date", "user_id", "date"),
+        # 시험 일정 삭제 시 FK CASCADE로 연결된 예약 조회 (인덱스가 없으면 일정마다 전체 스캔)
+        Index("ix_reservations_exam_schedule_id", "exam_schedule_id"),
+    )
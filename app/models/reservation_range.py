@@ -0,0 +1,34 @@
+from sqlalchemy import Column, BigInteger, Integer, Boolean, DateTime, ForeignKey, Index, text
+from sqlalchemy.sql import func
+from app.database.base import Base
+
+class ReservationRange(Base):
+    """
+    구간 저장 방식(RESERVATION_STORAGE_MODE=range)의 예약 그룹: 그룹당 한 행
+    - [start_at, end_at) 구간을 저장하고 일자별 예약은 조회 시 계산
+    - daily_window가 False면 start_at부터 end_at까지 이어지는 구간
+    - daily_window가 True면 매일 start_at의 시간부터 end_at의 시간까지 반복되는 구간 (관리자 수정)
+    """
+    __tablename__ = "reservation_ranges"
+
+    reservation_group_id = Column(BigInteger, primary_key=True, autoincrement=False)
+    user_id = Column(BigInteger, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
+    start_at = Column(DateTime, nullable=False)  # 구간 시작 (첫날 날짜 + 시작 시간)
+    end_at = Column(DateTime, nullable=False)  # 구간 종료 (마지막 날 날짜 + 종료 시간, 미포함)
+    daily_window = Column(Boolean, nullable=False, default=False)  # 매일 같은 시간대 반복 여부
+    reserved_count = Column(Integer, nullable=False)  # 예약 인원
+    is_confirmed = Column(Boolean, nullable=False, default=False)  # 확정 여부
+    created_at = Column(DateTime, server_default=func.now())  # 자동 생성
+    updated_at = Column(DateTime, nullable=True, server_default=func.now(), onupdate=func.now())  # 예약 변경 시 자동 갱신
+    version = Column(Integer, nullable=False, default=1, server_default=text("1"))  # 예약 그룹 버전 (수정/확정 시 1 증가)
+
+    __table_args__ = (
+        # 기간 겹침 조회(&&): tsrange(start_at, end_at)에 대한 GiST 인덱스
+        Index(
+            "ix_reservation_ranges_period",
+            func.tsrange(start_at, end_at),
+            postgresql_using="gist",
+        ),
+        # 사용자 예약 조회
+        Index("ix_reservation_ranges_user_id", "user_id", "reservation_group_id"),
+    )
@@ -1,4 +1,4 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 from datetime import date, datetime
 from typing import List, Optional
 
@@ -41,11 +41,39 @@ class ReservationGroupOut(BaseModel):
     end_hour: int
     reserved_count: int
     is_confirmed: bool
-    reservations: List[ReservationOut]
+    version: int  # 예약 그룹 버전 (수정/삭제/확정 요청의 version에 전달)
+    reservations: Optional[List[ReservationOut]] = None  # include_reservations=true 인 경우에만 포함
 
     class Config:
         from_attributes = True
 
+class ReservationGroupPage(BaseModel):
+    items: List[ReservationGroupOut]
+    next_cursor: Optional[str] = None  # 다음 페이지 조회용 커서 (마지막 페이지면 None)
+
+class UserReservationDayOut(BaseModel):
+    reservation_id: int
+    date: date
+    start_hour: int
+    end_hour: int
+    reserved_count: int
+    is_confirmed: bool
+
+class UserReservationGroupOut(BaseModel):
+    reservation_group_id: int
+    start_date: date
+    end_date: date
+    start_hour: int
+    end_hour: int
+    reserved_count: int
+    is_confirmed: bool
+    version: int  # 예약 그룹 버전 (수정/삭제 요청의 version에 전달)
+    reservations: Optional[List[UserReservationDayOut]] = None  # include_reservations=true 인 경우에만 포함
+
+class UserReservationGroupPage(BaseModel):
+    items: List[UserReservationGroupOut]
+    next_cursor: Optional[str] = None  # 다음 페이지 조회용 커서 (마지막 페이지면 None)
+
 class ReservationUpdate(BaseModel):
     start_date: date
     start_hour: int
@@ -53,6 +81,7 @@ class ReservationUpdate(BaseModel):
     end_hour: int
     reserved_count: int
     updated_at: datetime = None
+    version: Optional[int] = None  # 조회한 예약 그룹 버전 (지정하면 현재 버전과 다를 때 409)
 
     class Config:
         from_attributes = True
@@ -65,6 +94,45 @@ class ReservationUpdateAdmin(BaseModel):
     reserved_count: int
     is_confirmed: Optional[bool] = None  # 선택적 필드
     updated_at: datetime = None
+    version: Optional[int] = None  # 조회한 예약 그룹 버전 (지정하면 현재 버전과 다를 때 409)
 
     class Config:
         from_attributes = True
+
+class ReservationBatchConfirm(BaseModel):
+    # reservation_group_ids를 지정하지 않으면 필터 조건에 맞는 미확정 그룹을 limit개까지 확정
+    reservation_group_ids: Optional[List[int]] = None
+    start_date: Optional[date] = None
+    end_date: Optional[date] = None
+    user_id: Optional[int] = None
+    limit: int = Field(1000, ge=1, le=10000)
+
+class ReservationConfirmResult(BaseModel):
+    reservation_group_id: int
+    success: bool
+    detail: Optional[str] = None  # 실패 사유
+
+class ReservationBatchConfirmOut(BaseModel):
+    confirmed_count: int
+    failed_count: int
+    results: List[ReservationConfirmResult]
+
+class ReservationImportOut(BaseModel):
+    imported_groups: int  # 가져온 예약 그룹 수 (CSV 행 수)
+    imported_reservations: int  # 일자별로 펼친 예약 수
+    confirmed_groups: int  # 확정 상태로 가져온 예약 그룹 수
+
+class ReservationTicketOut(BaseModel):
+    ticket_id: str
+    status: str  # queued / done / failed
+    reservation_group_id: Optional[int] = None  # done인 경우 생성된 예약 그룹 ID
+    reservations: Optional[List[ReservationOut]] = None  # done인 경우 생성된 일자별 예약
+    detail: Optional[str] = None  # failed인 경우 실패 사유
+
+class AvailabilityDayOut(BaseModel):
+    date: date
+    remaining: List[int]  # 0~23시 시간별 남은 인원 (인덱스 = 시간)
+
+class AvailabilityOut(BaseModel):
+    max_capacity: int  # 시간당 최대 수용 인원
+    days: List[AvailabilityDayOut]
@@ -0,0 +1,127 @@
+# app/services/availability.py
+import asyncio
+import time
+from datetime import date, timedelta
+from typing import Dict, Iterable, List, Optional
+
+from sqlalchemy import event, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.models.exam_schedule import ExamSchedule
+
+# 세션에 기록해두는 "변경된 날짜" 키 (commit 시 캐시 무효화, rollback 시 폐기)
+_DIRTY_DATES_KEY = "availability_dirty_dates"
+
+
+class AvailabilityCache:
+    """
+    날짜 -> 시간(0~23)별 확정 인원 프로세스 내 캐시
+    - 없는 날짜는 `exam_schedules` 한 번의 조회로 채움 (동시 요청은 잠금으로 한 번만 조회)
+    - `exam_schedules`를 변경한 트랜잭션이 커밋되면 해당 날짜만 무효화
+    - 다른 워커의 변경은 TTL이 지나면 반영
+    """
+
+    def __init__(self, ttl_seconds: float):
+        self.ttl_seconds = ttl_seconds
+        self._entries = {}  # date -> (만료 시각, 시간별 확정 인원 리스트)
+        self._lock: Optional[asyncio.Lock] = None
+        self._generation = 0  # 무효화할 때마다 증가 (조회 중 무효화된 결과는 저장하지 않음)
+        self.hits = 0
+        self.misses = 0
+
+    def _get(self, day: date, now: float) -> Optional[List[int]]:
+        entry = self._entries.get(day)
+        if entry is None or entry[0] < now:
+            return None
+        return entry[1]
+
+    async def get_confirmed_counts(self, db: AsyncSession, start_date: date, end_date: date) -> Dict[date, List[int]]:
+        """
+        기간 내 날짜별 시간대 확정 인원을 반환 (캐시에 없는 날짜만 DB에서 조회)
+        """
+        days = [start_date + timedelta(days=i) for i in range((end_date - start_date).days + 1)]
+        now = time.monotonic()
+        result = {day: self._get(day, now) for day in days}
+        missing = [day for day, counts in result.items() if counts is None]
+        self.hits += len(days) - len(missing)
+        if not missing:
+            return result
+
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        async with self._lock:
+            # 잠금을 기다리는 동안 다른 요청이 채웠을 수 있으므로 다시 확인
+            now = time.monotonic()
+            for day in missing:
+                result[day] = self._get(day, now)
+            missing = [day for day in missing if result[day] is None]
+            if missing:
+                self.misses += len(missing)
+                generation = self._generation
+                loaded = await _load_hourly_counts(db, min(missing), max(missing))
+                expires_at = time.monotonic() + self.ttl_seconds
+                for day in missing:
+                    counts = loaded.get(day, [0] * 24)
+                    if self.ttl_seconds > 0 and generation == self._generation:
+                        self._entries[day] = (expires_at, counts)
+                    result[day] = counts
+        return result
+
+    def invalidate(self, days: Iterable[date]) -> None:
+        self._generation += 1
+        for day in days:
+            self._entries.pop(day, None)
+
+    def clear(self) -> None:
+        self._generation += 1
+        self._entries.clear()
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "ttl_seconds": self.ttl_seconds,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": self.hits / lookups if lookups else 0.0,
+        }
+
+
+async def _load_hourly_counts(db: AsyncSession, start_date: date, end_date: date) -> Dict[date, List[int]]:
+    """
+    `exam_schedules`의 시간대별 확정 인원을 날짜별 24시간 배열로 펼친다.
+    """
+    result = await db.execute(
+        select(ExamSchedule.date, ExamSchedule.start_hour, ExamSchedule.end_hour, ExamSchedule.total_reserved_count)
+        .where(ExamSchedule.date >= start_date, ExamSchedule.date <= end_date)
+    )
+    counts: Dict[date, List[int]] = {}
+    for row in result:
+        hours = counts.setdefault(row.date, [0] * 24)
+        for hour in range(max(row.start_hour, 0), min(row.end_hour, 24)):
+            hours[hour] += row.total_reserved_count
+    return counts
+
+
+def mark_dates_dirty(db: AsyncSession, days: Iterable[date]) -> None:
+    """
+    현재 트랜잭션에서 `exam_schedules`가 바뀐 날짜를 기록 (커밋 후 캐시에서 제거)
+    """
+    db.info.setdefault(_DIRTY_DATES_KEY, set()).update(days)
+
+
+availability_cache = AvailabilityCache(ttl_seconds=settings.AVAILABILITY_CACHE_TTL_SECONDS)
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_committed_dates(session, *args):
+    dirty = session.info.pop(_DIRTY_DATES_KEY, None)
+    if dirty:
+        availability_cache.invalidate(dirty)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_dirty_dates(session, *args):
+    session.info.pop(_DIRTY_DATES_KEY, None)
@@ -0,0 +1,149 @@
+# app/services/capacity.py
+from collections import defaultdict
+from datetime import date
+from typing import Dict, Iterable, Tuple
+
+from sqlalchemy import Date, Integer, cast, func, literal, select, text
+from sqlalchemy.dialects.postgresql import ARRAY, insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.models.hourly_capacity import HourlyCapacity
+
+# (date, start_hour, end_hour, reserved_count) 형태의 시간대 단위 예약 정보
+Slot = Tuple[date, int, int, int]
+
+
+async def load_confirmed_counts(db: AsyncSession, start_date: date, end_date: date) -> Dict[Tuple[date, int], int]:
+    """
+    기간 내 (날짜, 시간)별 확정 인원을 한 번의 조회로 가져온다.
+    - 장부에 행이 없는 시간은 확정 인원 0으로 간주
+    """
+    result = await db.execute(
+        select(HourlyCapacity.date, HourlyCapacity.hour, HourlyCapacity.confirmed_count)
+        .where(HourlyCapacity.date >= start_date, HourlyCapacity.date <= end_date)
+    )
+    return {(row.date, row.hour): row.confirmed_count for row in result}
+
+
+async def lock_confirmed_counts(db: AsyncSession, slots: Iterable[Slot]) -> Dict[Tuple[date, int], int]:
+    """
+    슬롯들이 걸친 (날짜, 시간)의 장부 행을 잠근 뒤 확정 인원을 반환한다.
+    - 확정 인원을 바꾸는 작업(확정/확정 예약 수정)은 검증 전에 호출해서, 같은 시간을 검증하는 트랜잭션끼리만 순서대로 실행되게 함
+      (겹치지 않는 시간의 확정은 서로 기다리지 않음)
+    - 모든 트랜잭션이 (날짜, 시간) 순으로 잠그므로 교착 상태가 생기지 않음
+    - 장부에 없는 시간은 0명 행을 먼저 만들어서 잠금 (잠금은 커밋/롤백 시 해제)
+    """
+    keys = sorted({(slot[0], hour) for slot in slots for hour in range(slot[1], slot[2])})
+    if not keys:
+        return {}
+
+    wanted = select(
+        func.unnest(cast([key[0] for key in keys], ARRAY(Date))).label("date"),
+        func.unnest(cast([key[1] for key in keys], ARRAY(Integer))).label("hour"),
+    ).subquery()
+
+    await db.execute(
+        insert(HourlyCapacity)
+        .from_select(["date", "hour", "confirmed_count"], select(wanted.c.date, wanted.c.hour, literal(0)))
+        .on_conflict_do_nothing(index_elements=[HourlyCapacity.date, HourlyCapacity.hour])
+    )
+    result = await db.execute(
+        select(HourlyCapacity.date, HourlyCapacity.hour, HourlyCapacity.confirmed_count)
+        .join(wanted, (HourlyCapacity.date == wanted.c.date) & (HourlyCapacity.hour == wanted.c.hour))
+        .order_by(HourlyCapacity.date, HourlyCapacity.hour)
+        .with_for_update(of=HourlyCapacity)
+    )
+    return {(row.date, row.hour): row.confirmed_count for row in result}
+
+
+def exceeds_capacity(
+    confirmed_counts: Dict[Tuple[date, int], int],
+    slot_date: date,
+    start_hour: int,
+    end_hour: int,
+    reserved_count: int,
+) -> bool:
+    """
+    해당 시간대의 어느 한 시간이라도 최대 수용 인원을 초과하는지 확인
+    """
+    peak = max(
+        (confirmed_counts.get((slot_date, hour), 0) for hour in range(start_hour, end_hour)),
+        default=0,
+    )
+    return peak + reserved_count > settings.MAX_CAPACITY_PER_HOUR
+
+
+async def apply_confirmed_deltas(db: AsyncSession, slots: Iterable[Slot], sign: int = 1) -> None:
+    """
+    확정/확정 취소된 예약 인원을 장부에 반영한다.
+    - 같은 (날짜, 시간)의 변경분은 합산 후 한 번의 UPSERT로 반영
+    - 호출한 트랜잭션 안에서 실행되므로 commit/rollback은 호출 측에서 처리
+    """
+    deltas: Dict[Tuple[date, int], int] = defaultdict(int)
+    for slot_date, start_hour, end_hour, reserved_count in slots:
+        for hour in range(start_hour, end_hour):
+            deltas[(slot_date, hour)] += sign * reserved_count
+
+    values = [
+        {"date": slot_date, "hour": hour, "confirmed_count": delta}
+        for (slot_date, hour), delta in sorted(deltas.items())
+        if delta
+    ]
+    if not values:
+        return
+
+    stmt = insert(HourlyCapacity).values(values)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[HourlyCapacity.date, HourlyCapacity.hour],
+        set_={"confirmed_count": HourlyCapacity.confirmed_count + stmt.excluded.confirmed_count},
+    )
+    await db.execute(stmt)
+
+
+# 확정된 예약의 일자별 시간대 (일자별 저장 + 구간 저장, days_from_range와 같은 방식으로 구간을 펼침)
+CONFIRMED_DAYS_SQL = (
+    "SELECT date, start_hour, end_hour, reserved_count FROM reservations WHERE is_confirmed "
+    "UNION ALL "
+    "SELECT d::date, "
+    "CASE WHEN r.daily_window OR d::date = r.start_at::date THEN extract(hour FROM r.start_at)::int ELSE 0 END, "
+    "CASE WHEN r.daily_window OR d::date = (r.end_at - INTERVAL '1 microsecond')::date "
+    "THEN COALESCE(NULLIF(extract(hour FROM r.end_at)::int, 0), 24) ELSE 24 END, "
+    "r.reserved_count "
+    "FROM reservation_ranges r, "
+    "generate_series(r.start_at::date, (r.end_at - INTERVAL '1 microsecond')::date, INTERVAL '1 day') d "
+    "WHERE r.is_confirmed"
+)
+
+
+async def rebuild_confirmed_counts(db: AsyncSession) -> dict:
+    """
+    확정된 예약으로 장부 전체를 다시 계산한다. (장부 도입 전 데이터 초기화 / 장부 불일치 복구용)
+    - 장부를 바꾸는 트랜잭션(확정/수정/가져오기)이 끝날 때까지 기다린 뒤 장부를 잠그고 계산
+    - 호출한 트랜잭션 안에서 실행되므로 commit/rollback은 호출 측에서 처리
+    """
+    await db.execute(text("LOCK TABLE hourly_capacities IN EXCLUSIVE MODE"))
+    await db.execute(
+        text(
+            "CREATE TEMP TABLE hourly_capacities_rebuild ON COMMIT DROP AS "
+            "SELECT date, hour, sum(reserved_count)::int AS confirmed_count "
+            "FROM (" + CONFIRMED_DAYS_SQL + ") days(date, start_hour, end_hour, reserved_count), "
+            "generate_series(start_hour, end_hour - 1) AS g(hour) "
+            "GROUP BY date, hour"
+        )
+    )
+    changed_hours = await db.scalar(
+        text(
+            "SELECT count(*) FROM hourly_capacities_rebuild e "
+            "FULL JOIN hourly_capacities c ON c.date = e.date AND c.hour = e.hour "
+            "WHERE COALESCE(e.confirmed_count, 0) <> COALESCE(c.confirmed_count, 0)"
+        )
+    )
+    await db.execute(text("DELETE FROM hourly_capacities"))
+    hours = await db.execute(
+        text(
+            "INSERT INTO hourly_capacities (date, hour, confirmed_count) "
+            "SELECT date, hour, confirmed_count FROM hourly_capacities_rebuild WHERE confirmed_count <> 0"
+        )
+    )
+    return {"hours": hours.rowcount, "changed_hours": changed_hours}
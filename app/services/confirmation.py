@@ -0,0 +1,100 @@
+# app/services/confirmation.py
+from collections import defaultdict
+from datetime import date, datetime
+from typing import Dict, List, Sequence, Tuple
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.services.capacity import apply_confirmed_deltas, lock_confirmed_counts
+from app.services.exam_schedule import add_to_exam_schedules
+from app.services.reservation_store import load_unconfirmed_groups, mark_confirmed
+
+
+async def confirm_groups(db: AsyncSession, group_ids: Sequence[int], now: datetime) -> List[dict]:
+    """
+    여러 예약 그룹을 한 번에 확정한다.
+    - 대상 예약과 시간별 확정 인원을 각각 한 번의 조회로 가져옴 (둘 다 트랜잭션 끝까지 잠금)
+    - 그룹 ID 순서대로 확정 가능 여부를 판단하고, 앞서 승인된 그룹의 인원을 누적해 다음 그룹 검증에 반영
+    - 승인된 그룹의 장부/시험 일정/예약 상태는 일괄 UPSERT·UPDATE로 반영 (commit은 호출 측에서 처리)
+    - 그룹별 성공/실패 결과를 반환
+    """
+    group_ids = sorted(set(group_ids))
+    if not group_ids:
+        return []
+
+    rows = await load_unconfirmed_groups(db, group_ids)
+
+    rows_by_group = defaultdict(list)
+    for row in rows:
+        rows_by_group[row.reservation_group_id].append(row)
+
+    # 대상 예약이 걸친 시간의 장부 행을 잠근 뒤 확정 인원 조회 (같은 시간을 확정하는 다른 요청은 커밋까지 대기)
+    confirmed_counts = await lock_confirmed_counts(db, [(row.date, row.start_hour, row.end_hour) for row in rows])
+
+    results = []
+    accepted_rows = []
+    for group_id in group_ids:
+        group_rows = rows_by_group.get(group_id)
+        if not group_rows:
+            results.append({
+                "reservation_group_id": group_id,
+                "success": False,
+                "detail": "해당 예약 그룹을 찾을 수 없거나 이미 확정된 예약입니다.",
+            })
+            continue
+
+        # 시작 시간이 현재 시간을 지난 예약이 있는지 확인
+        started = next(
+            (
+                row for row in group_rows
+                if datetime.combine(row.date, datetime.min.time()).replace(hour=row.start_hour) < now
+            ),
+            None,
+        )
+        if started:
+            results.append({
+                "reservation_group_id": group_id,
+                "success": False,
+                "detail": f"{started.date} {started.start_hour}:00 ~ {started.end_hour}:00 예약은 이미 시작되어 확정할 수 없습니다.",
+            })
+            continue
+
+        # 그룹 전체의 시간별 증가분을 누적 확정 인원과 비교
+        group_deltas: Dict[Tuple[date, int], int] = defaultdict(int)
+        for row in group_rows:
+            for hour in range(row.start_hour, row.end_hour):
+                group_deltas[(row.date, hour)] += row.reserved_count
+
+        exceeded = next(
+            (
+                key for key, delta in sorted(group_deltas.items())
+                if confirmed_counts.get(key, 0) + delta > settings.MAX_CAPACITY_PER_HOUR
+            ),
+            None,
+        )
+        if exceeded:
+            results.append({
+                "reservation_group_id": group_id,
+                "success": False,
+                "detail": f"{exceeded[0]} {exceeded[1]}:00 시간대의 예약이 인원 초과로 확정 불가",
+            })
+            continue
+
+        for key, delta in group_deltas.items():
+            confirmed_counts[key] = confirmed_counts.get(key, 0) + delta
+        accepted_rows.extend(group_rows)
+        results.append({"reservation_group_id": group_id, "success": True, "detail": None})
+
+    if accepted_rows:
+        accepted_slots = [(row.date, row.start_hour, row.end_hour, row.reserved_count) for row in accepted_rows]
+        schedule_ids = await add_to_exam_schedules(db, accepted_slots)
+
+        # 예약 확정 및 `exam_schedule_id` 일괄 갱신
+        await mark_confirmed(db, accepted_rows, schedule_ids)
+
+        # 시간별 용량 장부에 확정 인원 반영
+        await apply_confirmed_deltas(db, accepted_slots)
+
+    return results
+
@@ -0,0 +1,86 @@
+# app/services/exam_schedule.py
+from collections import defaultdict
+from datetime import date
+from typing import Dict, Iterable, Tuple
+
+from sqlalchemy import bindparam, delete, tuple_, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.exam_schedule import ExamSchedule
+from app.services.availability import mark_dates_dirty
+from app.services.capacity import Slot
+
+# (date, start_hour, end_hour)
+SlotKey = Tuple[date, int, int]
+
+
+def _sum_by_slot(slots: Iterable[Slot]) -> Dict[SlotKey, int]:
+    """
+    같은 시간대(date, start_hour, end_hour)의 예약 인원을 합산
+    """
+    totals: Dict[SlotKey, int] = defaultdict(int)
+    for slot_date, start_hour, end_hour, reserved_count in slots:
+        totals[(slot_date, start_hour, end_hour)] += reserved_count
+    return totals
+
+
+async def add_to_exam_schedules(db: AsyncSession, slots: Iterable[Slot]) -> Dict[SlotKey, int]:
+    """
+    확정된 예약 인원을 `exam_schedules`에 반영하고, 시간대별 일정 ID를 반환한다.
+    - 시간대 유니크 제약을 이용한 INSERT ... ON CONFLICT DO UPDATE 한 번으로 생성/증가를 원자적으로 처리
+    - 호출한 트랜잭션 안에서 실행되므로 commit/rollback은 호출 측에서 처리
+    - 변경된 날짜는 커밋 후 예약 가능 인원 캐시에서 제거됨
+    """
+    totals = _sum_by_slot(slots)
+    if not totals:
+        return {}
+    mark_dates_dirty(db, (key[0] for key in totals))
+
+    stmt = insert(ExamSchedule).values(
+        [
+            {"date": key[0], "start_hour": key[1], "end_hour": key[2], "total_reserved_count": total}
+            for key, total in sorted(totals.items())
+        ]
+    )
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[ExamSchedule.date, ExamSchedule.start_hour, ExamSchedule.end_hour],
+        set_={"total_reserved_count": ExamSchedule.total_reserved_count + stmt.excluded.total_reserved_count},
+    ).returning(ExamSchedule.id, ExamSchedule.date, ExamSchedule.start_hour, ExamSchedule.end_hour)
+
+    result = await db.execute(stmt)
+    return {(row.date, row.start_hour, row.end_hour): row.id for row in result}
+
+
+async def subtract_from_exam_schedules(db: AsyncSession, slots: Iterable[Slot]) -> None:
+    """
+    확정 취소된 예약 인원을 `exam_schedules`에서 차감한다.
+    - 시간대별 감소는 조회 없이 `total_reserved_count - x` UPDATE로 처리
+    - 인원이 0 이하가 된 일정은 삭제 (FK CASCADE로 연결된 예약도 삭제되므로 해당 예약을 정리하는 경우에만 호출)
+    """
+    totals = _sum_by_slot(slots)
+    if not totals:
+        return
+    mark_dates_dirty(db, (key[0] for key in totals))
+
+    schedules = ExamSchedule.__table__
+    await db.execute(
+        update(schedules)
+        .where(
+            schedules.c.date == bindparam("slot_date"),
+            schedules.c.start_hour == bindparam("slot_start_hour"),
+            schedules.c.end_hour == bindparam("slot_end_hour"),
+        )
+        .values(total_reserved_count=schedules.c.total_reserved_count - bindparam("delta")),
+        [
+            {"slot_date": key[0], "slot_start_hour": key[1], "slot_end_hour": key[2], "delta": total}
+            for key, total in sorted(totals.items())
+        ],
+    )
+
+    await db.execute(
+        delete(schedules).where(
+            tuple_(schedules.c.date, schedules.c.start_hour, schedules.c.end_hour).in_(sorted(totals)),
+            schedules.c.total_reserved_count <= 0,
+        )
+    )
@@ -0,0 +1,60 @@
+# app/services/group_id.py
+from collections import deque
+
+from sqlalchemy import func, select, text
+from sqlalchemy.engine import Connection
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.models.reservation import Reservation, reservation_group_id_seq
+from app.models.reservation_range import ReservationRange
+
+
+class ReservationGroupIdAllocator:
+    """
+    예약 그룹 ID 발급기
+    - 시퀀스에서 block_size 개의 ID를 한 번에 받아 워커 메모리에 보관
+    - 보관 중인 ID가 남아있는 동안에는 DB 왕복 없이 발급
+    - nextval은 트랜잭션과 무관하게 증가하므로 롤백/재시작 시 ID에 빈 번호가 생길 수 있음
+    - 동시에 블록을 받아오더라도 시퀀스 값은 중복되지 않으므로 별도의 락은 두지 않음
+    """
+
+    def __init__(self, block_size: int):
+        self.block_size = block_size
+        self._ids = deque()
+
+    async def next_id(self, db: AsyncSession) -> int:
+        if not self._ids:
+            block = await db.scalars(
+                select(reservation_group_id_seq.next_value()).select_from(
+                    func.generate_series(1, self.block_size)
+                )
+            )
+            self._ids.extend(block.all())
+        return self._ids.popleft()
+
+
+def sync_reservation_group_id_seq(conn: Connection) -> None:
+    """
+    기존 데이터(일자별/구간 저장 방식 모두)의 최대 reservation_group_id보다 시퀀스가 뒤처져 있으면 앞으로 당긴다.
+    (MAX + 1 방식으로 발급된 기존 그룹과 ID가 겹치지 않도록 하기 위함)
+    """
+    max_group_id = conn.scalar(
+        select(
+            func.greatest(
+                select(func.max(Reservation.reservation_group_id)).scalar_subquery(),
+                select(func.max(ReservationRange.reservation_group_id)).scalar_subquery(),
+            )
+        )
+    )
+    if max_group_id:
+        conn.execute(
+            text(
+                "SELECT setval('reservation_group_id_seq', "
+                "GREATEST(:max_group_id, (SELECT last_value FROM reservation_group_id_seq)))"
+            ),
+            {"max_group_id": max_group_id},
+        )
+
+
+group_id_allocator = ReservationGroupIdAllocator(settings.RESERVATION_GROUP_ID_BLOCK_SIZE)
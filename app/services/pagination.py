@@ -0,0 +1,19 @@
+# app/services/pagination.py
+import base64
+import json
+
+from fastapi import HTTPException
+
+
+def encode_cursor(last_group_id: int) -> str:
+    # 클라이언트가 내부 구조에 의존하지 않도록 불투명한 문자열로 인코딩
+    raw = json.dumps({"g": last_group_id}, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> int:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        return int(json.loads(base64.urlsafe_b64decode(padded.encode()))["g"])
+    except (ValueError, KeyError, TypeError):
+        raise HTTPException(status_code=400, detail="잘못된 cursor 값입니다.")
@@ -0,0 +1,115 @@
+# app/services/reservation_export.py
+import csv
+import io
+from typing import AsyncIterator, Sequence
+
+import orjson
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.reservation import Reservation
+from app.models.reservation_range import ReservationRange
+from app.services.reservation_groups import GroupFilters
+from app.services.reservation_ranges import days_from_range, use_range_storage
+
+# 내보내기 컬럼 (ReservationOut과 같은 필드)
+EXPORT_COLUMNS = (
+    "id",
+    "reservation_group_id",
+    "user_id",
+    "date",
+    "start_hour",
+    "end_hour",
+    "reserved_count",
+    "is_confirmed",
+    "created_at",
+)
+
+EXPORT_MEDIA_TYPES = {
+    "csv": "text/csv",  # Starlette가 charset=utf-8을 붙임
+    "ndjson": "application/x-ndjson",
+}
+
+
+async def iter_export_batches(db: AsyncSession, filters: GroupFilters, batch_size: int) -> AsyncIterator[Sequence]:
+    """
+    필터 조건에 맞는 일자별 예약을 (그룹 ID, 날짜) 순으로 batch_size개씩 조회
+    - 서버 측 커서(stream + yield_per)로 가져오므로 전체 결과를 메모리에 올리지 않음
+    - ORM 객체 대신 컬럼만 조회해 세션 identity map에 쌓이지 않도록 함
+    - 구간 저장 방식은 구간 행을 batch_size개씩 가져와 일자별로 펼침
+    """
+    if use_range_storage():
+        query = (
+            select(
+                ReservationRange.reservation_group_id,
+                ReservationRange.user_id,
+                ReservationRange.start_at,
+                ReservationRange.end_at,
+                ReservationRange.daily_window,
+                ReservationRange.reserved_count,
+                ReservationRange.is_confirmed,
+                ReservationRange.created_at,
+                ReservationRange.version,  # days_from_range가 일자별 예약에 채움
+            )
+            .where(*filters.range_clauses())
+            .order_by(ReservationRange.reservation_group_id)
+        )
+        result = await db.stream(query.execution_options(yield_per=batch_size))
+        async for partition in result.partitions():
+            days = [day for rng in partition for day in days_from_range(rng) if filters.day_matches(day)]
+            if days:
+                yield days
+        return
+
+    query = (
+        select(*(getattr(Reservation, column) for column in EXPORT_COLUMNS))
+        .where(*filters.reservation_clauses())
+        .order_by(Reservation.reservation_group_id, Reservation.date)
+    )
+    result = await db.stream(query.execution_options(yield_per=batch_size))
+    async for partition in result.partitions():
+        yield partition
+
+
+def _csv_value(value):
+    # JSON 응답과 같은 표기 (ISO 8601 날짜/시각, true/false)
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if value is None:
+        return ""
+    if hasattr(value, "isoformat"):
+        return value.isoformat()
+    return value
+
+
+async def export_csv(db: AsyncSession, filters: GroupFilters, batch_size: int) -> AsyncIterator[bytes]:
+    """
+    일자별 예약을 CSV로 내보내기 (헤더 포함, 조회 배치 단위로 전송)
+    """
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(EXPORT_COLUMNS)
+    yield buffer.getvalue().encode()
+
+    async for rows in iter_export_batches(db, filters, batch_size):
+        buffer.seek(0)
+        buffer.truncate()
+        for row in rows:
+            writer.writerow([_csv_value(getattr(row, column)) for column in EXPORT_COLUMNS])
+        yield buffer.getvalue().encode()
+
+
+async def export_ndjson(db: AsyncSession, filters: GroupFilters, batch_size: int) -> AsyncIterator[bytes]:
+    """
+    일자별 예약을 NDJSON(한 줄에 JSON 객체 하나)으로 내보내기 (조회 배치 단위로 전송)
+    """
+    async for rows in iter_export_batches(db, filters, batch_size):
+        yield b"".join(
+            orjson.dumps({column: getattr(row, column) for column in EXPORT_COLUMNS}) + b"\n" for row in rows
+        )
+
+
+EXPORTERS = {
+    "csv": export_csv,
+    "ndjson": export_ndjson,
+}
@@ -0,0 +1,243 @@
+# app/services/reservation_groups.py
+from collections import defaultdict
+from datetime import date, datetime, time, timedelta
+from typing import Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+from sqlalchemy import DateTime, func, literal, null, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
+
+from app.models.reservation import Reservation
+from app.models.reservation_range import ReservationRange
+from app.services.pagination import decode_cursor, encode_cursor
+from app.services.reservation_ranges import days_from_range, use_range_storage
+
+def group_summary_columns() -> tuple:
+    """
+    예약 그룹 요약 컬럼 (GROUP BY reservation_group_id)
+    - 서브쿼리를 만들면 모든 매퍼가 구성되므로 모듈 임포트 시점이 아닌 조회 시점에 생성
+      (관계 대상 모델이 아직 임포트되지 않은 상태에서 이 모듈을 임포트해도 실패하지 않도록)
+    """
+    group_rows = aliased(Reservation)
+    return (
+        Reservation.reservation_group_id,
+        func.min(Reservation.user_id).label("user_id"),
+        func.min(Reservation.date).label("start_date"),
+        func.max(Reservation.date).label("end_date"),
+        # 첫날만 start_hour부터 시작하고 이후 날짜는 0시부터 시작하므로 그룹의 시작 시간은 최대값
+        func.max(Reservation.start_hour).label("start_hour"),
+        # 마지막 날만 end_hour에 끝나고 이전 날짜는 24시에 끝나므로 그룹의 종료 시간은 최소값
+        func.min(Reservation.end_hour).label("end_hour"),
+        func.max(Reservation.reserved_count).label("reserved_count"),
+        func.coalesce(func.bool_and(Reservation.is_confirmed), False).label("is_confirmed"),
+        # 그룹 버전은 날짜 필터와 관계없이 그룹 전체 행의 최대값
+        select(func.max(group_rows.version))
+        .where(group_rows.reservation_group_id == Reservation.reservation_group_id)
+        .scalar_subquery()
+        .label("version"),
+    )
+
+
+class GroupSummary(NamedTuple):
+    # 구간 저장 방식에서 계산한 예약 그룹 요약 (group_summary_columns()와 같은 필드)
+    reservation_group_id: int
+    user_id: int
+    start_date: date
+    end_date: date
+    start_hour: int
+    end_hour: int
+    reserved_count: int
+    is_confirmed: bool
+    version: int = 1
+
+
+class GroupFilters:
+    """
+    예약 그룹 조회 필터
+    - 날짜 조건은 [date_from, date_to] 범위로 합쳐서 보관
+    - 저장 방식에 맞는 SQL 조건(일자별 행 조건 / 구간 겹침 조건)으로 변환
+    """
+
+    def __init__(
+        self,
+        user_id: Optional[int] = None,
+        reservation_group_id: Optional[int] = None,
+        date_from: Optional[date] = None,
+        date_to: Optional[date] = None,
+        is_confirmed: Optional[bool] = None,
+    ):
+        self.user_id = user_id
+        self.reservation_group_id = reservation_group_id
+        self.date_from = None
+        self.date_to = None
+        self.is_confirmed = is_confirmed
+        self.restrict_dates(date_from, date_to)
+
+    def restrict_dates(self, date_from: Optional[date] = None, date_to: Optional[date] = None) -> None:
+        # 기존 날짜 범위와 겹치는 부분으로 좁힘
+        if date_from and (self.date_from is None or date_from > self.date_from):
+            self.date_from = date_from
+        if date_to and (self.date_to is None or date_to < self.date_to):
+            self.date_to = date_to
+
+    def reservation_clauses(self) -> list:
+        """
+        `reservations` 일자별 행 조건
+        """
+        clauses = []
+        if self.user_id:
+            clauses.append(Reservation.user_id == self.user_id)
+        if self.reservation_group_id:
+            clauses.append(Reservation.reservation_group_id == self.reservation_group_id)
+        if self.date_from:
+            clauses.append(Reservation.date >= self.date_from)
+        if self.date_to:
+            clauses.append(Reservation.date <= self.date_to)
+        if self.is_confirmed is not None:
+            clauses.append(Reservation.is_confirmed == self.is_confirmed)
+        return clauses
+
+    def range_clauses(self) -> list:
+        """
+        `reservation_ranges` 구간 조건 (날짜 범위는 GiST 인덱스를 타는 tsrange 겹침(&&) 조건)
+        """
+        clauses = []
+        if self.user_id:
+            clauses.append(ReservationRange.user_id == self.user_id)
+        if self.reservation_group_id:
+            clauses.append(ReservationRange.reservation_group_id == self.reservation_group_id)
+        if self.date_from or self.date_to:
+            lower = literal(datetime.combine(self.date_from, time()), DateTime) if self.date_from else null()
+            upper = (
+                literal(datetime.combine(self.date_to + timedelta(days=1), time()), DateTime)
+                if self.date_to else null()
+            )
+            clauses.append(
+                func.tsrange(ReservationRange.start_at, ReservationRange.end_at).op("&&")(func.tsrange(lower, upper))
+            )
+        if self.is_confirmed is not None:
+            clauses.append(ReservationRange.is_confirmed == self.is_confirmed)
+        return clauses
+
+    def day_matches(self, day) -> bool:
+        """
+        구간에서 펼친 일자별 예약이 날짜/확정 조건에 맞는지 확인
+        """
+        if self.date_from and day.date < self.date_from:
+            return False
+        if self.date_to and day.date > self.date_to:
+            return False
+        if self.is_confirmed is not None and day.is_confirmed != self.is_confirmed:
+            return False
+        return True
+
+
+def _summarize(days: Sequence) -> GroupSummary:
+    # group_summary_columns()와 같은 방식으로 일자별 예약을 요약
+    return GroupSummary(
+        reservation_group_id=days[0].reservation_group_id,
+        user_id=days[0].user_id,
+        start_date=min(day.date for day in days),
+        end_date=max(day.date for day in days),
+        start_hour=max(day.start_hour for day in days),
+        end_hour=min(day.end_hour for day in days),
+        reserved_count=max(day.reserved_count for day in days),
+        is_confirmed=all(day.is_confirmed for day in days),
+        version=max(day.version for day in days),
+    )
+
+
+async def fetch_group_summary_page(
+    db: AsyncSession,
+    filters: GroupFilters,
+    cursor: Optional[str],
+    limit: int,
+) -> Tuple[list, Optional[str]]:
+    """
+    예약 그룹 요약을 reservation_group_id 기준 키셋 페이지로 조회
+    - 일자별 저장 방식은 DB에서 GROUP BY로 집계, 구간 저장 방식은 그룹 행을 펼쳐서 요약
+    - 그룹 단위로 페이지를 나누므로 한 그룹이 두 페이지로 나뉘지 않음
+    - limit + 1개를 조회해 다음 페이지 존재 여부를 판단
+    """
+    if use_range_storage():
+        query = select(ReservationRange).where(*filters.range_clauses())
+        if cursor:
+            query = query.where(ReservationRange.reservation_group_id > decode_cursor(cursor))
+        query = query.order_by(ReservationRange.reservation_group_id).limit(limit + 1)
+        ranges, next_cursor = _split_page((await db.scalars(query)).all(), limit)
+
+        summaries = []
+        for rng in ranges:
+            days = [day for day in days_from_range(rng) if filters.day_matches(day)]
+            if days:
+                summaries.append(_summarize(days))
+        return summaries, next_cursor
+
+    query = select(*group_summary_columns()).where(*filters.reservation_clauses())
+    if cursor:
+        query = query.where(Reservation.reservation_group_id > decode_cursor(cursor))
+    query = query.group_by(Reservation.reservation_group_id).order_by(Reservation.reservation_group_id).limit(limit + 1)
+
+    return _split_page((await db.execute(query)).all(), limit)
+
+
+def _split_page(rows: Sequence, limit: int) -> Tuple[list, Optional[str]]:
+    # limit + 1개를 조회한 결과를 현재 페이지와 다음 페이지 커서로 분리
+    rows = list(rows)
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = encode_cursor(rows[-1].reservation_group_id)
+    return rows, next_cursor
+
+
+async def fetch_group_reservations(
+    db: AsyncSession,
+    filters: GroupFilters,
+    group_ids: Sequence[int],
+) -> Dict[int, list]:
+    """
+    지정한 예약 그룹들의 일자별 예약을 날짜순으로 조회 (상세 조회를 요청한 경우에만 사용)
+    """
+    grouped: Dict[int, list] = defaultdict(list)
+    if not group_ids:
+        return grouped
+
+    if use_range_storage():
+        ranges = await db.scalars(
+            select(ReservationRange)
+            .where(*filters.range_clauses(), ReservationRange.reservation_group_id.in_(group_ids))
+            .order_by(ReservationRange.reservation_group_id)
+        )
+        for rng in ranges:
+            grouped[rng.reservation_group_id] = [day for day in days_from_range(rng) if filters.day_matches(day)]
+        return grouped
+
+    reservations = await db.scalars(
+        select(Reservation)
+        .where(*filters.reservation_clauses(), Reservation.reservation_group_id.in_(group_ids))
+        .order_by(Reservation.reservation_group_id, Reservation.date)
+    )
+    for res in reservations:
+        grouped[res.reservation_group_id].append(res)
+    return grouped
+
+
+async def find_group_ids(db: AsyncSession, filters: GroupFilters, limit: int) -> List[int]:
+    """
+    필터 조건에 맞는 예약 그룹 ID를 그룹 ID 순으로 조회
+    """
+    if use_range_storage():
+        query = (
+            select(ReservationRange.reservation_group_id)
+            .where(*filters.range_clauses())
+            .order_by(ReservationRange.reservation_group_id)
+        )
+    else:
+        query = (
+            select(Reservation.reservation_group_id)
+            .where(*filters.reservation_clauses())
+            .distinct()
+            .order_by(Reservation.reservation_group_id)
+        )
+    return list((await db.scalars(query.limit(limit))).all())
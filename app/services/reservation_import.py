@@ -0,0 +1,275 @@
+# app/services/reservation_import.py
+import asyncio
+import csv
+from datetime import date
+from typing import Dict, Iterable, List, Tuple
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.exceptions import ReservationImportError
+from app.services.availability import mark_dates_dirty
+from app.services.capacity import lock_confirmed_counts
+from app.services.reservation_ranges import use_range_storage
+
+# CSV 한 행 = 예약 그룹 하나 (예약 신청 API와 같은 필드 + user_id / is_confirmed)
+IMPORT_COLUMNS = ("user_id", "start_date", "start_hour", "end_date", "end_hour", "reserved_count", "is_confirmed")
+REQUIRED_COLUMNS = IMPORT_COLUMNS[:-1]  # is_confirmed는 생략 시 false
+MAX_REPORTED_ERRORS = 100
+
+STAGING_TABLE = "reservation_import"
+STAGING_COLUMNS = ("line",) + IMPORT_COLUMNS
+
+_TRUE_VALUES = {"true", "t", "1", "y", "yes"}
+_FALSE_VALUES = {"false", "f", "0", "n", "no", ""}
+
+
+def _parse_row(row: List[str], positions: Dict[str, int]) -> Tuple:
+    """
+    CSV 한 행을 검증해 스테이징 테이블 행으로 변환 (잘못된 값이면 ValueError)
+    - 시간/날짜 규칙은 예약 신청 API와 동일 (관리자 가져오기이므로 시험 3일 전 제한은 적용하지 않음)
+    """
+    def value(column: str) -> str:
+        index = positions.get(column)
+        return row[index].strip() if index is not None and index < len(row) else ""
+
+    try:
+        user_id = int(value("user_id"))
+        start_date = date.fromisoformat(value("start_date"))
+        end_date = date.fromisoformat(value("end_date"))
+        start_hour = int(value("start_hour"))
+        end_hour = int(value("end_hour"))
+        reserved_count = int(value("reserved_count"))
+    except ValueError:
+        raise ValueError("숫자 또는 날짜(YYYY-MM-DD) 형식이 잘못되었습니다.")
+
+    confirmed = value("is_confirmed").lower()
+    if confirmed not in _TRUE_VALUES and confirmed not in _FALSE_VALUES:
+        raise ValueError("is_confirmed 값이 잘못되었습니다.")
+
+    if not 0 <= start_hour <= 23 or not 1 <= end_hour <= 24:
+        raise ValueError("예약 시간 범위가 잘못되었습니다.")
+    if start_date > end_date:
+        raise ValueError("start_date는 end_date보다 앞서야 합니다.")
+    if start_date == end_date and start_hour >= end_hour:
+        raise ValueError("같은 날짜에서 start_hour가 end_hour보다 커야 합니다.")
+    if not 0 < reserved_count <= settings.MAX_CAPACITY_PER_HOUR:
+        raise ValueError("예약 인원이 잘못되었습니다.")
+
+    return (user_id, start_date, start_hour, end_date, end_hour, reserved_count, confirmed in _TRUE_VALUES)
+
+
+def _header_positions(header: List[str]) -> Dict[str, int]:
+    positions = {name.strip().lower(): index for index, name in enumerate(header)}
+    missing = [column for column in REQUIRED_COLUMNS if column not in positions]
+    if missing:
+        raise ReservationImportError([{"line": 1, "error": "필수 컬럼이 없습니다: " + ", ".join(missing)}])
+    return positions
+
+
+class _CsvBatchReader:
+    """
+    CSV를 한 행씩 검증하면서 batch_size개씩 스테이징 테이블 행으로 변환
+    - 파일 읽기/디코딩/검증은 동기 작업이므로 이벤트 루프가 아닌 스레드에서 호출 (생성자 포함)
+    - 잘못된 행은 건너뛰고 (최대 MAX_REPORTED_ERRORS개까지) errors에 모음
+    """
+
+    def __init__(self, lines: Iterable[str], batch_size: int):
+        self.reader = enumerate(csv.reader(lines), start=1)
+        self.batch_size = batch_size
+        self.errors = []
+        self.done = False
+
+        header = next(self.reader, None)
+        if header is None:
+            raise ReservationImportError([{"line": 1, "error": "CSV 헤더가 없습니다."}])
+        self.positions = _header_positions(header[1])
+
+    def next_batch(self) -> List[Tuple]:
+        batch = []
+        for line, row in self.reader:
+            if not any(field.strip() for field in row):
+                continue
+            try:
+                batch.append((line,) + _parse_row(row, self.positions))
+            except ValueError as e:
+                self.errors.append({"line": line, "error": str(e)})
+                if len(self.errors) >= MAX_REPORTED_ERRORS:
+                    break
+                continue
+            if len(batch) >= self.batch_size:
+                return batch
+        self.done = True
+        return batch
+
+
+async def _copy_to_staging(db: AsyncSession, lines: Iterable[str], batch_size: int) -> int:
+    """
+    CSV를 스레드에서 batch_size개씩 검증/변환하고, 이벤트 루프에서 COPY로 스테이징 테이블에 적재
+    - 큰 파일을 읽는 동안에도 같은 워커의 다른 요청이 멈추지 않음
+    - 오류가 하나라도 있으면 적재를 멈추고 (최대 MAX_REPORTED_ERRORS개까지) 오류만 모아서 반환
+    """
+    connection = await db.connection()
+    raw_connection = (await connection.get_raw_connection()).driver_connection  # asyncpg 커넥션 (같은 트랜잭션)
+
+    loop = asyncio.get_event_loop()
+    reader = await loop.run_in_executor(None, _CsvBatchReader, lines, batch_size)
+
+    copied = 0
+    while not reader.done:
+        batch = await loop.run_in_executor(None, reader.next_batch)
+        if batch and not reader.errors:
+            await raw_connection.copy_records_to_table(STAGING_TABLE, records=batch, columns=STAGING_COLUMNS)
+            copied += len(batch)
+
+    if reader.errors:
+        raise ReservationImportError(reader.errors)
+    if not copied:
+        raise ReservationImportError([{"line": None, "error": "가져올 예약이 없습니다."}])
+    return copied
+
+
+async def import_reservations(db: AsyncSession, lines: Iterable[str], batch_size: int) -> dict:
+    """
+    CSV(예약 그룹 단위)를 검증 후 COPY로 스테이징 테이블에 적재하고, 집합 단위 쿼리로 한 번에 반영
+    1. 스테이징 테이블에 적재하면서 그룹 ID를 시퀀스에서 발급
+    2. 확정 상태로 가져오는 시간의 장부 행을 확정 API와 같은 (날짜, 시간) 순서로 잠금
+    3. 존재하지 않는 사용자 / 시간별 최대 수용 인원 초과를 한 번의 쿼리로 검증
+       (기존 확정 인원 + 가져오는 확정 인원, 미확정 그룹은 여기에 자기 인원을 더해 검증)
+    4. 시간별 용량 장부 / `exam_schedules` UPSERT 후 예약(일자별 또는 구간) INSERT
+    - 전부 반영되거나 전부 반영되지 않도록 호출한 트랜잭션 안에서 실행 (commit/rollback은 호출 측에서 처리)
+    """
+    await db.execute(
+        text(
+            "CREATE TEMP TABLE " + STAGING_TABLE + " ("
+            "line integer NOT NULL, "
+            "reservation_group_id bigint NOT NULL DEFAULT nextval('reservation_group_id_seq'), "
+            "user_id bigint NOT NULL, start_date date NOT NULL, start_hour integer NOT NULL, "
+            "end_date date NOT NULL, end_hour integer NOT NULL, reserved_count integer NOT NULL, "
+            "is_confirmed boolean NOT NULL"
+            ") ON COMMIT DROP"
+        )
+    )
+    imported_groups = await _copy_to_staging(db, lines, batch_size)
+
+    unknown_users = await db.execute(
+        text(
+            "SELECT i.line, i.user_id FROM " + STAGING_TABLE + " i "
+            "WHERE NOT EXISTS (SELECT 1 FROM users u WHERE u.id = i.user_id) ORDER BY i.line LIMIT :limit"
+        ),
+        {"limit": MAX_REPORTED_ERRORS},
+    )
+    errors = [{"line": row.line, "error": "존재하지 않는 사용자입니다: {}".format(row.user_id)} for row in unknown_users]
+    if errors:
+        raise ReservationImportError(errors)
+
+    # 그룹을 일자별 예약으로 펼침 (첫날은 start_hour ~ 24시, 마지막 날은 0시 ~ end_hour)
+    await db.execute(
+        text(
+            "CREATE TEMP TABLE reservation_import_days ON COMMIT DROP AS "
+            "SELECT i.reservation_group_id, i.user_id, d::date AS date, "
+            "CASE WHEN d::date = i.start_date THEN i.start_hour ELSE 0 END AS start_hour, "
+            "CASE WHEN d::date = i.end_date THEN i.end_hour ELSE 24 END AS end_hour, "
+            "i.reserved_count, i.is_confirmed "
+            "FROM " + STAGING_TABLE + " i, generate_series(i.start_date, i.end_date, INTERVAL '1 day') d"
+        )
+    )
+    await db.execute(text("ANALYZE reservation_import_days"))
+
+    # 확정 인원이 바뀌는 시간의 장부 행을 검증 전에 잠금 (동시에 확정된 인원이 검증에서 빠지지 않도록)
+    # - 미확정 그룹의 시간은 장부를 바꾸지 않으므로 예약 신청과 같이 잠그지 않음
+    # - 서로 다른 시간대 조합(날짜, 시작, 종료)만 가져오므로 행 수와 관계없이 크기가 작음
+    confirmed_slots = await db.execute(
+        text("SELECT DISTINCT date, start_hour, end_hour FROM reservation_import_days WHERE is_confirmed")
+    )
+    await lock_confirmed_counts(db, confirmed_slots.all())
+
+    over_capacity = await db.execute(
+        text(
+            "SELECT h.date, h.hour, COALESCE(c.confirmed_count, 0) + h.confirmed + h.max_pending AS peak "
+            "FROM ("
+            "  SELECT date, hour, "
+            "  COALESCE(sum(reserved_count) FILTER (WHERE is_confirmed), 0) AS confirmed, "
+            "  COALESCE(max(reserved_count) FILTER (WHERE NOT is_confirmed), 0) AS max_pending "
+            "  FROM reservation_import_days, generate_series(start_hour, end_hour - 1) AS g(hour) "
+            "  GROUP BY date, hour"
+            ") h LEFT JOIN hourly_capacities c ON c.date = h.date AND c.hour = h.hour "
+            "WHERE COALESCE(c.confirmed_count, 0) + h.confirmed + h.max_pending > :max_capacity "
+            "ORDER BY h.date, h.hour LIMIT :limit"
+        ),
+        {"max_capacity": settings.MAX_CAPACITY_PER_HOUR, "limit": MAX_REPORTED_ERRORS},
+    )
+    errors = [
+        {
+            "line": None,
+            "error": "{} {:02d}:00 시간대의 예약 인원({:,}명)이 최대 수용 인원을 초과합니다.".format(
+                row.date, row.hour, row.peak
+            ),
+        }
+        for row in over_capacity
+    ]
+    if errors:
+        raise ReservationImportError(errors)
+
+    await db.execute(
+        text(
+            "INSERT INTO hourly_capacities (date, hour, confirmed_count) "
+            "SELECT date, hour, sum(reserved_count) "
+            "FROM reservation_import_days, generate_series(start_hour, end_hour - 1) AS g(hour) "
+            "WHERE is_confirmed GROUP BY date, hour "
+            "ON CONFLICT (date, hour) DO UPDATE "
+            "SET confirmed_count = hourly_capacities.confirmed_count + EXCLUDED.confirmed_count"
+        )
+    )
+
+    await db.execute(
+        text(
+            "INSERT INTO exam_schedules (date, start_hour, end_hour, total_reserved_count) "
+            "SELECT date, start_hour, end_hour, sum(reserved_count) FROM reservation_import_days "
+            "WHERE is_confirmed GROUP BY date, start_hour, end_hour "
+            "ON CONFLICT ON CONSTRAINT uq_exam_schedules_slot DO UPDATE "
+            "SET total_reserved_count = exam_schedules.total_reserved_count + EXCLUDED.total_reserved_count"
+        )
+    )
+
+    if use_range_storage():
+        await db.execute(
+            text(
+                "INSERT INTO reservation_ranges "
+                "(reservation_group_id, user_id, start_at, end_at, daily_window, reserved_count, is_confirmed) "
+                "SELECT reservation_group_id, user_id, start_date + start_hour * INTERVAL '1 hour', "
+                "end_date + end_hour * INTERVAL '1 hour', false, reserved_count, is_confirmed "
+                "FROM " + STAGING_TABLE
+            )
+        )
+    else:
+        await db.execute(
+            text(
+                "INSERT INTO reservations "
+                "(reservation_group_id, user_id, exam_schedule_id, date, start_hour, end_hour, reserved_count, is_confirmed) "
+                "SELECT d.reservation_group_id, d.user_id, e.id, d.date, d.start_hour, d.end_hour, "
+                "d.reserved_count, d.is_confirmed "
+                "FROM reservation_import_days d LEFT JOIN exam_schedules e ON d.is_confirmed "
+                "AND e.date = d.date AND e.start_hour = d.start_hour AND e.end_hour = d.end_hour"
+            )
+        )
+
+    summary = (
+        await db.execute(
+            text(
+                "SELECT (SELECT count(*) FROM reservation_import_days) AS reservations, "
+                "(SELECT count(*) FROM " + STAGING_TABLE + " WHERE is_confirmed) AS confirmed_groups"
+            )
+        )
+    ).one()
+
+    # 확정 인원이 바뀐 날짜는 커밋 후 예약 가능 인원 캐시에서 제거
+    confirmed_dates = await db.scalars(text("SELECT DISTINCT date FROM reservation_import_days WHERE is_confirmed"))
+    mark_dates_dirty(db, confirmed_dates.all())
+
+    return {
+        "imported_groups": imported_groups,
+        "imported_reservations": summary.reservations,
+        "confirmed_groups": summary.confirmed_groups,
+    }
@@ -0,0 +1,91 @@
+# app/services/reservation_json.py
+from typing import Dict, Optional, Sequence
+
+from fastapi.responses import ORJSONResponse
+
+# 예약 그룹 목록 응답을 Pydantic 모델 생성/검증 없이 바로 JSON 바이트로 직렬화
+# - 라우터가 Response를 직접 반환하면 FastAPI는 response_model 검증/직렬화를 건너뜀 (OpenAPI 스키마에는 그대로 사용)
+# - 필드 이름과 순서는 app/schemas/reservation_schema.py의 응답 모델과 같게 유지
+# - date/datetime은 orjson이 ISO 8601 문자열로 변환 (Pydantic 출력과 동일)
+
+
+def _admin_day(r) -> dict:
+    # ReservationOut
+    return {
+        "id": r.id,
+        "reservation_group_id": r.reservation_group_id,
+        "user_id": r.user_id,
+        "date": r.date,
+        "start_hour": r.start_hour,
+        "end_hour": r.end_hour,
+        "reserved_count": r.reserved_count,
+        "is_confirmed": r.is_confirmed,
+        "created_at": r.created_at,
+    }
+
+
+def _user_day(r) -> dict:
+    # UserReservationDayOut
+    return {
+        "reservation_id": r.id,
+        "date": r.date,
+        "start_hour": r.start_hour,
+        "end_hour": r.end_hour,
+        "reserved_count": r.reserved_count,
+        "is_confirmed": r.is_confirmed,
+    }
+
+
+def admin_group_page_response(
+    summaries: Sequence,
+    details: Dict[int, list],
+    next_cursor: Optional[str],
+    include_reservations: bool,
+) -> ORJSONResponse:
+    """
+    관리자 예약 목록 응답 (ReservationGroupPage 형식)
+    """
+    items = []
+    for row in summaries:
+        items.append({
+            "reservation_group_id": row.reservation_group_id,
+            "user_id": row.user_id,
+            "start_date": row.start_date,
+            "end_date": row.end_date,
+            "start_hour": row.start_hour,
+            "end_hour": row.end_hour,
+            "reserved_count": row.reserved_count,
+            "is_confirmed": row.is_confirmed,
+            "version": row.version,
+            "reservations": (
+                [_admin_day(r) for r in details.get(row.reservation_group_id, [])] if include_reservations else None
+            ),
+        })
+    return ORJSONResponse({"items": items, "next_cursor": next_cursor})
+
+
+def user_group_page_response(
+    summaries: Sequence,
+    details: Dict[int, list],
+    next_cursor: Optional[str],
+    include_reservations: bool,
+) -> ORJSONResponse:
+    """
+    사용자 예약 목록 응답 (UserReservationGroupPage 형식)
+    """
+    items = []
+    for row in summaries:
+        items.append({
+            "reservation_group_id": row.reservation_group_id,
+            "start_date": row.start_date,
+            "end_date": row.end_date,
+            "start_hour": row.start_hour,
+            "end_hour": row.end_hour,
+            "reserved_count": row.reserved_count,
+            "is_confirmed": row.is_confirmed,
+            "version": row.version,
+            "reservations": (
+                [_user_day(r) for r in details.get(row.reservation_group_id, [])] if include_reservations else None
+            ),
+        })
+    return ORJSONResponse({"items": items, "next_cursor": next_cursor})
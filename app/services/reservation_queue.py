@@ -0,0 +1,424 @@
+# app/services/reservation_queue.py
+import asyncio
+import json
+import logging
+import os
+import time
+import uuid
+from collections import deque
+from datetime import date, timedelta
+from typing import Deque, Dict, List, Optional, Tuple
+
+from app.core.config import settings
+from app.core.exceptions import ReservationCapacityError, ReservationQueueFullError
+from app.database.session import SessionLocal
+from app.services.capacity import exceeds_capacity, load_confirmed_counts
+from app.services.group_id import group_id_allocator
+from app.services.reservation_store import insert_group
+
+logger = logging.getLogger("app.reservation_queue")
+
+# 접수 번호 상태
+QUEUED = "queued"
+DONE = "done"
+FAILED = "failed"
+
+
+def new_ticket(user_id: int, reservation) -> dict:
+    """
+    예약 신청(ReservationCreate)을 대기열에 넣을 접수 정보로 변환
+    - 접수 번호는 시각 + 난수로 만들어 이름순 정렬이 접수 순서가 되도록 함 (file 저장소 처리 순서)
+    """
+    return {
+        "ticket_id": "{:020d}{}".format(time.time_ns(), uuid.uuid4().hex[:12]),
+        "user_id": user_id,
+        "start_date": reservation.start_date.isoformat(),
+        "start_hour": reservation.start_hour,
+        "end_date": reservation.end_date.isoformat(),
+        "end_hour": reservation.end_hour,
+        "reserved_count": reservation.reserved_count,
+    }
+
+
+class MemoryReservationQueue:
+    """
+    워커 프로세스 메모리 대기열
+    - 접수/상태 조회/처리가 모두 같은 프로세스에서 일어나야 하므로 단일 프로세스 실행용
+    - 재시작하면 대기 중인 요청과 결과가 사라짐 (종료 시 워커가 남은 요청을 모두 처리한 뒤 종료)
+    """
+
+    durable = False
+
+    def __init__(self, max_size: int, ttl_seconds: int):
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self._queue = None  # 실행 중인 이벤트 루프에서 생성
+        self._tickets: Dict[str, dict] = {}  # ticket_id -> 상태 (접수 순서)
+
+    def _get_queue(self) -> asyncio.Queue:
+        if self._queue is None:
+            self._queue = asyncio.Queue(maxsize=self.max_size)
+        return self._queue
+
+    async def put(self, ticket: dict) -> None:
+        try:
+            self._get_queue().put_nowait(ticket)
+        except asyncio.QueueFull:
+            raise ReservationQueueFullError()
+        self._tickets[ticket["ticket_id"]] = {"status": QUEUED, "user_id": ticket["user_id"]}
+
+    async def get_batch(self, max_items: int, timeout: float) -> List[dict]:
+        queue = self._get_queue()
+        try:
+            batch = [await asyncio.wait_for(queue.get(), timeout)]
+        except asyncio.TimeoutError:
+            return []
+        while len(batch) < max_items and not queue.empty():
+            batch.append(queue.get_nowait())
+        return batch
+
+    async def complete(self, ticket: dict, result: dict) -> None:
+        self._tickets[ticket["ticket_id"]] = {**result, "user_id": ticket["user_id"], "finished_at": time.monotonic()}
+        self._expire()
+
+    async def status(self, ticket_id: str) -> Optional[dict]:
+        return self._tickets.get(ticket_id)
+
+    def depth(self) -> int:
+        return self._queue.qsize() if self._queue is not None else 0
+
+    def _expire(self) -> None:
+        # 오래된 접수부터 보관 시간이 지난 결과를 삭제 (아직 처리 중인 접수를 만나면 중단)
+        deadline = time.monotonic() - self.ttl_seconds
+        for ticket_id, ticket in list(self._tickets.items()):
+            finished_at = ticket.get("finished_at")
+            if finished_at is None or finished_at > deadline:
+                break
+            del self._tickets[ticket_id]
+
+
+class FileReservationQueue:
+    """
+    로컬 디렉터리 대기열 (외부 브로커 없이 같은 서버의 여러 워커 프로세스가 공유)
+    - pending/: 대기 중인 접수, processing/: 워커가 가져간 접수, results/: 처리 결과
+    - 파일 이동(rename)은 원자적이므로 여러 프로세스가 동시에 가져가도 한 접수는 한 번만 처리
+    - 처리 중 종료된 접수는 다음 시작 시 STALE_SECONDS가 지난 것만 pending/으로 되돌림
+    - 파일 입출력은 스레드 풀에서 실행해 이벤트 루프를 막지 않음
+    - pending/ 목록은 가져온 이름을 모두 처리했거나 LIST_SECONDS가 지났을 때만 다시 읽고,
+      대기 건수는 마지막 목록 + 이 프로세스의 접수/처리 건수로 계산 (다른 프로세스 접수분은 다음 목록에서 반영)
+    """
+
+    durable = True
+    STALE_SECONDS = 60
+    LIST_SECONDS = 1.0
+
+    def __init__(self, directory: str, max_size: int, ttl_seconds: int):
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self._dirs = {name: os.path.join(directory, name) for name in ("pending", "processing", "results")}
+        for path in self._dirs.values():
+            os.makedirs(path, exist_ok=True)
+        self._expired_at = 0.0
+        self._pending_names: Deque[str] = deque()  # 마지막으로 읽은 pending/ 목록 중 아직 가져가지 않은 이름 (접수 순서)
+        self._pending_names_at = 0.0
+        self._depth = len(self._list_pending())
+
+    @staticmethod
+    async def _run(func, *args):
+        return await asyncio.get_event_loop().run_in_executor(None, func, *args)
+
+    def _path(self, kind: str, ticket_id: str) -> str:
+        return os.path.join(self._dirs[kind], ticket_id + ".json")
+
+    def _write(self, kind: str, ticket_id: str, data: dict) -> None:
+        # 임시 파일에 쓴 뒤 이동해서 읽는 쪽이 쓰다 만 파일을 보지 않도록 함
+        path = self._path(kind, ticket_id)
+        with open(path + ".tmp", "w") as f:
+            json.dump(data, f)
+        os.replace(path + ".tmp", path)
+
+    @staticmethod
+    def _read(path: str) -> Optional[dict]:
+        try:
+            with open(path) as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return None
+
+    def _list_pending(self) -> List[str]:
+        return sorted(name for name in os.listdir(self._dirs["pending"]) if name.endswith(".json"))
+
+    async def put(self, ticket: dict) -> None:
+        if self._depth >= self.max_size:
+            raise ReservationQueueFullError()
+        await self._run(self._write, "pending", ticket["ticket_id"], ticket)
+        self._depth += 1
+
+    def _claim(self, max_items: int) -> Tuple[List[dict], Optional[int], int]:
+        """
+        스레드 풀에서 실행: 읽어 둔 목록의 앞쪽부터 processing/으로 옮겨 가져감
+        - (가져온 접수, 목록을 다시 읽었으면 가져간 뒤 남은 대기 건수, 가져간 파일 수) 반환
+        """
+        listed = None
+        if not self._pending_names or time.monotonic() - self._pending_names_at >= self.LIST_SECONDS:
+            self._pending_names = deque(self._list_pending())
+            self._pending_names_at = time.monotonic()
+            listed = len(self._pending_names)
+        batch = []
+        claimed_count = 0
+        while self._pending_names and len(batch) < max_items:
+            name = self._pending_names.popleft()
+            claimed = os.path.join(self._dirs["processing"], name)
+            try:
+                os.rename(os.path.join(self._dirs["pending"], name), claimed)
+            except FileNotFoundError:
+                continue  # 다른 프로세스가 먼저 가져감
+            claimed_count += 1
+            ticket = self._read(claimed)
+            if ticket is not None:
+                batch.append(ticket)
+        return batch, (listed - claimed_count if listed is not None else None), claimed_count
+
+    async def get_batch(self, max_items: int, timeout: float) -> List[dict]:
+        deadline = time.monotonic() + timeout
+        while True:
+            batch, remaining, claimed_count = await self._run(self._claim, max_items)
+            # 대기 건수는 이벤트 루프에서만 갱신 (put과 같은 스레드)
+            self._depth = remaining if remaining is not None else max(self._depth - claimed_count, 0)
+            if batch or time.monotonic() >= deadline:
+                if not batch:
+                    await self._run(self._expire)
+                return batch
+            await asyncio.sleep(0.05)
+
+    def _complete(self, ticket: dict, result: dict) -> None:
+        self._write("results", ticket["ticket_id"], {**result, "user_id": ticket["user_id"]})
+        try:
+            os.remove(self._path("processing", ticket["ticket_id"]))
+        except FileNotFoundError:
+            pass
+
+    async def complete(self, ticket: dict, result: dict) -> None:
+        await self._run(self._complete, ticket, result)
+
+    def _status(self, ticket_id: str) -> Optional[dict]:
+        result = self._read(self._path("results", ticket_id))
+        if result is not None:
+            return result
+        for kind in ("pending", "processing"):
+            ticket = self._read(self._path(kind, ticket_id))
+            if ticket is not None:
+                return {"status": QUEUED, "user_id": ticket["user_id"]}
+        return None
+
+    async def status(self, ticket_id: str) -> Optional[dict]:
+        if not ticket_id.isalnum():
+            return None
+        return await self._run(self._status, ticket_id)
+
+    def depth(self) -> int:
+        return self._depth
+
+    def recover(self) -> int:
+        """
+        처리 도중 종료된 접수를 대기열로 되돌림 (워커 시작 시 호출)
+        """
+        recovered = 0
+        stale_before = time.time() - self.STALE_SECONDS
+        for name in os.listdir(self._dirs["processing"]):
+            path = os.path.join(self._dirs["processing"], name)
+            try:
+                if name.endswith(".json") and os.path.getmtime(path) < stale_before:
+                    os.rename(path, os.path.join(self._dirs["pending"], name))
+                    recovered += 1
+            except FileNotFoundError:
+                continue
+        self._pending_names.clear()  # 되돌린 접수가 다음 목록에 포함되도록 다시 읽음
+        self._depth += recovered
+        return recovered
+
+    def _expire(self) -> None:
+        # 대기열이 비어 있을 때 보관 시간이 지난 결과 파일 삭제 (1분에 한 번)
+        now = time.time()
+        if now - self._expired_at < 60:
+            return
+        self._expired_at = now
+        for name in os.listdir(self._dirs["results"]):
+            path = os.path.join(self._dirs["results"], name)
+            try:
+                if os.path.getmtime(path) < now - self.ttl_seconds:
+                    os.remove(path)
+            except FileNotFoundError:
+                continue
+
+
+def _group_days(ticket: dict) -> List[dict]:
+    # 예약 신청 API와 같은 방식으로 그룹을 일자별 예약으로 나눔 (첫날은 start_hour부터, 마지막 날은 end_hour까지)
+    start_date = date.fromisoformat(ticket["start_date"])
+    end_date = date.fromisoformat(ticket["end_date"])
+    days = []
+    current_date = start_date
+    current_start_hour = ticket["start_hour"]
+    while current_date <= end_date:
+        days.append({
+            "user_id": ticket["user_id"],
+            "date": current_date,
+            "start_hour": current_start_hour,
+            "end_hour": 24 if current_date < end_date else ticket["end_hour"],
+            "reserved_count": ticket["reserved_count"],
+            "is_confirmed": False,
+        })
+        current_date += timedelta(days=1)
+        current_start_hour = 0
+    return days
+
+
+async def process_batch(db, tickets: List[dict]) -> Dict[str, dict]:
+    """
+    대기열에서 가져온 예약 신청들을 한 번에 처리하고 접수 번호별 결과를 반환
+    - 배치 전체 기간의 시간별 확정 인원을 한 번만 조회해서 모든 신청의 인원 초과 여부를 검증
+    - 그룹마다 SAVEPOINT 안에서 저장해 그룹 단위로 전부 저장되거나 전부 저장되지 않게 하고, 커밋은 배치당 한 번
+    """
+    groups = [(ticket, _group_days(ticket)) for ticket in tickets]
+    confirmed_counts = await load_confirmed_counts(
+        db,
+        min(days[0]["date"] for _, days in groups),
+        max(days[-1]["date"] for _, days in groups),
+    )
+
+    results: Dict[str, dict] = {}
+    saved = []
+    for ticket, days in groups:
+        ticket_id = ticket["ticket_id"]
+        if any(
+            exceeds_capacity(confirmed_counts, day["date"], day["start_hour"], day["end_hour"], day["reserved_count"])
+            for day in days
+        ):
+            results[ticket_id] = {"status": FAILED, "detail": ReservationCapacityError().detail}
+            continue
+
+        try:
+            async with db.begin_nested():
+                reservations = await insert_group(db, await group_id_allocator.next_id(db), days)
+        except Exception as e:
+            results[ticket_id] = {"status": FAILED, "detail": f"예약 생성 중 오류 발생: {str(e)}"}
+            continue
+
+        saved.append(ticket_id)
+        results[ticket_id] = {
+            "status": DONE,
+            "reservation_group_id": reservations[0].reservation_group_id,
+            "reservations": [reservation.model_dump(mode="json") for reservation in reservations],
+        }
+
+    try:
+        await db.commit()
+    except Exception as e:
+        await db.rollback()
+        for ticket_id in saved:
+            results[ticket_id] = {"status": FAILED, "detail": f"예약 생성 중 오류 발생: {str(e)}"}
+    return results
+
+
+class ReservationQueueWorker:
+    """
+    대기열의 예약 신청을 batch_size개씩 모아 처리하는 백그라운드 작업 (애플리케이션 시작/종료 시 start/stop)
+    """
+
+    def __init__(self, queue, batch_size: int):
+        self.queue = queue
+        self.batch_size = batch_size
+        self._task = None
+        self._stopping = False
+
+        self.batches = 0
+        self.processed = 0
+        self.succeeded = 0
+        self.failed = 0
+        self.batch_seconds_total = 0.0
+        self.batch_seconds_max = 0.0
+
+    def start(self) -> None:
+        if self._task is not None:
+            return
+        if isinstance(self.queue, FileReservationQueue):
+            recovered = self.queue.recover()
+            if recovered:
+                logger.warning("recovered %d reservation tickets left in processing", recovered)
+        self._stopping = False
+        self._task = asyncio.get_event_loop().create_task(self._run())
+
+    async def stop(self, timeout: float = 30) -> None:
+        """
+        메모리 대기열은 남은 요청을 처리한 뒤, 파일 대기열은 현재 배치만 마치고 종료
+        """
+        if self._task is None:
+            return
+        self._stopping = True
+        try:
+            await asyncio.wait_for(self._task, timeout)
+        except asyncio.TimeoutError:
+            logger.warning("reservation queue worker stopped with %d requests pending", self.queue.depth())
+        self._task = None
+
+    async def _run(self) -> None:
+        while not (self._stopping and (self.queue.durable or self.queue.depth() == 0)):
+            tickets = await self.queue.get_batch(self.batch_size, timeout=0.5)
+            if not tickets:
+                continue
+
+            started_at = time.perf_counter()
+            try:
+                async with SessionLocal() as db:
+                    results = await process_batch(db, tickets)
+            except Exception as e:
+                logger.exception("reservation queue batch failed")
+                results = {
+                    ticket["ticket_id"]: {"status": FAILED, "detail": f"예약 생성 중 오류 발생: {str(e)}"}
+                    for ticket in tickets
+                }
+            for ticket in tickets:
+                await self.queue.complete(ticket, results[ticket["ticket_id"]])
+            self._record(results, time.perf_counter() - started_at)
+
+    def _record(self, results: Dict[str, dict], seconds: float) -> None:
+        self.batches += 1
+        self.processed += len(results)
+        self.succeeded += sum(1 for result in results.values() if result["status"] == DONE)
+        self.failed += sum(1 for result in results.values() if result["status"] == FAILED)
+        self.batch_seconds_total += seconds
+        self.batch_seconds_max = max(self.batch_seconds_max, seconds)
+
+    def stats(self) -> dict:
+        return {
+            "mode": settings.RESERVATION_CREATE_MODE,
+            "backend": settings.RESERVATION_QUEUE_BACKEND,
+            "running": self._task is not None,
+            "queue_depth": self.queue.depth(),
+            "batches": self.batches,
+            "processed": self.processed,
+            "succeeded": self.succeeded,
+            "failed": self.failed,
+            "avg_batch_size": self.processed / self.batches if self.batches else 0.0,
+            "avg_batch_ms": self.batch_seconds_total / self.batches * 1000 if self.batches else 0.0,
+            "max_batch_ms": self.batch_seconds_max * 1000,
+        }
+
+
+def use_queued_create() -> bool:
+    """
+    예약 신청을 대기열로 처리하는 모드인지 확인
+    """
+    return settings.RESERVATION_CREATE_MODE == "queued"
+
+
+def _create_queue():
+    if settings.RESERVATION_QUEUE_BACKEND == "file":
+        return FileReservationQueue(
+            settings.RESERVATION_QUEUE_DIR, settings.RESERVATION_QUEUE_MAX_SIZE, settings.RESERVATION_TICKET_TTL_SECONDS
+        )
+    return MemoryReservationQueue(settings.RESERVATION_QUEUE_MAX_SIZE, settings.RESERVATION_TICKET_TTL_SECONDS)
+
+
+reservation_queue = _create_queue() if use_queued_create() else None
+reservation_queue_worker = ReservationQueueWorker(reservation_queue, settings.RESERVATION_QUEUE_BATCH_SIZE) if reservation_queue else None
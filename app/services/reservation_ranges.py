@@ -0,0 +1,103 @@
+# app/services/reservation_ranges.py
+from dataclasses import dataclass
+from datetime import date, datetime, time, timedelta
+from typing import List, Optional, Sequence
+
+from app.core.config import settings
+from app.models.reservation_range import ReservationRange
+
+
+def use_range_storage() -> bool:
+    """
+    예약 그룹을 구간 한 행으로 저장하는 모드인지 확인
+    """
+    return settings.RESERVATION_STORAGE_MODE == "range"
+
+
+@dataclass
+class ReservationDay:
+    """
+    구간 저장 방식에서 조회 시 계산되는 일자별 예약 (`Reservation`과 같은 속성 제공)
+    - 일자별 행이 따로 없으므로 id는 reservation_group_id와 같음
+    """
+    id: int
+    reservation_group_id: int
+    user_id: int
+    date: date
+    start_hour: int
+    end_hour: int
+    reserved_count: int
+    is_confirmed: bool
+    created_at: Optional[datetime] = None
+    exam_schedule_id: Optional[int] = None
+    version: int = 1
+
+
+def _at(day: date, hour: int) -> datetime:
+    # 24시는 다음 날 0시로 저장
+    return datetime.combine(day, time()) + timedelta(hours=hour)
+
+
+def _end_hour(end_at: datetime) -> int:
+    # 0시에 끝나는 구간은 전날 24시에 끝난 것으로 본다
+    return end_at.hour if end_at.hour else 24
+
+
+def days_from_range(rng: ReservationRange) -> List[ReservationDay]:
+    """
+    예약 구간을 일자별 예약 목록으로 펼친다.
+    - 연속 구간: 첫날은 시작 시간부터 24시까지, 중간 날짜는 0~24시, 마지막 날은 0시부터 종료 시간까지
+    - 매일 반복 구간: 모든 날짜가 같은 시작/종료 시간
+    """
+    last_day = (rng.end_at - timedelta(microseconds=1)).date()
+    days = []
+    current = rng.start_at.date()
+    while current <= last_day:
+        if rng.daily_window:
+            start_hour, end_hour = rng.start_at.hour, _end_hour(rng.end_at)
+        else:
+            start_hour = rng.start_at.hour if current == rng.start_at.date() else 0
+            end_hour = _end_hour(rng.end_at) if current == last_day else 24
+        days.append(
+            ReservationDay(
+                id=rng.reservation_group_id,
+                reservation_group_id=rng.reservation_group_id,
+                user_id=rng.user_id,
+                date=current,
+                start_hour=start_hour,
+                end_hour=end_hour,
+                reserved_count=rng.reserved_count,
+                is_confirmed=rng.is_confirmed,
+                created_at=rng.created_at,
+                version=rng.version,
+            )
+        )
+        current += timedelta(days=1)
+    return days
+
+
+def range_values_from_days(days: Sequence[dict]) -> dict:
+    """
+    일자별 예약 목록(날짜순)을 구간 한 행의 값으로 변환한다.
+    - 모든 날짜의 시간대가 같으면 매일 반복 구간, 아니면 연속 구간으로 저장
+    """
+    if not days:
+        raise ValueError("예약 일자가 비어 있습니다.")
+
+    first, last = days[0], days[-1]
+    daily_window = all(
+        (day["start_hour"], day["end_hour"]) == (first["start_hour"], first["end_hour"]) for day in days
+    )
+    if not daily_window:
+        middle_ok = all((day["start_hour"], day["end_hour"]) == (0, 24) for day in days[1:-1])
+        if first["end_hour"] != 24 or last["start_hour"] != 0 or not middle_ok:
+            raise ValueError("구간으로 저장할 수 없는 예약 일자 구성입니다.")
+    if len({day["reserved_count"] for day in days}) != 1:
+        raise ValueError("구간 저장 방식은 그룹 내 예약 인원이 모두 같아야 합니다.")
+
+    return {
+        "start_at": _at(first["date"], first["start_hour"]),
+        "end_at": _at(last["date"], last["end_hour"]),
+        "daily_window": daily_window,
+        "reserved_count": first["reserved_count"],
+    }
@@ -0,0 +1,226 @@
+# app/services/reservation_store.py
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from sqlalchemy import delete, insert, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.exceptions import ReservationVersionConflictError
+from app.models.reservation import Reservation
+from app.models.reservation_range import ReservationRange
+from app.schemas.reservation_schema import ReservationOut
+from app.services.reservation_ranges import days_from_range, range_values_from_days, use_range_storage
+
+# 예약 그룹 저장소
+# - RESERVATION_STORAGE_MODE에 따라 일자별 행(`reservations`) 또는 그룹당 구간 한 행(`reservation_ranges`)에 저장
+# - 라우터는 저장 방식과 관계없이 일자별 예약 목록(date, start_hour, end_hour, reserved_count ...)으로 다룸
+# - 모든 함수는 호출한 트랜잭션 안에서 실행되므로 commit/rollback은 호출 측에서 처리
+
+# (date, start_hour, end_hour) -> exam_schedule_id
+ScheduleIds = Dict[Tuple, int]
+
+# 그룹 수정 시 날짜별로 비교하는 일자별 예약 컬럼
+GROUP_DAY_FIELDS = ("user_id", "start_hour", "end_hour", "reserved_count", "is_confirmed", "exam_schedule_id")
+
+
+def group_version(rows: Sequence) -> int:
+    """
+    예약 그룹 버전 (수정/확정 시 변경된 행에만 새 버전을 저장하므로 그룹의 최대값)
+    """
+    return max(row.version for row in rows)
+
+
+def check_group_version(rows: Sequence, expected_version: Optional[int]) -> None:
+    """
+    요청한 버전이 현재 그룹 버전과 다르면 409 (버전을 지정하지 않은 요청은 검사하지 않음)
+    - 그룹 행을 잠근 뒤(load_group(for_update=True)) 호출하므로 검사 후 변경 전까지 다른 요청이 끼어들지 않음
+    """
+    if expected_version is not None and expected_version != group_version(rows):
+        raise ReservationVersionConflictError(group_version(rows))
+
+
+async def load_group(
+    db: AsyncSession,
+    reservation_group_id: int,
+    user_id: Optional[int] = None,
+    unconfirmed_only: bool = False,
+    for_update: bool = False,
+) -> list:
+    """
+    예약 그룹의 일자별 예약을 날짜순으로 조회 (user_id를 주면 본인 예약만)
+    - for_update: 예약 행을 트랜잭션 끝까지 잠금 (같은 그룹을 동시에 확정/수정/삭제해 장부가 이중 반영되는 것을 방지)
+    """
+    if use_range_storage():
+        query = select(ReservationRange).where(ReservationRange.reservation_group_id == reservation_group_id)
+        if user_id is not None:
+            query = query.where(ReservationRange.user_id == user_id)
+        if unconfirmed_only:
+            query = query.where(ReservationRange.is_confirmed == False)
+        if for_update:
+            query = query.with_for_update()
+        rng = (await db.scalars(query)).first()
+        return days_from_range(rng) if rng else []
+
+    query = select(Reservation).where(Reservation.reservation_group_id == reservation_group_id)
+    if user_id is not None:
+        query = query.where(Reservation.user_id == user_id)
+    if unconfirmed_only:
+        query = query.where(Reservation.is_confirmed == False)
+    if for_update:
+        query = query.with_for_update()
+    return list((await db.scalars(query.order_by(Reservation.date))).all())
+
+
+async def load_unconfirmed_groups(db: AsyncSession, group_ids: Sequence[int]) -> list:
+    """
+    여러 예약 그룹의 미확정 일자별 예약을 (그룹 ID, 날짜) 순으로 한 번에 조회
+    - 확정 처리용이므로 조회한 행을 트랜잭션 끝까지 잠금 (동시에 확정된 그룹은 잠금 해제 후 결과에서 제외됨)
+    """
+    if use_range_storage():
+        ranges = await db.scalars(
+            select(ReservationRange)
+            .where(ReservationRange.reservation_group_id.in_(group_ids), ReservationRange.is_confirmed == False)
+            .order_by(ReservationRange.reservation_group_id)
+            .with_for_update()
+        )
+        return [day for rng in ranges for day in days_from_range(rng)]
+
+    return (
+        await db.execute(
+            select(
+                Reservation.id,
+                Reservation.reservation_group_id,
+                Reservation.date,
+                Reservation.start_hour,
+                Reservation.end_hour,
+                Reservation.reserved_count,
+                Reservation.version,
+            )
+            .where(Reservation.reservation_group_id.in_(group_ids), Reservation.is_confirmed == False)
+            .order_by(Reservation.reservation_group_id, Reservation.date)
+            .with_for_update()
+        )
+    ).all()
+
+
+async def insert_group(db: AsyncSession, reservation_group_id: int, days: List[dict]) -> List[ReservationOut]:
+    """
+    새 예약 그룹을 저장하고 일자별 예약 응답 목록을 반환
+    - days: user_id, date, start_hour, end_hour, reserved_count, is_confirmed 를 담은 날짜순 목록
+    """
+    if use_range_storage():
+        rng = (
+            await db.scalars(
+                insert(ReservationRange).returning(ReservationRange),
+                [{
+                    "reservation_group_id": reservation_group_id,
+                    "user_id": days[0]["user_id"],
+                    "is_confirmed": days[0]["is_confirmed"],
+                    **range_values_from_days(days),
+                }],
+            )
+        ).one()
+        return [ReservationOut.model_validate(day) for day in days_from_range(rng)]
+
+    created = (
+        await db.scalars(
+            insert(Reservation).returning(Reservation),
+            [{**day, "reservation_group_id": reservation_group_id} for day in days],
+        )
+    ).all()
+    # 커밋 후 만료된 객체를 다시 조회하지 않도록 커밋 전에 응답 모델로 변환
+    return [ReservationOut.model_validate(res) for res in created]
+
+
+async def replace_group(
+    db: AsyncSession, reservation_group_id: int, days: List[dict], current: Sequence
+) -> Tuple[Dict[str, int], int]:
+    """
+    예약 그룹의 일자별 예약을 새 목록으로 변경하고 (변경된 행 수 {"updated", "inserted", "deleted"}, 그룹 버전)을 반환
+    - current(load_group 결과)와 날짜별로 비교해서 값이 바뀐 날짜만 UPDATE (id / created_at 유지),
+      새로 포함된 날짜만 INSERT, 빠진 날짜만 DELETE
+    - 변경된 행에는 새 그룹 버전(현재 버전 + 1)을 저장 (바뀐 날짜가 없으면 버전 유지)
+    - 구간 저장 방식은 그룹 행 하나만 갱신
+    """
+    version = group_version(current)
+    if use_range_storage():
+        changed = [
+            (day.date, day.start_hour, day.end_hour, day.reserved_count, day.is_confirmed) for day in current
+        ] != [
+            (day["date"], day["start_hour"], day["end_hour"], day["reserved_count"], day["is_confirmed"]) for day in days
+        ]
+        if changed:
+            await db.execute(
+                update(ReservationRange)
+                .where(ReservationRange.reservation_group_id == reservation_group_id)
+                .values(is_confirmed=days[0]["is_confirmed"], version=version + 1, **range_values_from_days(days))
+            )
+        return {"updated": int(changed), "inserted": 0, "deleted": 0}, version + int(changed)
+
+    current_by_date = {row.date: row for row in current}
+    changed = []
+    added = []
+    for day in days:
+        row = current_by_date.pop(day["date"], None)
+        if row is None:
+            added.append({**day, "reservation_group_id": reservation_group_id, "version": version + 1})
+        elif any(getattr(row, field) != day.get(field) for field in GROUP_DAY_FIELDS):
+            changed.append({"id": row.id, "version": version + 1, **{field: day.get(field) for field in GROUP_DAY_FIELDS}})
+    removed = [row.id for row in current_by_date.values()]
+
+    if removed:
+        await db.execute(delete(Reservation).where(Reservation.id.in_(removed)))
+    if changed:
+        # 기본 키 기준 bulk UPDATE (updated_at은 onupdate로 갱신)
+        await db.execute(update(Reservation), changed)
+    if added:
+        await db.execute(insert(Reservation), added)
+    rows = {"updated": len(changed), "inserted": len(added), "deleted": len(removed)}
+    return rows, version + int(any(rows.values()))
+
+
+async def delete_group(db: AsyncSession, reservation_group_id: int) -> None:
+    """
+    예약 그룹 삭제
+    """
+    if use_range_storage():
+        await db.execute(
+            delete(ReservationRange).where(ReservationRange.reservation_group_id == reservation_group_id)
+        )
+        return
+
+    await db.execute(delete(Reservation).where(Reservation.reservation_group_id == reservation_group_id))
+
+
+async def mark_confirmed(db: AsyncSession, rows: Sequence, schedule_ids: ScheduleIds) -> None:
+    """
+    일자별 예약을 확정 처리하고 `exam_schedule_id`를 연결 (그룹 버전 1 증가)
+    - 구간 저장 방식은 일자별 일정 ID를 보관하지 않고 그룹 행의 확정 여부만 갱신
+    """
+    if not rows:
+        return
+
+    if use_range_storage():
+        await db.execute(
+            update(ReservationRange)
+            .where(ReservationRange.reservation_group_id.in_(sorted({row.reservation_group_id for row in rows})))
+            .values(is_confirmed=True, version=ReservationRange.version + 1)
+        )
+        return
+
+    versions: Dict[int, int] = {}
+    for row in rows:
+        versions[row.reservation_group_id] = max(versions.get(row.reservation_group_id, 0), row.version)
+
+    # 기본 키 기준 bulk UPDATE
+    await db.execute(
+        update(Reservation),
+        [
+            {
+                "id": row.id,
+                "is_confirmed": True,
+                "exam_schedule_id": schedule_ids[(row.date, row.start_hour, row.end_hour)],
+                "version": versions[row.reservation_group_id] + 1,
+            }
+            for row in rows
+        ],
+    )
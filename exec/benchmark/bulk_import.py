@@ -0,0 +1,150 @@
+# exec/benchmark/bulk_import.py
+"""
+예약 CSV 일괄 가져오기 (COPY + 집합 단위 반영) 소요 시간 측정
+
+    python -m exec.benchmark.bulk_import --database-url postgresql://postgres@localhost/bench --rows 1000000
+
+- 지정한 DB의 모든 테이블을 초기화하고 사용자만 적재한 뒤, --rows 개의 예약 그룹 CSV를 만들어 가져오기 실행
+- 관리자 가져오기 API와 같은 서비스 함수(import_reservations)를 같은 트랜잭션 처리(성공 시 commit)로 호출
+- 비교용으로 예약 신청 API 방식(그룹마다 INSERT + commit)의 처리량을 --baseline-rows 개로 측정
+"""
+import argparse
+import asyncio
+import codecs
+import csv
+import json
+import os
+import tempfile
+import time
+from datetime import date, timedelta
+
+from sqlalchemy import create_engine, text
+
+
+def write_csv(path: str, rows: int, users: int, confirmed_every: int) -> None:
+    # 그룹 g: 1 ~ 3일, 9~16시 시작 / 12~19시 종료, confirmed_every개마다 1개 확정
+    start = date.today() + timedelta(days=10)
+    with open(path, "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(["user_id", "start_date", "start_hour", "end_date", "end_hour", "reserved_count", "is_confirmed"])
+        for g in range(1, rows + 1):
+            start_date = start + timedelta(days=g % 180)
+            writer.writerow([
+                1 + g % users,
+                start_date.isoformat(),
+                9 + g % 8,
+                (start_date + timedelta(days=g % 3)).isoformat(),
+                12 + g % 8,
+                1 + g % 5,
+                "true" if g % confirmed_every == 0 else "false",
+            ])
+
+
+async def run_import(path: str) -> dict:
+    from app.core.config import settings
+    from app.database.session import SessionLocal, engine
+    from app.services.reservation_import import import_reservations
+
+    async with SessionLocal() as db:
+        started_at = time.perf_counter()
+        with open(path, "rb") as f:
+            result = await import_reservations(db, codecs.iterdecode(f, "utf-8-sig"), settings.IMPORT_BATCH_SIZE)
+        await db.commit()
+        result["seconds"] = round(time.perf_counter() - started_at, 3)
+    await engine.dispose()
+    return result
+
+
+async def run_baseline(rows: int, users: int) -> dict:
+    # 예약 신청 API와 같은 방식: 그룹 ID 발급 → 일자별 INSERT → 그룹마다 commit
+    from app.database.session import SessionLocal, engine
+    from app.services.group_id import group_id_allocator
+    from app.services.reservation_store import insert_group
+
+    start = date.today() + timedelta(days=10)
+    async with SessionLocal() as db:
+        started_at = time.perf_counter()
+        for g in range(1, rows + 1):
+            start_date = start + timedelta(days=g % 180)
+            span = g % 3
+            days = [
+                {
+                    "user_id": 1 + g % users,
+                    "date": start_date + timedelta(days=i),
+                    "start_hour": 9 + g % 8 if i == 0 else 0,
+                    "end_hour": 12 + g % 8 if i == span else 24,
+                    "reserved_count": 1 + g % 5,
+                    "is_confirmed": False,
+                }
+                for i in range(span + 1)
+            ]
+            await insert_group(db, await group_id_allocator.next_id(db), days)
+            await db.commit()
+        elapsed = time.perf_counter() - started_at
+    await engine.dispose()
+    return {"groups": rows, "seconds": round(elapsed, 3)}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="예약 CSV 일괄 가져오기 측정")
+    parser.add_argument("--database-url", required=True, help="벤치마크 전용 DB URL (테이블이 초기화됨)")
+    parser.add_argument("--rows", type=int, default=1_000_000, help="CSV 예약 그룹 수")
+    parser.add_argument("--users", type=int, default=10_000, help="적재할 사용자 수")
+    parser.add_argument("--confirmed-every", type=int, default=10, help="N개 그룹마다 1개를 확정 상태로 가져오기")
+    parser.add_argument("--baseline-rows", type=int, default=1_000, help="그룹별 INSERT + commit 방식으로 측정할 그룹 수 (0이면 생략)")
+    parser.add_argument("--output", help="결과를 저장할 JSON 파일 경로")
+    args = parser.parse_args()
+
+    # 앱 설정은 임포트 시점에 읽으므로 앱 모듈을 임포트하기 전에 환경 변수 지정
+    os.environ["DATABASE_URL"] = args.database_url
+    os.environ.setdefault("SECRET_KEY", "benchmark-secret")
+    os.environ.setdefault("ALGORITHM", "HS256")
+    os.environ.setdefault("ACCESS_TOKEN_EXPIRE_MINUTES", "60")
+
+    from exec.benchmark.seed import reset_schema
+
+    engine = create_engine(args.database_url)
+    with engine.begin() as conn:
+        reset_schema(conn)
+        conn.execute(
+            text(
+                "INSERT INTO users (id, username, email, hashed_password, role) "
+                "SELECT g, 'user' || g, 'user' || g || '@bench.local', 'x', 'user' FROM generate_series(1, :users) g"
+            ),
+            {"users": args.users},
+        )
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "reservations.csv")
+        write_csv(path, args.rows, args.users, args.confirmed_every)
+        report = {"rows": args.rows, "csv_bytes": os.path.getsize(path)}
+        report["import"] = asyncio.run(run_import(path))
+
+    with engine.connect() as conn:
+        report["tables"] = {
+            name: conn.execute(text("SELECT count(*) FROM " + name)).scalar()
+            for name in ("reservations", "reservation_ranges", "exam_schedules", "hourly_capacities")
+        }
+
+    print("import   : {:>10,} groups {:>10,} days in {:.2f}s ({:,.0f} groups/s)".format(
+        report["import"]["imported_groups"],
+        report["import"]["imported_reservations"],
+        report["import"]["seconds"],
+        report["import"]["imported_groups"] / report["import"]["seconds"],
+    ))
+
+    if args.baseline_rows:
+        report["baseline"] = asyncio.run(run_baseline(args.baseline_rows, args.users))
+        print("baseline : {:>10,} groups in {:.2f}s ({:,.0f} groups/s, INSERT + commit per group)".format(
+            report["baseline"]["groups"],
+            report["baseline"]["seconds"],
+            report["baseline"]["groups"] / report["baseline"]["seconds"],
+        ))
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
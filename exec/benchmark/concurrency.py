@@ -0,0 +1,209 @@
+# exec/benchmark/concurrency.py
+"""
+동시 예약 확정 검증 (시간별 장부 행 잠금)
+
+    python -m exec.benchmark.concurrency --database-url postgresql://postgres@localhost/bench
+
+- 지정한 DB의 모든 테이블을 초기화하고, 라운드마다 새 날짜에 미확정 예약 그룹(하루짜리)을 적재한 뒤
+  관리자 단건 확정 API를 동시에 호출 (실제 FastAPI 앱을 ASGI로 직접 호출)
+- contention: 같은 시간대에 최대 수용 인원의 2배를 신청한 그룹들을 동시에 확정 → 절반만 확정되어야 함
+- scaling: 동시 요청 수별로 서로 다른 시간 / 같은 시간의 그룹을 확정해 처리량 비교
+  (서로 다른 시간은 동시 요청 수만큼 처리량이 늘고, 같은 시간은 잠금 때문에 순서대로 처리됨)
+- 모든 라운드가 끝난 뒤 장부(hourly_capacities)가 확정된 예약 인원의 합과 같은지, 최대 수용 인원을 넘지 않는지 검증
+"""
+import argparse
+import asyncio
+import json
+import math
+import os
+from collections import defaultdict
+from datetime import date, timedelta
+from typing import Dict, List, Tuple
+
+from sqlalchemy import create_engine, text
+
+from exec.benchmark.load_test import Request, run_scenario
+
+# 그룹 ID -> (날짜, 시작 시간, 종료 시간, 인원)
+Groups = Dict[int, Tuple[date, int, int, int]]
+
+
+def insert_pending_groups(conn, storage_mode: str, user_id: int, groups: Groups) -> None:
+    if storage_mode == "range":
+        conn.execute(
+            text(
+                "INSERT INTO reservation_ranges "
+                "(reservation_group_id, user_id, start_at, end_at, daily_window, reserved_count, is_confirmed) "
+                "VALUES (:group_id, :user_id, :date + :start_hour * INTERVAL '1 hour', "
+                ":date + :end_hour * INTERVAL '1 hour', false, :reserved_count, false)"
+            ),
+            [
+                {"group_id": group_id, "user_id": user_id, "date": d, "start_hour": sh, "end_hour": eh, "reserved_count": n}
+                for group_id, (d, sh, eh, n) in groups.items()
+            ],
+        )
+        return
+
+    conn.execute(
+        text(
+            "INSERT INTO reservations (reservation_group_id, user_id, date, start_hour, end_hour, reserved_count, is_confirmed) "
+            "VALUES (:group_id, :user_id, :date, :start_hour, :end_hour, :reserved_count, false)"
+        ),
+        [
+            {"group_id": group_id, "user_id": user_id, "date": d, "start_hour": sh, "end_hour": eh, "reserved_count": n}
+            for group_id, (d, sh, eh, n) in groups.items()
+        ],
+    )
+
+
+def verify_ledger(conn, storage_mode: str, groups: Groups, max_capacity: int) -> dict:
+    """
+    확정된 그룹의 인원 합과 장부를 (날짜, 시간)별로 비교
+    """
+    table = "reservation_ranges" if storage_mode == "range" else "reservations"
+    confirmed = {
+        row[0] for row in conn.execute(text("SELECT DISTINCT reservation_group_id FROM " + table + " WHERE is_confirmed"))
+    }
+
+    expected = defaultdict(int)
+    for group_id in confirmed:
+        slot_date, start_hour, end_hour, reserved_count = groups[group_id]
+        for hour in range(start_hour, end_hour):
+            expected[(slot_date, hour)] += reserved_count
+
+    ledger = {
+        (row.date, row.hour): row.confirmed_count
+        for row in conn.execute(text("SELECT date, hour, confirmed_count FROM hourly_capacities WHERE confirmed_count <> 0"))
+    }
+    return {
+        "confirmed_groups": len(confirmed),
+        "ledger_mismatches": sum(1 for key in set(expected) | set(ledger) if expected.get(key, 0) != ledger.get(key, 0)),
+        "max_confirmed_count": max(ledger.values(), default=0),
+        "over_capacity_hours": sum(1 for count in ledger.values() if count > max_capacity),
+    }
+
+
+async def run(admin_headers: dict, rounds: List[dict]) -> None:
+    import httpx
+
+    from app.main import app
+
+    async with app.router.lifespan_context(app):
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=None) as client:
+            for round_ in rounds:
+                requests = [
+                    Request("POST", "/v1/admin/reservations/confirm/{}".format(group_id), headers=admin_headers)
+                    for group_id in round_["groups"]
+                ]
+                round_["result"] = await run_scenario(client, requests, round_["concurrency"])
+                result = round_["result"]
+                print(
+                    "{:<22} c={:<3} {:>5} req {:>8.1f} req/s  p50 {:>8.2f} ms  p99 {:>8.2f} ms  statuses {}".format(
+                        round_["name"],
+                        round_["concurrency"],
+                        result["requests"],
+                        result["throughput_rps"],
+                        result["p50_ms"],
+                        result["p99_ms"],
+                        result["statuses"],
+                    )
+                )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="동시 예약 확정 검증")
+    parser.add_argument("--database-url", required=True, help="벤치마크 전용 DB URL (테이블이 초기화됨)")
+    parser.add_argument("--contention-groups", type=int, default=40, help="같은 시간대에 동시에 확정할 그룹 수")
+    parser.add_argument("--confirms", type=int, default=400, help="scaling 라운드별 확정 요청 수")
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 2, 4, 8, 16], help="scaling 동시 요청 수 목록")
+    parser.add_argument("--output", help="결과를 저장할 JSON 파일 경로")
+    args = parser.parse_args()
+
+    # 앱 설정은 임포트 시점에 읽으므로 앱 모듈을 임포트하기 전에 환경 변수 지정
+    max_concurrency = max(args.concurrency)
+    os.environ["DATABASE_URL"] = args.database_url
+    os.environ.setdefault("SECRET_KEY", "benchmark-secret")
+    os.environ.setdefault("ALGORITHM", "HS256")
+    os.environ.setdefault("ACCESS_TOKEN_EXPIRE_MINUTES", "60")
+    os.environ.setdefault("DB_POOL_SIZE", str(max_concurrency))
+    storage_mode = os.environ.get("RESERVATION_STORAGE_MODE", "daily")
+
+    from app.core.config import settings
+    from app.core.security import create_access_token
+    from exec.benchmark.seed import reset_schema
+
+    max_capacity = settings.MAX_CAPACITY_PER_HOUR
+    next_date = [date.today() + timedelta(days=10)]
+    groups: Groups = {}
+    rounds = []
+
+    def new_round(name: str, concurrency: int, slots: List[Tuple[int, int, int, int]]) -> Groups:
+        # slots: (날짜 오프셋, 시작 시간, 종료 시간, 인원) - 라운드마다 겹치지 않는 날짜 사용
+        base = next_date[0]
+        round_groups = {}
+        for offset, start_hour, end_hour, reserved_count in slots:
+            round_groups[len(groups) + len(round_groups) + 1] = (base + timedelta(days=offset), start_hour, end_hour, reserved_count)
+        next_date[0] = base + timedelta(days=max(slot[0] for slot in slots) + 1)
+        groups.update(round_groups)
+        rounds.append({"name": name, "concurrency": concurrency, "groups": list(round_groups)})
+        return round_groups
+
+    # 최대 수용 인원의 2배를 같은 시간대(10~12시)에 신청 → 절반만 확정 가능
+    per_group = math.ceil(max_capacity * 2 / args.contention_groups)
+    new_round("contention", max_concurrency, [(0, 10, 12, per_group)] * args.contention_groups)
+    for concurrency in args.concurrency:
+        new_round("scaling/distinct_hours", concurrency, [(i // 24, i % 24, i % 24 + 1, 1) for i in range(args.confirms)])
+        new_round("scaling/same_hour", concurrency, [(0, 10, 11, 1)] * args.confirms)
+
+    engine = create_engine(args.database_url)
+    with engine.begin() as conn:
+        reset_schema(conn)
+        conn.execute(
+            text("INSERT INTO users (id, username, email, hashed_password, role) VALUES (1, 'admin', 'admin@bench.local', 'x', 'admin')")
+        )
+        insert_pending_groups(conn, storage_mode, 1, groups)
+        conn.execute(text("SELECT setval('reservation_group_id_seq', :groups)"), {"groups": len(groups)})
+
+    token = create_access_token(data={"sub": "1", "email": "admin@bench.local", "role": "admin"})
+    asyncio.run(run({"Authorization": "Bearer " + token}, rounds))
+
+    with engine.connect() as conn:
+        verification = verify_ledger(conn, storage_mode, groups, max_capacity)
+        contention_confirmed = sum(
+            1
+            for row in conn.execute(
+                text(
+                    "SELECT DISTINCT reservation_group_id FROM "
+                    + ("reservation_ranges" if storage_mode == "range" else "reservations")
+                    + " WHERE is_confirmed AND reservation_group_id <= :last"
+                ),
+                {"last": args.contention_groups},
+            )
+        )
+    engine.dispose()
+
+    verification["contention_confirmed_groups"] = contention_confirmed
+    verification["contention_capacity_groups"] = max_capacity // per_group
+    print(verification)
+    ok = (
+        verification["ledger_mismatches"] == 0
+        and verification["over_capacity_hours"] == 0
+        and contention_confirmed == max_capacity // per_group
+    )
+    print("OK" if ok else "FAILED")
+
+    if args.output:
+        report = {
+            "storage_mode": storage_mode,
+            "rounds": [{key: value for key, value in round_.items() if key != "groups"} for round_ in rounds],
+            "verification": verification,
+        }
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2, default=str)
+    if not ok:
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
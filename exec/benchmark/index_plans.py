@@ -0,0 +1,180 @@
+# exec/benchmark/index_plans.py
+"""
+복합/부분 인덱스 적용 전후의 실행 계획 비교
+
+    python -m exec.benchmark.index_plans --database-url postgresql://postgres@localhost/bench --rows 3000000
+
+- 지정한 DB의 users / exam_schedules / reservations 테이블을 삭제 후 다시 생성하므로 반드시 벤치마크 전용 DB를 사용
+- 기본 키만 있는 상태에서 데이터를 적재하고 EXPLAIN ANALYZE 실행 후,
+  모델에 선언된 인덱스를 생성하고 같은 쿼리를 다시 실행해 스캔 방식과 실행 시간을 비교
+- 쿼리는 서비스에서 실행하는 형태 그대로 사용 (예약 목록 페이지 / 그룹 상세 / 시험 일정 UPSERT 대상 조회 / 일정 삭제)
+- 변경 쿼리는 SAVEPOINT 안에서 실행한 뒤 되돌림 (일정 삭제의 FK CASCADE 시간은 트리거 시간으로 실행 시간에 포함)
+"""
+import argparse
+import json
+from datetime import date
+
+from sqlalchemy import create_engine, text
+
+from app.database.base import Base
+from app.models import exam_schedule, hourly_capacity, reservation, user  # noqa: F401  (메타데이터 등록)
+
+TABLES = ["users", "exam_schedules", "reservations"]
+
+# 예약 그룹 요약 (reservation_groups.group_summary_columns()와 같은 형태, 그룹 버전은 그룹 전체 행의 최대값)
+GROUP_SUMMARY = (
+    "SELECT r.reservation_group_id, min(r.user_id), min(r.date), max(r.date), max(r.start_hour), min(r.end_hour), "
+    "max(r.reserved_count), COALESCE(bool_and(r.is_confirmed), false), "
+    "(SELECT max(v.version) FROM reservations v WHERE v.reservation_group_id = r.reservation_group_id) "
+    "FROM reservations r "
+)
+
+# 인덱스 적용 대상 쿼리 (서비스에서 실제로 실행하는 조건 형태)
+QUERIES = {
+    # 사용자 예약 목록 첫 페이지 (날짜 필터)
+    "user_group_page": (
+        GROUP_SUMMARY + "WHERE r.user_id = :user_id AND r.date >= :date "
+        "GROUP BY r.reservation_group_id ORDER BY r.reservation_group_id LIMIT 51"
+    ),
+    # 관리자 예약 목록 다음 페이지 (키셋 커서)
+    "admin_group_page": (
+        GROUP_SUMMARY + "WHERE r.reservation_group_id > :group_id "
+        "GROUP BY r.reservation_group_id ORDER BY r.reservation_group_id LIMIT 51"
+    ),
+    # 페이지에 포함된 그룹의 일자별 예약 / 그룹 수정·확정·삭제 시 그룹 조회
+    "group_details": (
+        "SELECT * FROM reservations WHERE reservation_group_id IN (:group_id, :group_id + 1, :group_id + 2) "
+        "ORDER BY reservation_group_id, date"
+    ),
+    # 확정/확정 취소 시 시험 일정 UPSERT·차감 대상 조회
+    "exam_schedule_slot": (
+        "SELECT id FROM exam_schedules WHERE date = :date AND start_hour = :start_hour AND end_hour = :end_hour"
+    ),
+    # 인원이 0이 된 시험 일정 삭제 (FK CASCADE로 exam_schedule_id가 같은 예약 삭제)
+    "exam_schedule_delete": (
+        "DELETE FROM exam_schedules WHERE date = :date AND start_hour = :start_hour AND end_hour = :end_hour"
+    ),
+}
+
+PARAMS = {"date": date(2025, 6, 1), "user_id": 42, "group_id": 1000}
+
+
+def reset_schema(conn):
+    # 기본 키만 있는 상태로 테이블 생성 (선언된 보조 인덱스는 적재 후 생성)
+    conn.execute(text("DROP TABLE IF EXISTS " + ", ".join(reversed(TABLES)) + " CASCADE"))
+    for name in TABLES:
+        table = Base.metadata.tables[name]
+        table.create(conn)
+        for index in list(table.indexes):
+            index.drop(conn)
+
+
+def load_data(conn, rows: int, users: int):
+    conn.execute(
+        text(
+            "INSERT INTO users (id, username, email, hashed_password, role) "
+            "SELECT g, 'user' || g, 'user' || g || '@bench.local', 'x', 'user' FROM generate_series(1, :users) g"
+        ),
+        {"users": users},
+    )
+    # 약 3일짜리 예약 그룹, 9~20시 사이 1~3시간, 10%는 확정
+    conn.execute(
+        text(
+            "INSERT INTO reservations "
+            "(reservation_group_id, user_id, date, start_hour, end_hour, reserved_count, is_confirmed) "
+            "SELECT g / 3, 1 + (g / 3) % :users, DATE '2025-01-01' + ((g / 3) % 365) + g % 3, "
+            "9 + (g / 3) % 12, 10 + (g / 3) % 12 + (g / 3) % 3, 1 + g % 50, (g / 3) % 10 = 0 "
+            "FROM generate_series(3, :rows + 2) g"
+        ),
+        {"rows": rows, "users": users},
+    )
+    conn.execute(
+        text(
+            "INSERT INTO exam_schedules (date, start_hour, end_hour, total_reserved_count) "
+            "SELECT date, start_hour, end_hour, sum(reserved_count) FROM reservations "
+            "WHERE is_confirmed GROUP BY date, start_hour, end_hour"
+        )
+    )
+    # 확정된 예약을 시험 일정에 연결 (확정 API와 같은 상태)
+    conn.execute(
+        text(
+            "UPDATE reservations r SET exam_schedule_id = e.id FROM exam_schedules e "
+            "WHERE r.is_confirmed AND e.date = r.date AND e.start_hour = r.start_hour AND e.end_hour = r.end_hour"
+        )
+    )
+
+
+def pick_schedule(conn) -> dict:
+    # 조회/삭제 대상 시험 일정: 기간 중간의 일정 하나
+    row = conn.execute(
+        text("SELECT date, start_hour, end_hour FROM exam_schedules WHERE date >= :date ORDER BY id LIMIT 1"),
+        PARAMS,
+    ).one()
+    return {"date": row.date, "start_hour": row.start_hour, "end_hour": row.end_hour}
+
+
+def create_declared_indexes(conn):
+    for name in TABLES:
+        for index in Base.metadata.tables[name].indexes:
+            index.create(conn)
+
+
+def explain(conn, params: dict) -> dict:
+    conn.execute(text("ANALYZE"))
+    results = {}
+    for name, sql in QUERIES.items():
+        savepoint = conn.begin_nested()
+        try:
+            plan = conn.execute(text("EXPLAIN (ANALYZE, FORMAT JSON) " + sql), params).scalar()
+        finally:
+            savepoint.rollback()
+        plan = plan[0] if isinstance(plan, list) else json.loads(plan)[0]
+        results[name] = {
+            "scans": sorted(collect_scans(plan["Plan"])),
+            "execution_ms": round(plan["Execution Time"], 3),
+        }
+    return results
+
+
+def collect_scans(node: dict) -> set:
+    scans = set()
+    if "Scan" in node["Node Type"]:
+        scans.add("{} on {}".format(node["Node Type"], node.get("Index Name") or node.get("Relation Name")))
+    for child in node.get("Plans", []):
+        scans |= collect_scans(child)
+    return scans
+
+
+def main():
+    parser = argparse.ArgumentParser(description="인덱스 적용 전후 실행 계획 비교")
+    parser.add_argument("--database-url", required=True, help="벤치마크 전용 DB URL (테이블이 초기화됨)")
+    parser.add_argument("--rows", type=int, default=3_000_000, help="적재할 reservations 행 수")
+    parser.add_argument("--users", type=int, default=100_000, help="적재할 users 행 수")
+    parser.add_argument("--output", help="결과를 저장할 JSON 파일 경로")
+    args = parser.parse_args()
+
+    engine = create_engine(args.database_url)
+    with engine.begin() as conn:
+        reset_schema(conn)
+        load_data(conn, args.rows, args.users)
+
+    with engine.begin() as conn:
+        params = {**PARAMS, **pick_schedule(conn)}
+        before = explain(conn, params)
+        create_declared_indexes(conn)
+    with engine.begin() as conn:
+        after = explain(conn, params)
+
+    report = {"rows": args.rows, "users": args.users, "before": before, "after": after}
+    for name in QUERIES:
+        print(name)
+        print("  before: {:>10.3f} ms  {}".format(before[name]["execution_ms"], ", ".join(before[name]["scans"])))
+        print("  after : {:>10.3f} ms  {}".format(after[name]["execution_ms"], ", ".join(after[name]["scans"])))
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,301 @@
+# exec/benchmark/load_test.py
+"""
+예약 API 부하 테스트 (실제 FastAPI 앱을 ASGI로 직접 호출)
+
+    python -m exec.benchmark.load_test --database-url postgresql://postgres@localhost/bench --output result.json
+
+- 지정한 DB의 모든 테이블을 초기화하고 seed.py로 합성 데이터를 적재한 뒤 시나리오를 순서대로 실행
+  (register: 회원가입 폭주, create: 여러 날짜 예약 생성 폭주, confirm: 미확정 그룹 단건 확정,
+   confirm_batch: 미확정 그룹 일괄 확정, list / list_detail: 관리자 예약 목록 조회 (요약 / 일자별 상세 포함))
+- 시나리오별 처리량(req/s)과 p50/p95/p99/최대 지연 시간을 출력하고, --output 지정 시 커밋 해시와 함께 JSON으로 저장
+- 같은 --random-seed / 규모 옵션이면 같은 요청을 보내므로 커밋 간 결과 비교 가능
+- 앱 설정(DB_POOL_SIZE, RESERVATION_STORAGE_MODE 등)은 환경 변수로 지정
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import subprocess
+import time
+from collections import Counter
+from datetime import date, datetime, timedelta
+from typing import Callable, Dict, List, Sequence
+
+from sqlalchemy import create_engine, text
+
+SCENARIOS = ["register", "create", "list", "list_detail", "confirm", "confirm_batch"]
+
+
+class Request:
+    __slots__ = ("method", "url", "json", "headers")
+
+    def __init__(self, method: str, url: str, json: dict = None, headers: dict = None):
+        self.method = method
+        self.url = url
+        self.json = json
+        self.headers = headers
+
+
+def percentile(sorted_values: Sequence[float], q: float) -> float:
+    # nearest-rank 방식 백분위수
+    if not sorted_values:
+        return 0.0
+    index = max(0, min(len(sorted_values) - 1, int(round(q / 100 * len(sorted_values) + 0.5)) - 1))
+    return sorted_values[index]
+
+
+async def run_scenario(client, requests: List[Request], concurrency: int) -> dict:
+    """
+    요청 목록을 동시 실행 수 concurrency로 보내고 지연 시간 통계를 반환
+    """
+    latencies = []
+    statuses = Counter()
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def send(req: Request):
+        async with semaphore:
+            started_at = time.perf_counter()
+            response = await client.request(req.method, req.url, json=req.json, headers=req.headers)
+            latencies.append(time.perf_counter() - started_at)
+            statuses[str(response.status_code)] += 1
+
+    started_at = time.perf_counter()
+    await asyncio.gather(*(send(req) for req in requests))
+    elapsed = time.perf_counter() - started_at
+
+    latencies.sort()
+    return {
+        "requests": len(requests),
+        "errors": sum(count for status, count in statuses.items() if not status.startswith("2")),
+        "statuses": dict(sorted(statuses.items())),
+        "seconds": round(elapsed, 3),
+        "throughput_rps": round(len(requests) / elapsed, 1) if elapsed else 0.0,
+        "p50_ms": round(percentile(latencies, 50) * 1000, 2),
+        "p95_ms": round(percentile(latencies, 95) * 1000, 2),
+        "p99_ms": round(percentile(latencies, 99) * 1000, 2),
+        "max_ms": round(latencies[-1] * 1000, 2) if latencies else 0.0,
+    }
+
+
+def build_scenarios(args, seeded: dict, pending_group_ids: List[int]) -> Dict[str, Callable[[], List[Request]]]:
+    """
+    시나리오별 요청 목록 생성 함수 (토큰 발급은 앱 설정을 읽은 뒤에 해야 하므로 지연 생성)
+    """
+    from app.core.security import create_access_token
+    from app.services.pagination import encode_cursor
+
+    rng = random.Random(args.random_seed)
+    run_id = datetime.utcnow().strftime("%Y%m%d%H%M%S")
+
+    def token_headers(user_id: int, email: str, role: str) -> dict:
+        token = create_access_token(data={"sub": str(user_id), "email": email, "role": role})
+        return {"Authorization": "Bearer " + token}
+
+    admin_headers = token_headers(seeded["admin_id"], "admin@bench.local", "admin")
+    user_headers = {}
+
+    def headers_for(user_id: int) -> dict:
+        if user_id not in user_headers:
+            user_headers[user_id] = token_headers(user_id, "user{}@bench.local".format(user_id), "user")
+        return user_headers[user_id]
+
+    def register() -> List[Request]:
+        return [
+            Request(
+                "POST",
+                "/v1/users/register",
+                json={
+                    "username": "load{}_{}".format(run_id, i),
+                    "email": "load{}_{}@bench.local".format(run_id, i),
+                    "password": "benchmark",
+                    "role": "user",
+                },
+            )
+            for i in range(args.register)
+        ]
+
+    def create() -> List[Request]:
+        requests = []
+        first_day = date.today() + timedelta(days=10)
+        for _ in range(args.create):
+            start_date = first_day + timedelta(days=rng.randrange(180))
+            requests.append(
+                Request(
+                    "POST",
+                    "/v1/reservations/",
+                    json={
+                        "start_date": start_date.isoformat(),
+                        "start_hour": rng.randrange(9, 17),
+                        "end_date": (start_date + timedelta(days=rng.randrange(args.days))).isoformat(),
+                        "end_hour": rng.randrange(18, 24),
+                        "reserved_count": rng.randrange(1, 20),
+                    },
+                    headers=headers_for(rng.randrange(1, seeded["users"] + 1)),
+                )
+            )
+        return requests
+
+    def listing(include_reservations: bool) -> List[Request]:
+        # 그룹 ID 구간 전체에 걸친 커서로 페이지 조회 (첫 페이지 포함)
+        requests = []
+        for _ in range(args.list):
+            offset = rng.randrange(seeded["groups"])
+            url = "/v1/admin/reservations/?limit={}".format(args.page_size)
+            if offset:
+                url += "&cursor=" + encode_cursor(offset)
+            if include_reservations:
+                url += "&include_reservations=true"
+            requests.append(Request("GET", url, headers=admin_headers))
+        return requests
+
+    def confirm() -> List[Request]:
+        # 단건 확정 대상과 일괄 확정 대상이 겹치지 않도록 앞쪽 그룹을 사용
+        return [
+            Request("POST", "/v1/admin/reservations/confirm/{}".format(group_id), headers=admin_headers)
+            for group_id in pending_group_ids[: args.confirm]
+        ]
+
+    def confirm_batch() -> List[Request]:
+        group_ids = pending_group_ids[args.confirm:]
+        return [
+            Request(
+                "POST",
+                "/v1/admin/reservations/confirm",
+                json={"reservation_group_ids": group_ids[i: i + args.batch_size]},
+                headers=admin_headers,
+            )
+            for i in range(0, min(len(group_ids), args.confirm_batch * args.batch_size), args.batch_size)
+        ]
+
+    return {
+        "register": register,
+        "create": create,
+        "list": lambda: listing(False),
+        "list_detail": lambda: listing(True),
+        "confirm": confirm,
+        "confirm_batch": confirm_batch,
+    }
+
+
+def load_pending_group_ids(database_url: str, storage_mode: str) -> List[int]:
+    table = "reservation_ranges" if storage_mode == "range" else "reservations"
+    engine = create_engine(database_url)
+    with engine.connect() as conn:
+        rows = conn.execute(
+            text("SELECT DISTINCT reservation_group_id FROM " + table + " WHERE NOT is_confirmed ORDER BY 1")
+        )
+        group_ids = [row[0] for row in rows]
+    engine.dispose()
+    return group_ids
+
+
+def git_commit() -> str:
+    try:
+        return subprocess.check_output(["git", "rev-parse", "--short", "HEAD"], stderr=subprocess.DEVNULL).decode().strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+async def run(args, seeded: dict, pending_group_ids: List[int]) -> dict:
+    import httpx
+
+    from app.database.pool import pool_stats
+    from app.main import app
+
+    scenarios = build_scenarios(args, seeded, pending_group_ids)
+    results = {}
+
+    # 앱의 startup/shutdown 이벤트를 포함해 실행
+    async with app.router.lifespan_context(app):
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=None) as client:
+            for name in args.scenarios:
+                requests = scenarios[name]()
+                if not requests:
+                    continue
+                pool_stats.reset()
+                result = await run_scenario(client, requests, args.concurrency)
+                result["db_pool"] = pool_stats.stats()
+                results[name] = result
+                print(
+                    "{:<14} {:>6} req {:>8.1f} req/s  p50 {:>8.2f} ms  p95 {:>8.2f} ms  p99 {:>8.2f} ms  "
+                    "max {:>8.2f} ms  errors {}".format(
+                        name,
+                        result["requests"],
+                        result["throughput_rps"],
+                        result["p50_ms"],
+                        result["p95_ms"],
+                        result["p99_ms"],
+                        result["max_ms"],
+                        result["errors"],
+                    )
+                )
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="예약 API 부하 테스트")
+    parser.add_argument("--database-url", required=True, help="벤치마크 전용 DB URL (테이블이 초기화됨)")
+    parser.add_argument("--users", type=int, default=1_000, help="적재할 사용자 수")
+    parser.add_argument("--groups", type=int, default=20_000, help="적재할 예약 그룹 수")
+    parser.add_argument("--days", type=int, default=3, help="예약 그룹의 평균 일수 (생성 요청은 1 ~ days일)")
+    parser.add_argument("--confirmed-every", type=int, default=3, help="N개 그룹마다 1개를 확정 상태로 적재")
+    parser.add_argument("--scenarios", nargs="+", choices=SCENARIOS, default=SCENARIOS, help="실행할 시나리오")
+    parser.add_argument("--concurrency", type=int, default=20, help="동시 요청 수")
+    parser.add_argument("--register", type=int, default=200, help="회원가입 요청 수")
+    parser.add_argument("--create", type=int, default=1_000, help="예약 생성 요청 수")
+    parser.add_argument("--list", type=int, default=200, help="관리자 목록 조회 요청 수 (list / list_detail 각각)")
+    parser.add_argument("--page-size", type=int, default=500, help="관리자 목록 조회 페이지 크기")
+    parser.add_argument("--confirm", type=int, default=500, help="단건 확정 요청 수")
+    parser.add_argument("--confirm-batch", type=int, default=20, help="일괄 확정 요청 수")
+    parser.add_argument("--batch-size", type=int, default=100, help="일괄 확정 요청당 그룹 수")
+    parser.add_argument("--random-seed", type=int, default=42, help="요청 생성용 난수 시드")
+    parser.add_argument("--skip-seed", action="store_true", help="데이터 적재 없이 기존 데이터로 실행")
+    parser.add_argument("--output", help="결과를 저장할 JSON 파일 경로")
+    args = parser.parse_args()
+
+    # 앱 설정은 임포트 시점에 읽으므로 앱 모듈을 임포트하기 전에 환경 변수 지정
+    os.environ["DATABASE_URL"] = args.database_url
+    os.environ.setdefault("SECRET_KEY", "benchmark-secret")
+    os.environ.setdefault("ALGORITHM", "HS256")
+    os.environ.setdefault("ACCESS_TOKEN_EXPIRE_MINUTES", "60")
+    storage_mode = os.environ.get("RESERVATION_STORAGE_MODE", "daily")
+    run_started_at = datetime.utcnow().isoformat() + "Z"
+
+    from exec.benchmark.seed import reset_schema, seed
+
+    engine = create_engine(args.database_url)
+    if args.skip_seed:
+        with engine.connect() as conn:
+            seeded = {
+                "users": conn.execute(text("SELECT count(*) FROM users WHERE role = 'user'")).scalar(),
+                "admin_id": conn.execute(text("SELECT min(id) FROM users WHERE role = 'admin'")).scalar(),
+                "groups": args.groups,
+                "storage_mode": storage_mode,
+            }
+    else:
+        started_at = time.perf_counter()
+        with engine.begin() as conn:
+            reset_schema(conn)
+            seeded = seed(conn, args.users, args.groups, args.days, args.confirmed_every, storage_mode)
+        print("seeded {} in {:.1f}s".format(seeded, time.perf_counter() - started_at))
+    engine.dispose()
+
+    pending_group_ids = load_pending_group_ids(args.database_url, storage_mode)
+    results = asyncio.run(run(args, seeded, pending_group_ids))
+
+    if args.output:
+        report = {
+            "commit": git_commit(),
+            "started_at": run_started_at,
+            "options": {name: value for name, value in vars(args).items() if name not in ("database_url", "output")},
+            "seed": seeded,
+            "results": results,
+        }
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2, default=str)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,152 @@
+# exec/benchmark/seed.py
+"""
+벤치마크용 합성 데이터 적재
+
+    python -m exec.benchmark.seed --database-url postgresql://postgres@localhost/bench --users 10000 --groups 100000
+
+- 지정한 DB의 모든 테이블을 삭제 후 다시 생성하므로 반드시 벤치마크 전용 DB를 사용
+- 사용자(user{n}@bench.local / 관리자 admin@bench.local, 비밀번호 PASSWORD),
+  예약 그룹(오늘 + 10일 이후, 평균 --days 일), 확정 그룹의 시험 일정과 시간별 용량 장부를 함께 적재
+- --storage-mode에 따라 reservations(daily) 또는 reservation_ranges(range)에 적재
+"""
+import argparse
+from datetime import date, timedelta
+
+from passlib.context import CryptContext
+from sqlalchemy import create_engine, text
+from sqlalchemy.engine import Connection
+
+from app.database.base import Base
+from app.models import exam_schedule, hourly_capacity, reservation, reservation_range, user  # noqa: F401  (메타데이터 등록)
+
+PASSWORD = "benchmark"
+ADMIN_EMAIL = "admin@bench.local"
+
+
+def reset_schema(conn: Connection) -> None:
+    Base.metadata.drop_all(conn)
+    Base.metadata.create_all(conn)
+
+
+def seed(
+    conn: Connection,
+    users: int,
+    groups: int,
+    days: int = 3,
+    confirmed_every: int = 3,
+    storage_mode: str = "daily",
+    start: date = None,
+) -> dict:
+    """
+    합성 데이터를 적재하고 적재 결과(행 수, 관리자 ID 등)를 반환
+    - 그룹 g: 사용자 1 + g % users, 시작일 start + g % 180, 1 ~ (2 * days - 1)일, 9~16시 시작 / 12~19시 종료
+    - g % confirmed_every == 0 인 그룹은 확정 상태로 적재 (시험 일정/용량 장부 포함)
+    """
+    start = start or date.today() + timedelta(days=10)
+    hashed_password = CryptContext(schemes=["bcrypt"]).hash(PASSWORD)
+
+    conn.execute(
+        text(
+            "INSERT INTO users (id, username, email, hashed_password, role) "
+            "SELECT g, 'user' || g, 'user' || g || '@bench.local', :hashed, 'user' FROM generate_series(1, :users) g"
+        ),
+        {"users": users, "hashed": hashed_password},
+    )
+    admin_id = users + 1
+    conn.execute(
+        text("INSERT INTO users (id, username, email, hashed_password, role) VALUES (:id, 'admin', :email, :hashed, 'admin')"),
+        {"id": admin_id, "email": ADMIN_EMAIL, "hashed": hashed_password},
+    )
+    conn.execute(text("SELECT setval(pg_get_serial_sequence('users', 'id'), :id)"), {"id": admin_id})
+
+    # 그룹 단위 구간 (연속 구간: 첫날 시작 시간 ~ 마지막 날 종료 시간)
+    conn.execute(
+        text(
+            "CREATE TEMP TABLE bench_groups ON COMMIT DROP AS "
+            "SELECT g AS reservation_group_id, 1 + g % :users AS user_id, "
+            ":start + (g % 180) AS start_date, :start + (g % 180) + g % (2 * :days - 1) AS end_date, "
+            "9 + g % 8 AS start_hour, 12 + g % 8 AS end_hour, 1 + g % 20 AS reserved_count, "
+            "g % :confirmed_every = 0 AS is_confirmed "
+            "FROM generate_series(1, :groups) g"
+        ),
+        {"users": users, "groups": groups, "days": days, "confirmed_every": confirmed_every, "start": start},
+    )
+    # 일자별로 펼친 예약 (첫날은 start_hour ~ 24시, 마지막 날은 0시 ~ end_hour)
+    conn.execute(
+        text(
+            "CREATE TEMP TABLE bench_days ON COMMIT DROP AS "
+            "SELECT b.reservation_group_id, b.user_id, d::date AS date, "
+            "CASE WHEN d::date = b.start_date THEN b.start_hour ELSE 0 END AS start_hour, "
+            "CASE WHEN d::date = b.end_date THEN b.end_hour ELSE 24 END AS end_hour, "
+            "b.reserved_count, b.is_confirmed "
+            "FROM bench_groups b, generate_series(b.start_date, b.end_date, INTERVAL '1 day') d"
+        )
+    )
+
+    conn.execute(
+        text(
+            "INSERT INTO exam_schedules (date, start_hour, end_hour, total_reserved_count) "
+            "SELECT date, start_hour, end_hour, sum(reserved_count) FROM bench_days "
+            "WHERE is_confirmed GROUP BY date, start_hour, end_hour"
+        )
+    )
+    conn.execute(
+        text(
+            "INSERT INTO hourly_capacities (date, hour, confirmed_count) "
+            "SELECT date, h, sum(reserved_count) FROM bench_days, generate_series(start_hour, end_hour - 1) h "
+            "WHERE is_confirmed GROUP BY date, h"
+        )
+    )
+
+    if storage_mode == "range":
+        conn.execute(
+            text(
+                "INSERT INTO reservation_ranges "
+                "(reservation_group_id, user_id, start_at, end_at, daily_window, reserved_count, is_confirmed) "
+                "SELECT reservation_group_id, user_id, start_date + start_hour * INTERVAL '1 hour', "
+                "end_date + end_hour * INTERVAL '1 hour', false, reserved_count, is_confirmed FROM bench_groups"
+            )
+        )
+    else:
+        conn.execute(
+            text(
+                "INSERT INTO reservations "
+                "(reservation_group_id, user_id, exam_schedule_id, date, start_hour, end_hour, reserved_count, is_confirmed) "
+                "SELECT d.reservation_group_id, d.user_id, e.id, d.date, d.start_hour, d.end_hour, d.reserved_count, d.is_confirmed "
+                "FROM bench_days d LEFT JOIN exam_schedules e "
+                "ON d.is_confirmed AND e.date = d.date AND e.start_hour = d.start_hour AND e.end_hour = d.end_hour"
+            )
+        )
+
+    conn.execute(text("SELECT setval('reservation_group_id_seq', :groups)"), {"groups": groups})
+    reservation_rows = conn.execute(text("SELECT count(*) FROM bench_days")).scalar()
+    conn.execute(text("ANALYZE"))
+
+    return {
+        "users": users,
+        "admin_id": admin_id,
+        "groups": groups,
+        "reservation_days": reservation_rows,
+        "storage_mode": storage_mode,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="벤치마크용 합성 데이터 적재")
+    parser.add_argument("--database-url", required=True, help="벤치마크 전용 DB URL (테이블이 초기화됨)")
+    parser.add_argument("--users", type=int, default=10_000, help="적재할 사용자 수")
+    parser.add_argument("--groups", type=int, default=100_000, help="적재할 예약 그룹 수")
+    parser.add_argument("--days", type=int, default=3, help="예약 그룹의 평균 일수")
+    parser.add_argument("--confirmed-every", type=int, default=3, help="N개 그룹마다 1개를 확정 상태로 적재")
+    parser.add_argument("--storage-mode", choices=["daily", "range"], default="daily", help="예약 저장 방식")
+    args = parser.parse_args()
+
+    engine = create_engine(args.database_url)
+    with engine.begin() as conn:
+        reset_schema(conn)
+        result = seed(conn, args.users, args.groups, args.days, args.confirmed_every, args.storage_mode)
+    print(result)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,169 @@
+# exec/benchmark/serialization.py
+"""
+예약 목록 응답 직렬화 비교 (Pydantic response_model 경로 vs orjson 직접 직렬화 경로)
+
+    python -m exec.benchmark.serialization --groups 500 --days 30 --repeat 20
+
+- DB 없이 메모리에서 만든 그룹 요약 행과 일자별 예약으로 관리자/사용자 목록 응답 본문을 생성
+- 기존 경로: 응답 모델 생성 → FastAPI serialize_response(검증 + 직렬화) → JSONResponse
+- 새 경로: reservation_json의 dict 생성 → ORJSONResponse
+- 두 경로의 JSON이 같은지 확인한 뒤 응답 한 건당 평균 시간을 비교
+"""
+import argparse
+import asyncio
+import json
+import os
+import time
+from datetime import date, datetime, timedelta
+
+# 앱 설정은 임포트 시점에 읽으므로 DB 없이 실행할 수 있도록 기본값 지정
+os.environ.setdefault("DATABASE_URL", "postgresql://localhost/unused")
+os.environ.setdefault("SECRET_KEY", "benchmark-secret")
+os.environ.setdefault("ALGORITHM", "HS256")
+os.environ.setdefault("ACCESS_TOKEN_EXPIRE_MINUTES", "60")
+
+from fastapi.responses import JSONResponse  # noqa: E402
+from fastapi.routing import serialize_response  # noqa: E402
+from fastapi.utils import create_response_field  # noqa: E402
+
+from app.schemas.reservation_schema import (  # noqa: E402
+    ReservationGroupOut,
+    ReservationGroupPage,
+    UserReservationGroupPage,
+)
+from app.services.reservation_groups import GroupSummary  # noqa: E402
+from app.services.reservation_json import admin_group_page_response, user_group_page_response  # noqa: E402
+from app.services.reservation_ranges import ReservationDay  # noqa: E402
+
+
+def build_rows(groups: int, days: int):
+    summaries = []
+    details = {}
+    created_at = datetime(2025, 1, 1, 9, 30, 15, 123456)
+    for g in range(1, groups + 1):
+        start_date = date(2025, 6, 1) + timedelta(days=g % 180)
+        days_of_group = [
+            ReservationDay(
+                id=g * 1000 + i,
+                reservation_group_id=g,
+                user_id=g % 100 + 1,
+                date=start_date + timedelta(days=i),
+                start_hour=9 if i == 0 else 0,
+                end_hour=18 if i == days - 1 else 24,
+                reserved_count=g % 50 + 1,
+                is_confirmed=g % 2 == 0,
+                created_at=created_at,
+                version=g % 3 + 1,
+            )
+            for i in range(days)
+        ]
+        details[g] = days_of_group
+        summaries.append(
+            GroupSummary(
+                reservation_group_id=g,
+                user_id=g % 100 + 1,
+                start_date=start_date,
+                end_date=days_of_group[-1].date,
+                start_hour=9,
+                end_hour=18,
+                reserved_count=g % 50 + 1,
+                is_confirmed=g % 2 == 0,
+                version=g % 3 + 1,
+            )
+        )
+    return summaries, details
+
+
+async def admin_pydantic(field, summaries, details) -> bytes:
+    # 변경 전 get_admin_reservations와 같은 경로
+    page = ReservationGroupPage(
+        items=[ReservationGroupOut(**row._asdict(), reservations=details.get(row.reservation_group_id, [])) for row in summaries],
+        next_cursor=None,
+    )
+    return JSONResponse(await serialize_response(field=field, response_content=page)).body
+
+
+async def user_pydantic(field, summaries, details) -> bytes:
+    # 변경 전 get_user_reservations와 같은 경로 (dict 생성 + strftime 후 response_model 검증)
+    items = []
+    for row in summaries:
+        group = {
+            "reservation_group_id": row.reservation_group_id,
+            "start_date": row.start_date,
+            "end_date": row.end_date,
+            "start_hour": row.start_hour,
+            "end_hour": row.end_hour,
+            "reserved_count": row.reserved_count,
+            "is_confirmed": row.is_confirmed,
+            "version": row.version,
+        }
+        group["reservations"] = [
+            {
+                "reservation_id": r.id,
+                "date": r.date.strftime("%Y-%m-%d"),
+                "start_hour": r.start_hour,
+                "end_hour": r.end_hour,
+                "reserved_count": r.reserved_count,
+                "is_confirmed": r.is_confirmed,
+            }
+            for r in details.get(row.reservation_group_id, [])
+        ]
+        items.append(group)
+    return JSONResponse(await serialize_response(field=field, response_content={"items": items, "next_cursor": None})).body
+
+
+async def measure(name: str, old, new, repeat: int) -> dict:
+    old_body, new_body = await old(), await new()
+    if json.loads(old_body) != json.loads(new_body):
+        raise SystemExit("{}: 두 경로의 응답이 다릅니다.".format(name))
+
+    results = {"bytes": len(new_body)}
+    for label, func in (("pydantic_ms", old), ("orjson_ms", new)):
+        started = time.perf_counter()
+        for _ in range(repeat):
+            await func()
+        results[label] = round((time.perf_counter() - started) / repeat * 1000, 3)
+    results["speedup"] = round(results["pydantic_ms"] / results["orjson_ms"], 1)
+    return results
+
+
+async def run(groups: int, days: int, repeat: int) -> dict:
+    summaries, details = build_rows(groups, days)
+    admin_field = create_response_field(name="Response_admin", type_=ReservationGroupPage)
+    user_field = create_response_field(name="Response_user", type_=UserReservationGroupPage)
+
+    async def admin_orjson():
+        return admin_group_page_response(summaries, details, None, True).body
+
+    async def user_orjson():
+        return user_group_page_response(summaries, details, None, True).body
+
+    return {
+        "admin": await measure("admin", lambda: admin_pydantic(admin_field, summaries, details), admin_orjson, repeat),
+        "user": await measure("user", lambda: user_pydantic(user_field, summaries, details), user_orjson, repeat),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="예약 목록 응답 직렬화 비교")
+    parser.add_argument("--groups", type=int, default=500, help="응답 한 건의 예약 그룹 수")
+    parser.add_argument("--days", type=int, default=30, help="그룹당 일자별 예약 수")
+    parser.add_argument("--repeat", type=int, default=20, help="경로별 반복 횟수")
+    parser.add_argument("--output", help="결과를 저장할 JSON 파일 경로")
+    args = parser.parse_args()
+
+    results = asyncio.run(run(args.groups, args.days, args.repeat))
+    for name, result in results.items():
+        print(
+            "{:<6} {:>10,} bytes  pydantic {:>9.3f} ms  orjson {:>9.3f} ms  x{}".format(
+                name, result["bytes"], result["pydantic_ms"], result["orjson_ms"], result["speedup"]
+            )
+        )
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump({"groups": args.groups, "days": args.days, "results": results}, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+# exec/benchmark/startup.py
+"""
+워커 기동 시간 측정 (첫 요청까지 걸린 시간)
+
+    alembic upgrade head
+    python -m exec.benchmark.startup --database-url postgresql://postgres@localhost/bench --runs 5
+
+- 매 회 새 파이썬 프로세스에서 app.main을 임포트하고 startup 이벤트 실행 후 첫 요청(GET /metrics)을 보냄
+  (uvicorn 워커 하나가 새로 뜨는 상황과 같음, 요청은 ASGI로 직접 호출)
+- 단계별 소요 시간: import(FastAPI/SQLAlchemy 등) / engine(DB 엔진 생성) / routers(라우터 모듈 임포트 및 등록) / startup(startup 이벤트)
+- process_ms: 인터프리터 시작부터 첫 응답까지 (부모 프로세스에서 측정)
+- 스키마는 마이그레이션으로 미리 만들어 두어야 함 (워커 기동 시 DDL을 실행하지 않음)
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+from exec.benchmark.load_test import git_commit
+
+CHILD = """
+import asyncio, json
+import httpx
+from app.core.startup import startup_timer
+from app.main import app
+
+async def main():
+    async with app.router.lifespan_context(app):
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+            response = await client.get("/metrics")
+            response.raise_for_status()
+    print(json.dumps(startup_timer.report()))
+
+asyncio.run(main())
+"""
+
+
+def run_once(env: dict) -> dict:
+    started_at = time.perf_counter()
+    output = subprocess.check_output([sys.executable, "-c", CHILD], env=env, stderr=subprocess.DEVNULL)
+    report = json.loads(output.decode().strip().splitlines()[-1])
+    report["process_ms"] = round((time.perf_counter() - started_at) * 1000, 2)
+    return report
+
+
+def main():
+    parser = argparse.ArgumentParser(description="워커 기동 시간 측정")
+    parser.add_argument("--database-url", required=True, help="마이그레이션이 적용된 DB URL")
+    parser.add_argument("--runs", type=int, default=5, help="측정 횟수 (회마다 새 프로세스)")
+    parser.add_argument("--output", help="결과를 저장할 JSON 파일 경로")
+    args = parser.parse_args()
+
+    env = dict(os.environ)
+    env["DATABASE_URL"] = args.database_url
+    env.setdefault("SECRET_KEY", "benchmark-secret")
+    env.setdefault("ALGORITHM", "HS256")
+    env.setdefault("ACCESS_TOKEN_EXPIRE_MINUTES", "60")
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [os.getcwd(), env.get("PYTHONPATH")]))
+
+    # 첫 실행은 .pyc 생성 비용이 섞이므로 버림
+    run_once(env)
+    runs = [run_once(env) for _ in range(args.runs)]
+
+    def median(values):
+        return round(statistics.median(values), 2)
+
+    summary = {name: median([run["phases_ms"][name] for run in runs]) for name in runs[0]["phases_ms"]}
+    summary["time_to_first_request_ms"] = median([run["time_to_first_request_ms"] for run in runs])
+    summary["process_ms"] = median([run["process_ms"] for run in runs])
+    for name, value in summary.items():
+        print("{:<26} {:>9.2f} ms".format(name, value))
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump({"commit": git_commit(), "median_ms": summary, "runs": runs}, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+# exec/benchmark/storage_size.py
+"""
+일자별 저장(reservations)과 구간 저장(reservation_ranges)의 테이블/인덱스 크기 비교
+
+    python -m exec.benchmark.storage_size --database-url postgresql://postgres@localhost/bench --groups 200000 --days 30
+
+- 지정한 DB의 users / exam_schedules / reservations / reservation_ranges 테이블을 삭제 후 다시 생성하므로 반드시 벤치마크 전용 DB를 사용
+- 같은 예약 그룹(평균 --days 일)을 두 방식으로 적재하고, 모델에 선언된 인덱스를 만든 뒤
+  테이블/인덱스 크기와 기간 조회(해당 기간에 걸친 그룹 조회) 실행 시간을 비교
+"""
+import argparse
+import json
+import time
+
+from sqlalchemy import create_engine, text
+
+from app.database.base import Base
+from app.models import exam_schedule, hourly_capacity, reservation, reservation_range, user  # noqa: F401  (메타데이터 등록)
+
+TABLES = ["users", "exam_schedules", "reservations", "reservation_ranges"]
+
+# 2025-06-01 하루에 걸친 예약 그룹 조회 (라우터의 날짜 필터와 같은 형태)
+QUERIES = {
+    "reservations": (
+        "SELECT count(DISTINCT reservation_group_id) FROM reservations "
+        "WHERE date >= DATE '2025-06-01' AND date <= DATE '2025-06-01'"
+    ),
+    "reservation_ranges": (
+        "SELECT count(*) FROM reservation_ranges "
+        "WHERE tsrange(start_at, end_at) && tsrange(TIMESTAMP '2025-06-01', TIMESTAMP '2025-06-02')"
+    ),
+}
+
+
+def reset_schema(conn):
+    conn.execute(text("DROP TABLE IF EXISTS " + ", ".join(reversed(TABLES)) + " CASCADE"))
+    for name in TABLES:
+        Base.metadata.tables[name].create(conn)
+
+
+def load_data(conn, groups: int, days: int, users: int):
+    conn.execute(
+        text(
+            "INSERT INTO users (id, username, email, hashed_password, role) "
+            "SELECT g, 'user' || g, 'user' || g || '@bench.local', 'x', 'user' FROM generate_series(1, :users) g"
+        ),
+        {"users": users},
+    )
+    # 그룹 g: 1 ~ (2 * days - 1)일 (평균 days일), 9~18시 사이 시작, 연속 구간
+    conn.execute(
+        text(
+            "INSERT INTO reservation_ranges "
+            "(reservation_group_id, user_id, start_at, end_at, daily_window, reserved_count, is_confirmed) "
+            "SELECT g, 1 + g % :users, "
+            "TIMESTAMP '2025-01-01' + (g % 365) * INTERVAL '1 day' + (9 + g % 10) * INTERVAL '1 hour', "
+            "TIMESTAMP '2025-01-01' + (g % 365 + g % (2 * :days - 1)) * INTERVAL '1 day' + (19 + g % 5) * INTERVAL '1 hour', "
+            "false, 1 + g % 50, g % 10 = 0 "
+            "FROM generate_series(1, :groups) g"
+        ),
+        {"groups": groups, "days": days, "users": users},
+    )
+    # 같은 그룹을 일자별 행으로 펼쳐서 적재
+    conn.execute(
+        text(
+            "INSERT INTO reservations "
+            "(reservation_group_id, user_id, date, start_hour, end_hour, reserved_count, is_confirmed) "
+            "SELECT r.reservation_group_id, r.user_id, d::date, "
+            "CASE WHEN d::date = r.start_at::date THEN extract(hour FROM r.start_at)::int ELSE 0 END, "
+            "CASE WHEN d::date = r.end_at::date THEN extract(hour FROM r.end_at)::int ELSE 24 END, "
+            "r.reserved_count, r.is_confirmed "
+            "FROM reservation_ranges r, generate_series(r.start_at::date, r.end_at::date, INTERVAL '1 day') d"
+        )
+    )
+
+
+def measure(conn) -> dict:
+    conn.execute(text("ANALYZE"))
+    results = {}
+    for name, sql in QUERIES.items():
+        started = time.perf_counter()
+        matched = conn.execute(text(sql)).scalar()
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        results[name] = {
+            "rows": conn.execute(text("SELECT count(*) FROM " + name)).scalar(),
+            "table_bytes": conn.execute(text("SELECT pg_table_size(:t)"), {"t": name}).scalar(),
+            "index_bytes": conn.execute(text("SELECT pg_indexes_size(:t)"), {"t": name}).scalar(),
+            "range_query_groups": matched,
+            "range_query_ms": round(elapsed_ms, 3),
+        }
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="일자별/구간 저장 방식 크기 비교")
+    parser.add_argument("--database-url", required=True, help="벤치마크 전용 DB URL (테이블이 초기화됨)")
+    parser.add_argument("--groups", type=int, default=200_000, help="적재할 예약 그룹 수")
+    parser.add_argument("--days", type=int, default=30, help="예약 그룹의 평균 일수")
+    parser.add_argument("--users", type=int, default=100_000, help="적재할 users 행 수")
+    parser.add_argument("--output", help="결과를 저장할 JSON 파일 경로")
+    args = parser.parse_args()
+
+    engine = create_engine(args.database_url)
+    with engine.begin() as conn:
+        reset_schema(conn)
+        load_data(conn, args.groups, args.days, args.users)
+    with engine.begin() as conn:
+        results = measure(conn)
+
+    report = {"groups": args.groups, "days": args.days, "results": results}
+    for name, result in results.items():
+        print(name)
+        print("  rows        : {:>12,}".format(result["rows"]))
+        print("  table       : {:>12.1f} MB".format(result["table_bytes"] / 1024 / 1024))
+        print("  indexes     : {:>12.1f} MB".format(result["index_bytes"] / 1024 / 1024))
+        print("  range query : {:>12.3f} ms ({} groups)".format(result["range_query_ms"], result["range_query_groups"]))
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
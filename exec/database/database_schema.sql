@@ -1,3 +1,6 @@
+-- 참고용 스키마 (실제 테이블 생성/변경은 migrations/ 의 alembic 마이그레이션으로 수행: alembic upgrade head)
+-- 아래 '기존 DB' 주석의 변경(컬럼 추가/인덱스 교체/중복 시간대 병합/장부 초기화)은 해당 마이그레이션에 포함
+
 -- reservations
 -- auto-generated definition
 create table reservations
@@ -17,18 +20,67 @@ create table reservations
     reserved_count       integer not null,
     is_confirmed         boolean,
     created_at           timestamp default now(),
-    updated_at           timestamp default now()
+    updated_at           timestamp default now(),
+    version              integer   default 1 not null
 );
 
+-- 기존 DB: 예약 그룹 버전 컬럼 추가 (낙관적 동시성 제어)
+-- alter table reservations add column version integer default 1 not null;
+
 -- alter table reservations
 --     owner to postgres;
 
-create index ix_reservations_reservation_group_id
-    on reservations using btree (reservation_group_id);
+-- (reservation_group_id, date) 복합 인덱스로 대체
+-- drop index ix_reservations_reservation_group_id;
+create index ix_reservations_group_id_date
+    on reservations using btree (reservation_group_id, date);
+
+create index ix_reservations_user_id_date
+    on reservations using btree (user_id, date);
+
+-- 시험 일정 삭제 시 FK CASCADE 대상 조회
+create index ix_reservations_exam_schedule_id
+    on reservations using btree (exam_schedule_id);
 
 create index ix_reservations_id
     on reservations using btree (id);
 
+-- 예약 그룹 ID 발급용 시퀀스 (기존 데이터의 최대값 이후부터 발급)
+create sequence reservation_group_id_seq;
+
+select setval('reservation_group_id_seq', (select coalesce(max(reservation_group_id), 0) + 1 from reservations), false);
+
+
+-- reservation_range.py
+-- 구간 저장 방식(RESERVATION_STORAGE_MODE=range)의 예약 그룹: 그룹당 한 행
+create table reservation_ranges
+(
+    reservation_group_id bigint    not null
+        primary key,
+    user_id              bigint    not null
+        references users
+            on delete cascade,
+    start_at             timestamp not null,
+    end_at               timestamp not null,
+    daily_window         boolean   not null,
+    reserved_count       integer   not null,
+    is_confirmed         boolean   not null,
+    created_at           timestamp default now(),
+    updated_at           timestamp default now(),
+    version              integer   default 1 not null
+);
+
+-- 기존 DB: 예약 그룹 버전 컬럼 추가
+-- alter table reservation_ranges add column version integer default 1 not null;
+
+create index ix_reservation_ranges_period
+    on reservation_ranges using gist (tsrange(start_at, end_at));
+
+create index ix_reservation_ranges_user_id
+    on reservation_ranges using btree (user_id, reservation_group_id);
+
+-- 구간 저장 방식으로 시작하는 경우 시퀀스를 구간 테이블의 최대값 이후로 맞춤
+-- select setval('reservation_group_id_seq', (select coalesce(max(reservation_group_id), 0) + 1 from reservation_ranges), false);
 
 -- exam_schedule.py
 -- auto-generated definition
@@ -48,6 +100,24 @@ create table exam_schedules
 create index ix_exam_schedules_id
     on exam_schedules using btree (id);
 
+-- 시간대당 일정은 하나 (기존 DB는 마이그레이션 0006에서 중복 시간대를 먼저 합친 뒤 적용)
+-- drop index if exists ix_exam_schedules_slot;
+alter table exam_schedules
+    add constraint uq_exam_schedules_slot unique (date, start_hour, end_hour);
+
+-- hourly_capacity.py
+-- (날짜, 시간)별 확정 인원 장부
+create table hourly_capacities
+(
+    date            date    not null,
+    hour            integer not null,
+    confirmed_count integer not null,
+    primary key (date, hour)
+);
+
+-- 기존 DB는 마이그레이션 0003에서 확정 예약으로 장부 초기화 (일자별/구간 저장 모두 반영)
+-- 장부 복구: python -m exec.database.rebuild_capacity_ledger
+
 -- user
 -- auto-generated definition
 create table users
@@ -0,0 +1,41 @@
+# exec/database/rebuild_capacity_ledger.py
+"""
+확정된 예약으로 시간별 확정 인원 장부(hourly_capacities) 다시 계산
+
+    python -m exec.database.rebuild_capacity_ledger --database-url postgresql://postgres@localhost/app
+
+- 장부가 확정 인원과 어긋났을 때 복구용 (장부가 없던 기존 DB는 마이그레이션 0003에서 같은 방식으로 초기화)
+- 일자별 저장(reservations)과 구간 저장(reservation_ranges)의 확정 예약을 모두 반영
+- 실행 중에는 확정/수정/가져오기가 장부 잠금을 기다리므로 요청이 적은 시간에 실행
+"""
+import argparse
+import asyncio
+import os
+
+
+async def rebuild() -> dict:
+    from app.database.session import SessionLocal, engine
+    from app.services.capacity import rebuild_confirmed_counts
+
+    async with SessionLocal() as db:
+        result = await rebuild_confirmed_counts(db)
+        await db.commit()
+    await engine.dispose()
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="확정 예약으로 시간별 확정 인원 장부 다시 계산")
+    parser.add_argument("--database-url", help="대상 DB URL (생략하면 DATABASE_URL 환경 변수)")
+    args = parser.parse_args()
+
+    # 앱 설정은 임포트 시점에 읽으므로 앱 모듈을 임포트하기 전에 환경 변수 지정
+    if args.database_url:
+        os.environ["DATABASE_URL"] = args.database_url
+
+    result = asyncio.run(rebuild())
+    print("hourly_capacities: {:,} hours ({:,} hours changed)".format(result["hours"], result["changed_hours"]))
+
+
+if __name__ == "__main__":
+    main()
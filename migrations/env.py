@@ -0,0 +1,54 @@
+# migrations/env.py
+from logging.config import fileConfig
+
+from alembic import context
+from sqlalchemy import create_engine
+from sqlalchemy.engine import make_url
+
+from app.core.config import settings
+from app.database.base import Base
+# autogenerate 비교 대상 테이블 등록
+from app.models import user, reservation, reservation_range, exam_schedule, hourly_capacity  # noqa: F401
+
+config = context.config
+if config.config_file_name is not None:
+    fileConfig(config.config_file_name)
+
+target_metadata = Base.metadata
+
+
+def to_sync_url(url: str):
+    # 마이그레이션은 동기 드라이버(psycopg2)로 실행
+    parsed = make_url(url)
+    if parsed.drivername == "postgresql+asyncpg":
+        parsed = parsed.set(drivername="postgresql+psycopg2")
+    return parsed
+
+
+def run_migrations_offline() -> None:
+    """
+    DB에 접속하지 않고 SQL만 출력 (alembic upgrade head --sql)
+    """
+    context.configure(
+        url=to_sync_url(settings.DATABASE_URL),
+        target_metadata=target_metadata,
+        literal_binds=True,
+        dialect_opts={"paramstyle": "named"},
+    )
+    with context.begin_transaction():
+        context.run_migrations()
+
+
+def run_migrations_online() -> None:
+    engine = create_engine(to_sync_url(settings.DATABASE_URL))
+    with engine.connect() as connection:
+        context.configure(connection=connection, target_metadata=target_metadata)
+        with context.begin_transaction():
+            context.run_migrations()
+    engine.dispose()
+
+
+if context.is_offline_mode():
+    run_migrations_offline()
+else:
+    run_migrations_online()
@@ -0,0 +1,71 @@
+"""initial schema
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-18 00:00:00
+
+- 마이그레이션 도입 전 애플리케이션 기동 시 create_all로 만들던 최초 스키마 (users / exam_schedules / reservations)
+- 이후 추가된 테이블/인덱스/제약 조건은 0002부터 순서대로 적용
+- create_all로 이미 만든 DB는 만든 시점과 관계없이 alembic stamp 0001 후 alembic upgrade head 실행
+  (0002 이후 리비전은 이미 있는 테이블/인덱스/제약 조건을 건너뛰도록 작성)
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0001"
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "users",
+        sa.Column("id", sa.BigInteger(), nullable=False),
+        sa.Column("username", sa.String(), nullable=True),
+        sa.Column("email", sa.String(), nullable=True),
+        sa.Column("hashed_password", sa.String(), nullable=True),
+        sa.Column("role", sa.String(), nullable=True),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index("ix_users_id", "users", ["id"])
+    op.create_index("ix_users_username", "users", ["username"])
+    op.create_index("ix_users_email", "users", ["email"], unique=True)
+
+    op.create_table(
+        "exam_schedules",
+        sa.Column("id", sa.BigInteger(), autoincrement=True, nullable=False),
+        sa.Column("date", sa.Date(), nullable=False),
+        sa.Column("start_hour", sa.Integer(), nullable=False),
+        sa.Column("end_hour", sa.Integer(), nullable=False),
+        sa.Column("total_reserved_count", sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index("ix_exam_schedules_id", "exam_schedules", ["id"])
+
+    op.create_table(
+        "reservations",
+        sa.Column("id", sa.BigInteger(), autoincrement=True, nullable=False),
+        sa.Column("reservation_group_id", sa.BigInteger(), nullable=False),
+        sa.Column("user_id", sa.BigInteger(), nullable=False),
+        sa.Column("exam_schedule_id", sa.BigInteger(), nullable=True),
+        sa.Column("date", sa.Date(), nullable=False),
+        sa.Column("start_hour", sa.Integer(), nullable=False),
+        sa.Column("end_hour", sa.Integer(), nullable=False),
+        sa.Column("reserved_count", sa.Integer(), nullable=False),
+        sa.Column("is_confirmed", sa.Boolean(), nullable=True),
+        sa.Column("created_at", sa.DateTime(), server_default=sa.text("now()"), nullable=True),
+        sa.Column("updated_at", sa.DateTime(), server_default=sa.text("now()"), nullable=True),
+        sa.ForeignKeyConstraint(["exam_schedule_id"], ["exam_schedules.id"], ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index("ix_reservations_id", "reservations", ["id"])
+    op.create_index("ix_reservations_reservation_group_id", "reservations", ["reservation_group_id"])
+
+
+def downgrade() -> None:
+    op.drop_table("reservations")
+    op.drop_table("exam_schedules")
+    op.drop_table("users")
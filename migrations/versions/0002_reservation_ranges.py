@@ -0,0 +1,46 @@
+"""reservation ranges
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-18 00:00:00
+
+- 구간 저장 방식(RESERVATION_STORAGE_MODE=range)의 예약 그룹 테이블
+- create_all로 이미 만든 DB는 테이블/인덱스가 있으면 건너뜀
+"""
+from alembic import op
+
+
+revision = "0002"
+down_revision = "0001"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute(
+        "CREATE TABLE IF NOT EXISTS reservation_ranges ("
+        "reservation_group_id BIGINT NOT NULL, "
+        "user_id BIGINT NOT NULL, "
+        "start_at TIMESTAMP WITHOUT TIME ZONE NOT NULL, "
+        "end_at TIMESTAMP WITHOUT TIME ZONE NOT NULL, "
+        "daily_window BOOLEAN NOT NULL, "
+        "reserved_count INTEGER NOT NULL, "
+        "is_confirmed BOOLEAN NOT NULL, "
+        "created_at TIMESTAMP WITHOUT TIME ZONE DEFAULT now(), "
+        "updated_at TIMESTAMP WITHOUT TIME ZONE DEFAULT now(), "
+        "PRIMARY KEY (reservation_group_id), "
+        "FOREIGN KEY (user_id) REFERENCES users (id) ON DELETE CASCADE"
+        ")"
+    )
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_reservation_ranges_period "
+        "ON reservation_ranges USING gist (tsrange(start_at, end_at))"
+    )
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_reservation_ranges_user_id "
+        "ON reservation_ranges (user_id, reservation_group_id)"
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("reservation_ranges")
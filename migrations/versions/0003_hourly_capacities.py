@@ -0,0 +1,54 @@
+"""hourly capacities
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-18 00:00:00
+
+- (날짜, 시간)별 확정 인원 장부
+- 기존 확정 예약(일자별 저장 + 구간 저장)으로 장부를 다시 계산
+  (장부가 없던 DB는 확정 예약이 장부에 없으면 인원 초과 검증이 통과되므로, 이미 장부가 있던 DB도 같은 값으로 맞춤)
+- 배포 후 장부 복구가 필요하면 python -m exec.database.rebuild_capacity_ledger (같은 계산)
+"""
+from alembic import op
+
+
+revision = "0003"
+down_revision = "0002"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute(
+        "CREATE TABLE IF NOT EXISTS hourly_capacities ("
+        "date DATE NOT NULL, "
+        "hour INTEGER NOT NULL, "
+        "confirmed_count INTEGER NOT NULL, "
+        "PRIMARY KEY (date, hour)"
+        ")"
+    )
+    op.execute("LOCK TABLE hourly_capacities IN EXCLUSIVE MODE")
+    op.execute("DELETE FROM hourly_capacities")
+    # 구간은 days_from_range와 같은 방식으로 일자별 시간대로 펼침
+    op.execute(
+        "INSERT INTO hourly_capacities (date, hour, confirmed_count) "
+        "SELECT date, hour, sum(reserved_count) "
+        "FROM ("
+        "  SELECT date, start_hour, end_hour, reserved_count FROM reservations WHERE is_confirmed "
+        "  UNION ALL "
+        "  SELECT d::date, "
+        "  CASE WHEN r.daily_window OR d::date = r.start_at::date THEN extract(hour FROM r.start_at)::int ELSE 0 END, "
+        "  CASE WHEN r.daily_window OR d::date = (r.end_at - INTERVAL '1 microsecond')::date "
+        "  THEN COALESCE(NULLIF(extract(hour FROM r.end_at)::int, 0), 24) ELSE 24 END, "
+        "  r.reserved_count "
+        "  FROM reservation_ranges r, "
+        "  generate_series(r.start_at::date, (r.end_at - INTERVAL '1 microsecond')::date, INTERVAL '1 day') d "
+        "  WHERE r.is_confirmed"
+        ") days(date, start_hour, end_hour, reserved_count), "
+        "generate_series(start_hour, end_hour - 1) AS g(hour) "
+        "GROUP BY date, hour"
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("hourly_capacities")
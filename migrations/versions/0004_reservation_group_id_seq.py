@@ -0,0 +1,34 @@
+"""reservation group id sequence
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-18 00:00:00
+
+- 예약 그룹 ID 발급용 시퀀스
+- 기존 데이터(일자별/구간 저장)의 최대 reservation_group_id 이후부터 발급되도록 값을 맞춤
+  (이미 그보다 앞서 있는 시퀀스는 그대로 둠)
+"""
+from alembic import op
+
+
+revision = "0004"
+down_revision = "0003"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute("CREATE SEQUENCE IF NOT EXISTS reservation_group_id_seq")
+    op.execute(
+        "SELECT setval('reservation_group_id_seq', "
+        "GREATEST(max_group_id, (SELECT last_value FROM reservation_group_id_seq))) "
+        "FROM (SELECT GREATEST("
+        "(SELECT max(reservation_group_id) FROM reservations), "
+        "(SELECT max(reservation_group_id) FROM reservation_ranges)"
+        ") AS max_group_id) m "
+        "WHERE max_group_id IS NOT NULL"
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP SEQUENCE reservation_group_id_seq")
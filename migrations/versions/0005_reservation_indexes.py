@@ -0,0 +1,33 @@
+"""reservation indexes
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-18 00:00:00
+
+- 그룹 조회(reservation_group_id, date) / 사용자 조회(user_id, date) 복합 인덱스
+- 복합 인덱스의 앞쪽 컬럼과 겹치는 reservation_group_id 단일 인덱스 삭제
+"""
+from alembic import op
+
+
+revision = "0005"
+down_revision = "0004"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS ix_reservations_reservation_group_id")
+    op.execute("CREATE INDEX IF NOT EXISTS ix_reservations_group_id_date ON reservations (reservation_group_id, date)")
+    op.execute("CREATE INDEX IF NOT EXISTS ix_reservations_user_id_date ON reservations (user_id, date)")
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_reservations_confirmed_slot "
+        "ON reservations (date, start_hour, end_hour) WHERE is_confirmed"
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_reservations_confirmed_slot", table_name="reservations")
+    op.drop_index("ix_reservations_user_id_date", table_name="reservations")
+    op.drop_index("ix_reservations_group_id_date", table_name="reservations")
+    op.create_index("ix_reservations_reservation_group_id", "reservations", ["reservation_group_id"])
@@ -0,0 +1,56 @@
+"""exam schedule slot unique
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2026-10-18 00:00:00
+
+- 시간대(date, start_hour, end_hour)당 시험 일정은 하나 (확정 시 UPSERT 대상)
+- 제약 조건을 걸기 전에 중복 시간대를 가장 작은 id의 일정으로 합침
+  (인원 합산 → 예약이 합쳐질 일정을 가리키도록 변경 → 나머지 삭제, 삭제 시 예약이 같이 지워지지 않도록 순서 유지)
+- 이전에 만들던 시간대 일반 인덱스(ix_exam_schedules_slot)는 제약 조건 인덱스와 겹치므로 삭제
+"""
+from alembic import op
+
+
+revision = "0006"
+down_revision = "0005"
+branch_labels = None
+depends_on = None
+
+# 시간대별로 남길 일정 id와 합산 인원
+DUPLICATES = (
+    "SELECT id, min(id) OVER w AS keep_id, sum(total_reserved_count) OVER w AS total "
+    "FROM exam_schedules WINDOW w AS (PARTITION BY date, start_hour, end_hour)"
+)
+
+
+def upgrade() -> None:
+    op.execute("LOCK TABLE exam_schedules IN EXCLUSIVE MODE")
+    op.execute(
+        "UPDATE exam_schedules e SET total_reserved_count = d.total "
+        "FROM (" + DUPLICATES + ") d "
+        "WHERE e.id = d.id AND d.id = d.keep_id AND e.total_reserved_count <> d.total"
+    )
+    op.execute(
+        "UPDATE reservations r SET exam_schedule_id = d.keep_id "
+        "FROM (" + DUPLICATES + ") d "
+        "WHERE r.exam_schedule_id = d.id AND d.id <> d.keep_id"
+    )
+    op.execute(
+        "DELETE FROM exam_schedules e "
+        "USING (" + DUPLICATES + ") d "
+        "WHERE e.id = d.id AND d.id <> d.keep_id"
+    )
+
+    op.execute("DROP INDEX IF EXISTS ix_exam_schedules_slot")
+    op.execute(
+        "DO $$ BEGIN "
+        "IF NOT EXISTS (SELECT 1 FROM pg_constraint WHERE conname = 'uq_exam_schedules_slot') THEN "
+        "ALTER TABLE exam_schedules ADD CONSTRAINT uq_exam_schedules_slot UNIQUE (date, start_hour, end_hour); "
+        "END IF; "
+        "END $$"
+    )
+
+
+def downgrade() -> None:
+    op.drop_constraint("uq_exam_schedules_slot", "exam_schedules", type_="unique")
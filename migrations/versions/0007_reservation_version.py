@@ -0,0 +1,26 @@
+"""reservation group version
+
+Revision ID: 0007
+Revises: 0006
+Create Date: 2026-10-18 00:00:00
+
+- 예약 그룹 낙관적 동시성 제어용 version 컬럼 (create_all로 이미 만든 DB는 컬럼이 있으면 건너뜀)
+- 상수 기본값이 있는 컬럼 추가이므로 테이블을 다시 쓰지 않음 (PostgreSQL 11 이상)
+"""
+from alembic import op
+
+
+revision = "0007"
+down_revision = "0006"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute("ALTER TABLE reservations ADD COLUMN IF NOT EXISTS version INTEGER DEFAULT 1 NOT NULL")
+    op.execute("ALTER TABLE reservation_ranges ADD COLUMN IF NOT EXISTS version INTEGER DEFAULT 1 NOT NULL")
+
+
+def downgrade() -> None:
+    op.drop_column("reservation_ranges", "version")
+    op.drop_column("reservations", "version")
@@ -0,0 +1,25 @@
+"""reservation null is_confirmed
+
+Revision ID: 0008
+Revises: 0007
+Create Date: 2026-10-18 00:00:00
+
+- 관리자 예약 수정에서 is_confirmed를 생략하면 일자별 예약에 NULL이 저장되던 문제로 생긴 행 정리
+- NULL 행은 확정 처리(is_confirmed = false 조건)로 조회되지 않으므로 미확정으로 되돌림
+  (확정 시에만 반영되는 시험 일정/용량 장부에는 들어가지 않았던 행)
+"""
+from alembic import op
+
+
+revision = "0008"
+down_revision = "0007"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute("UPDATE reservations SET is_confirmed = false WHERE is_confirmed IS NULL")
+
+
+def downgrade() -> None:
+    pass
@@ -0,0 +1,29 @@
+"""reservation exam schedule index
+
+Revision ID: 0009
+Revises: 0008
+Create Date: 2026-10-18 00:00:00
+
+- 시간대별 확정 인원은 장부(hourly_capacities)에서 조회하므로 쓰이지 않는 확정 시간대 부분 인덱스 삭제
+- 시험 일정 삭제 시 FK CASCADE(ON DELETE CASCADE)가 reservations.exam_schedule_id로 예약을 찾으므로 인덱스 추가
+"""
+from alembic import op
+
+
+revision = "0009"
+down_revision = "0008"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS ix_reservations_confirmed_slot")
+    op.execute("CREATE INDEX IF NOT EXISTS ix_reservations_exam_schedule_id ON reservations (exam_schedule_id)")
+
+
+def downgrade() -> None:
+    op.drop_index("ix_reservations_exam_schedule_id", table_name="reservations")
+    op.execute(
+        "CREATE INDEX ix_reservations_confirmed_slot "
+        "ON reservations (date, start_hour, end_hour) WHERE is_confirmed"
+    )